@@ -3,17 +3,22 @@
 
 Usage:
     python scripts/fetch_abis.py
+
+Requests are paced by the fetchers' per-explorer rate limiter. For larger
+lists, use the CLI instead:
+
+    abi-to-mcp fetch-batch addresses.csv -o ./abis
 """
 
 import asyncio
 import json
 from pathlib import Path
 
-# Try to import httpx, provide helpful error if not installed
+# Try to import abi_to_mcp, provide helpful error if not installed
 try:
-    import httpx
+    from abi_to_mcp.fetchers import create_default_registry
 except ImportError:
-    print("httpx required: pip install httpx")
+    print("abi-to-mcp required: pip install -e .")
     exit(1)
 
 
@@ -28,49 +33,29 @@ CONTRACTS = {
     },
 }
 
-ETHERSCAN_API = "https://api.etherscan.io/api"
 OUTPUT_DIR = Path(__file__).parent.parent / "tests" / "fixtures" / "abis"
 
 
-async def fetch_abi(name: str, address: str, network: str) -> dict | None:
-    """Fetch ABI from Etherscan."""
-    print(f"Fetching {name} ({address})...")
-    
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            ETHERSCAN_API,
-            params={
-                "module": "contract",
-                "action": "getabi",
-                "address": address,
-            },
-        )
-        
-        data = response.json()
-        
-        if data["status"] == "1":
-            return json.loads(data["result"])
-        else:
-            print(f"  Error: {data.get('message', 'Unknown error')}")
-            return None
-
-
 async def main():
     """Fetch all ABIs."""
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    
-    for name, info in CONTRACTS.items():
-        abi = await fetch_abi(name, info["address"], info["network"])
-        
-        if abi:
-            output_path = OUTPUT_DIR / f"{name}.json"
-            with open(output_path, "w") as f:
-                json.dump(abi, f, indent=2)
-            print(f"  ✓ Saved to {output_path}")
-        
-        # Rate limiting
-        await asyncio.sleep(0.5)
-    
+
+    names = {info["address"].lower(): name for name, info in CONTRACTS.items()}
+    targets = [(info["network"], info["address"]) for info in CONTRACTS.values()]
+
+    async with create_default_registry() as registry:
+        async for item in registry.fetch_many(targets, detect_proxy=False):
+            name = names[item.address.lower()]
+            print(f"Fetched {name} ({item.address})")
+
+            if item.ok:
+                output_path = OUTPUT_DIR / f"{name}.json"
+                with open(output_path, "w") as f:
+                    json.dump(item.result.abi, f, indent=2)
+                print(f"  ✓ Saved to {output_path}")
+            else:
+                print(f"  Error: {item.error}")
+
     print("")
     print("Done!")
 
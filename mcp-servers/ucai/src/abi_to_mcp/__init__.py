@@ -32,6 +32,7 @@ from abi_to_mcp.core.models import (
     ParsedABI,
     MappedTool,
     MappedResource,
+    ProtocolContract,
     GeneratedFile,
     GeneratedServer,
     FetchResult,
@@ -68,6 +69,7 @@ __all__ = [
     "ParsedABI",
     "MappedTool",
     "MappedResource",
+    "ProtocolContract",
     "GeneratedFile",
     "GeneratedServer",
     "FetchResult",
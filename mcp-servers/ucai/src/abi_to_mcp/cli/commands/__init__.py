@@ -1,12 +1,16 @@
 """CLI commands for abi-to-mcp."""
 
 from abi_to_mcp.cli.commands.generate import generate
+from abi_to_mcp.cli.commands.generate_manifest import generate_manifest
+from abi_to_mcp.cli.commands.fetch_batch import fetch_batch
 from abi_to_mcp.cli.commands.inspect import inspect
 from abi_to_mcp.cli.commands.validate import validate
 from abi_to_mcp.cli.commands.serve import serve
 
 __all__ = [
     "generate",
+    "generate_manifest",
+    "fetch_batch",
     "inspect",
     "validate",
     "serve",
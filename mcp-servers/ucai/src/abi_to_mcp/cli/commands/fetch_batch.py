@@ -0,0 +1,174 @@
+"""Fetch-batch command implementation."""
+
+import asyncio
+import csv
+import json
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from rich.console import Console
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn
+from rich import print as rprint
+
+from abi_to_mcp.core.constants import NETWORKS
+from abi_to_mcp.core.exceptions import ABIToMCPError, InvalidInputError
+from abi_to_mcp.utils.validation import is_valid_address
+
+console = Console()
+
+
+def fetch_batch(
+    input_file: Path,
+    output: Path,
+    network: str,
+    concurrency: int,
+    rate: float,
+    detect_proxy: bool,
+    force: bool,
+    use_cache: bool = True,
+    refresh: bool = False,
+    hedge_delay: Optional[float] = None,
+) -> None:
+    """Fetch many ABIs and write them to disk."""
+    asyncio.run(
+        _fetch_batch_async(
+            input_file=input_file,
+            output=output,
+            network=network,
+            concurrency=concurrency,
+            rate=rate,
+            detect_proxy=detect_proxy,
+            force=force,
+            use_cache=use_cache,
+            refresh=refresh,
+            hedge_delay=hedge_delay,
+        )
+    )
+
+
+def read_targets(input_file: Path, default_network: str) -> List[Tuple[str, str]]:
+    """
+    Read (network, address) pairs from a list or CSV file.
+
+    Each non-empty line is either ``address`` or ``network,address``. Lines
+    starting with ``#`` and a leading header row are ignored, as are
+    duplicate entries.
+
+    Args:
+        input_file: Path to the input file
+        default_network: Network used for lines without one
+
+    Returns:
+        List of (network, address) pairs with lowercased addresses
+
+    Raises:
+        InvalidInputError: If a line has an invalid address or unknown network
+    """
+    targets: List[Tuple[str, str]] = []
+    seen = set()
+
+    with open(input_file, newline="", encoding="utf-8") as f:
+        for line_no, row in enumerate(csv.reader(f), start=1):
+            row = [cell.strip() for cell in row if cell.strip()]
+            if not row or row[0].startswith("#"):
+                continue
+
+            if len(row) == 1:
+                net, address = default_network, row[0]
+            else:
+                net, address = row[0].lower(), row[1]
+
+            if not is_valid_address(address):
+                if not targets and line_no == 1:
+                    continue  # Header row
+                raise InvalidInputError(
+                    f"Line {line_no}: invalid address '{address}'", argument="input"
+                )
+            if net not in NETWORKS:
+                raise InvalidInputError(
+                    f"Line {line_no}: unknown network '{net}'", argument="input"
+                )
+
+            target = (net, address.lower())
+            if target not in seen:
+                seen.add(target)
+                targets.append(target)
+
+    return targets
+
+
+async def _fetch_batch_async(
+    input_file: Path,
+    output: Path,
+    network: str,
+    concurrency: int,
+    rate: float,
+    detect_proxy: bool,
+    force: bool,
+    use_cache: bool = True,
+    refresh: bool = False,
+    hedge_delay: Optional[float] = None,
+) -> None:
+    """Async implementation."""
+    try:
+        from abi_to_mcp.core.config import FetcherConfig
+        from abi_to_mcp.fetchers import create_default_registry
+
+        targets = read_targets(input_file, network)
+        if not force:
+            targets = [
+                (net, address)
+                for net, address in targets
+                if not (output / net / f"{address}.json").exists()
+            ]
+
+        if not targets:
+            rprint("[yellow]Nothing to fetch[/yellow]")
+            return
+
+        config = FetcherConfig(
+            requests_per_second=rate, cache_enabled=use_cache, hedge_delay=hedge_delay
+        )
+        failures = []
+
+        with Progress(
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            console=console,
+        ) as progress:
+            task = progress.add_task("Fetching ABIs...", total=len(targets))
+
+            async with create_default_registry(config=config) as registry:
+                async for item in registry.fetch_many(
+                    targets,
+                    concurrency=concurrency,
+                    detect_proxy=detect_proxy,
+                    refresh=refresh,
+                ):
+                    if item.result is not None:
+                        file_path = output / item.network / f"{item.address}.json"
+                        file_path.parent.mkdir(parents=True, exist_ok=True)
+                        file_path.write_text(json.dumps(item.result.abi, indent=2))
+                    else:
+                        failures.append(item)
+                    progress.advance(task)
+
+        rprint()
+        rprint(
+            f"[bold green]✓ Fetched {len(targets) - len(failures)}/{len(targets)} ABIs[/bold green]"
+            f" into {output}"
+        )
+        for item in failures:
+            message = item.error.message if isinstance(item.error, ABIToMCPError) else item.error
+            rprint(f"  [red]✗[/red] {item.network}/{item.address}: {message}")
+
+        if failures:
+            raise SystemExit(1)
+
+    except ABIToMCPError as e:
+        rprint(f"[bold red]Error:[/bold red] {e.message}")
+        raise SystemExit(1) from None
+    except OSError as e:
+        rprint(f"[bold red]Error:[/bold red] {e}")
+        raise SystemExit(1) from None
@@ -23,6 +23,17 @@ def generate(
     read_only: bool,
     include_events: bool,
     simulation_default: bool,
+    use_cache: bool = True,
+    refresh: bool = False,
+    hedge_delay: Optional[float] = None,
+    multicall: bool = True,
+    async_runtime: bool = False,
+    read_cache: bool = False,
+    read_cache_ttl: float = 12.0,
+    read_cache_size: int = 1024,
+    event_index: bool = False,
+    index_from_block: int = 0,
+    force: bool = False,
 ) -> None:
     """Generate an MCP server from an ABI."""
     asyncio.run(
@@ -35,6 +46,17 @@ def generate(
             read_only=read_only,
             include_events=include_events,
             simulation_default=simulation_default,
+            use_cache=use_cache,
+            refresh=refresh,
+            hedge_delay=hedge_delay,
+            multicall=multicall,
+            async_runtime=async_runtime,
+            read_cache=read_cache,
+            read_cache_ttl=read_cache_ttl,
+            read_cache_size=read_cache_size,
+            event_index=event_index,
+            index_from_block=index_from_block,
+            force=force,
         )
     )
 
@@ -48,6 +70,17 @@ async def _generate_async(
     read_only: bool,
     include_events: bool,
     simulation_default: bool,
+    use_cache: bool = True,
+    refresh: bool = False,
+    hedge_delay: Optional[float] = None,
+    multicall: bool = True,
+    async_runtime: bool = False,
+    read_cache: bool = False,
+    read_cache_ttl: float = 12.0,
+    read_cache_size: int = 1024,
+    event_index: bool = False,
+    index_from_block: int = 0,
+    force: bool = False,
 ) -> None:
     """Async implementation."""
     try:
@@ -57,6 +90,7 @@ async def _generate_async(
             console=console,
         ) as progress:
             # Import here to avoid circular dependencies
+            from abi_to_mcp.core.config import FetcherConfig, GeneratorConfig
             from abi_to_mcp.fetchers import create_default_registry
             from abi_to_mcp.parser import ABIParser
             from abi_to_mcp.mapper import TypeMapper, FunctionMapper, EventMapper
@@ -64,16 +98,17 @@ async def _generate_async(
 
             # Step 1: Fetch
             task = progress.add_task("Fetching ABI...", total=None)
-            registry = create_default_registry()
-
-            if is_valid_address(source):
-                fetch_result = await registry.fetch(source, network=network)
-                contract_address = contract_address or source
-            else:
-                fetch_result = await registry.fetch(source)
-                if not contract_address:
-                    rprint("[yellow]Warning: No contract address - using placeholder[/yellow]")
-                    contract_address = "0x0000000000000000000000000000000000000000"
+            async with create_default_registry(
+                config=FetcherConfig(cache_enabled=use_cache, hedge_delay=hedge_delay)
+            ) as registry:
+                if is_valid_address(source):
+                    fetch_result = await registry.fetch(source, network=network, refresh=refresh)
+                    contract_address = contract_address or source
+                else:
+                    fetch_result = await registry.fetch(source)
+                    if not contract_address:
+                        rprint("[yellow]Warning: No contract address - using placeholder[/yellow]")
+                        contract_address = "0x0000000000000000000000000000000000000000"
 
             progress.update(task, description="✓ ABI fetched")
 
@@ -101,7 +136,22 @@ async def _generate_async(
             if name is None:
                 name = fetch_result.contract_name or parsed.detected_standard or "Contract"
 
-            generator = MCPGenerator()
+            generator = MCPGenerator(
+                GeneratorConfig(
+                    output_dir=output,
+                    incremental=not force,
+                    read_only=read_only,
+                    include_events=include_events,
+                    simulation_default=simulation_default,
+                    multicall=multicall,
+                    async_runtime=async_runtime,
+                    read_cache=read_cache,
+                    read_cache_ttl=read_cache_ttl,
+                    read_cache_max_size=read_cache_size,
+                    event_index=event_index,
+                    event_index_start_block=index_from_block,
+                )
+            )
             server = generator.generate(
                 parsed=parsed,
                 tools=tools,
@@ -111,18 +161,22 @@ async def _generate_async(
                 contract_name=name,
             )
 
-            progress.update(task, description="✓ Server generated")
+            if server.reused_files:
+                progress.update(
+                    task,
+                    description=f"✓ Server generated ({len(server.reused_files)} files unchanged)",
+                )
+            else:
+                progress.update(task, description="✓ Server generated")
 
             # Step 5: Write
             task = progress.add_task("Writing files...", total=None)
-            output.mkdir(parents=True, exist_ok=True)
-
-            for file in server.files:
-                file_path = output / file.path
-                file_path.parent.mkdir(parents=True, exist_ok=True)
-                file_path.write_text(file.content)
+            generator.write_to_disk(server, output)
 
-            progress.update(task, description=f"✓ Wrote {len(server.files)} files")
+            progress.update(
+                task,
+                description=f"✓ Wrote {len(server.written_files)} of {len(server.files)} files",
+            )
 
         # Success
         rprint()
@@ -131,6 +185,10 @@ async def _generate_async(
         rprint(f"[bold]Output:[/bold] {output}")
         rprint(f"[bold]Tools:[/bold] {len(tools)}")
         rprint(f"[bold]Resources:[/bold] {len(resources)}")
+        if server.changed_tools and len(server.changed_tools) < len(tools):
+            rprint(f"[bold]Changed tools:[/bold] {', '.join(server.changed_tools)}")
+        if server.removed_tools:
+            rprint(f"[bold]Removed tools:[/bold] {', '.join(server.removed_tools)}")
         rprint()
         rprint("[bold]Next steps:[/bold]")
         rprint(f"  cd {output}")
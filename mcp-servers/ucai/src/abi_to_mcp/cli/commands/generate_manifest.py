@@ -0,0 +1,573 @@
+"""Manifest-driven generation of many servers at once."""
+
+import asyncio
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from rich.console import Console
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn, TimeElapsedColumn
+from rich import print as rprint
+
+from abi_to_mcp.core.constants import NETWORKS
+from abi_to_mcp.core.exceptions import ABIToMCPError, InvalidInputError
+from abi_to_mcp.core.models import FetchResult
+from abi_to_mcp.utils.validation import is_valid_address
+
+if TYPE_CHECKING:
+    from abi_to_mcp.fetchers.registry import FetcherRegistry
+
+console = Console()
+
+PLACEHOLDER_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+# GeneratorConfig fields a manifest may set, in `defaults` or per contract
+GENERATOR_OPTIONS = {
+    "read_only",
+    "include_events",
+    "simulation_default",
+    "multicall",
+    "multicall_window_ms",
+    "async_runtime",
+    "read_cache",
+    "read_cache_ttl",
+    "read_cache_max_size",
+    "event_index",
+    "event_index_start_block",
+    "server_version",
+}
+
+# Keys describing the contract itself
+ENTRY_KEYS = {"source", "address", "network", "name", "output"}
+
+STAGES = ("fetch", "parse", "map", "render", "write")
+
+
+@dataclass
+class ManifestEntry:
+    """One contract listed in a generation manifest.
+
+    Attributes:
+        source: ABI file path or contract address
+        output: Output directory of the generated server
+        network: Network for address lookups and the generated server
+        address: Contract address (defaults to the source if it is one)
+        name: Server name (detected if not provided)
+        options: GeneratorConfig overrides
+        abi: ABI already read from a build directory (skips fetching)
+    """
+
+    source: str
+    output: Path
+    network: str = "mainnet"
+    address: Optional[str] = None
+    name: Optional[str] = None
+    options: Dict[str, Any] = field(default_factory=dict)
+    abi: Optional[List[Dict[str, Any]]] = None
+
+
+@dataclass
+class GenerationJob:
+    """CPU-bound part of generating one server, sent to a worker process."""
+
+    abi: List[Dict[str, Any]]
+    output: Path
+    network: str
+    contract_address: str
+    name: Optional[str]
+    options: Dict[str, Any]
+
+
+@dataclass
+class GenerationOutcome:
+    """Result of one manifest entry.
+
+    Attributes:
+        entry: The manifest entry
+        timings: Seconds spent per stage (fetch, parse, map, render, write)
+        tool_count: Number of generated tools
+        written_files: Files written (unchanged files are skipped)
+        changed_tools: Tools added or changed since the last generation
+        error: Error message if the entry failed
+    """
+
+    entry: ManifestEntry
+    timings: Dict[str, float] = field(default_factory=dict)
+    tool_count: int = 0
+    written_files: List[str] = field(default_factory=list)
+    changed_tools: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Check if the server was generated."""
+        return self.error is None
+
+
+def _load_document(path: Path) -> Any:
+    """Parse a YAML, JSON or TOML manifest file."""
+    content = path.read_text(encoding="utf-8")
+    suffix = path.suffix.lower()
+
+    if suffix == ".json":
+        return json.loads(content)
+    if suffix == ".toml":
+        if sys.version_info >= (3, 11):
+            import tomllib
+        else:
+            import tomli as tomllib
+        return tomllib.loads(content)
+    if suffix in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError:
+            raise InvalidInputError(
+                "Reading YAML manifests requires PyYAML (pip install abi-to-mcp[yaml])",
+                argument="manifest",
+            ) from None
+        return yaml.safe_load(content)
+
+    raise InvalidInputError(
+        f"Unsupported manifest format: {path.suffix} (use .yaml, .json or .toml)",
+        argument="manifest",
+    )
+
+
+def read_manifest(
+    path: Path,
+    output: Path,
+    network: str = "mainnet",
+    defaults: Optional[Dict[str, Any]] = None,
+) -> List[ManifestEntry]:
+    """
+    Read the contracts listed in a generation manifest.
+
+    The manifest holds a ``contracts`` list. Each contract has a ``source``
+    (ABI file or address) and optionally ``address``, ``network``, ``name``,
+    ``output`` and any generator option (``read_only``, ``async_runtime``,
+    ...). Options in a top-level ``defaults`` table apply to every contract,
+    and a top-level ``output`` sets the base directory. Relative ABI paths
+    are resolved from the manifest's directory; each server is written to
+    ``<output>/<contract output>``, by default a directory named after the
+    contract.
+
+    A ``source`` may also be a build directory (Foundry ``out/``, Hardhat
+    ``artifacts/`` or ``build-info``): it expands to one entry per contract
+    found there, written to ``<output>/<contract output>/<contract name>``.
+
+    Args:
+        path: Manifest file (.yaml, .yml, .json or .toml)
+        output: Base output directory (overridden by the manifest's ``output``)
+        network: Network for contracts that do not set one
+        defaults: Generator options applied before the manifest's defaults
+
+    Returns:
+        Manifest entries in file order
+
+    Raises:
+        InvalidInputError: If the manifest is malformed
+    """
+    try:
+        data = _load_document(path)
+    except InvalidInputError:
+        raise
+    except Exception as e:
+        raise InvalidInputError(f"Cannot read manifest {path}: {e}", argument="manifest") from e
+
+    if isinstance(data, list):
+        data = {"contracts": data}
+    if not isinstance(data, dict) or not isinstance(data.get("contracts"), list):
+        raise InvalidInputError("Manifest must contain a 'contracts' list", argument="manifest")
+
+    manifest_defaults = dict(data.get("defaults") or {})
+    network = manifest_defaults.pop("network", network)
+    base = path.parent / data["output"] if data.get("output") else output
+    options = {**(defaults or {}), **manifest_defaults}
+    unknown = set(manifest_defaults) - GENERATOR_OPTIONS
+    if unknown:
+        raise InvalidInputError(
+            f"Unknown manifest defaults: {', '.join(sorted(unknown))}", argument="manifest"
+        )
+
+    entries: List[ManifestEntry] = []
+    outputs = set()
+    for index, item in enumerate(data["contracts"], start=1):
+        if isinstance(item, str):
+            item = {"source": item}
+        if not isinstance(item, dict) or not item.get("source"):
+            raise InvalidInputError(f"Contract {index}: 'source' is required", argument="manifest")
+
+        unknown = set(item) - ENTRY_KEYS - GENERATOR_OPTIONS
+        if unknown:
+            raise InvalidInputError(
+                f"Contract {index}: unknown keys {', '.join(sorted(unknown))}",
+                argument="manifest",
+            )
+
+        source = _address_or_str(item["source"])
+        entry_network = str(item.get("network", network)).lower()
+        if entry_network not in NETWORKS:
+            raise InvalidInputError(
+                f"Contract {index}: unknown network '{entry_network}'", argument="manifest"
+            )
+        address = item.get("address")
+        if address is not None:
+            address = _address_or_str(address)
+        if address is not None and not is_valid_address(address):
+            raise InvalidInputError(
+                f"Contract {index}: invalid address '{address}'", argument="manifest"
+            )
+        if not is_valid_address(source) and not Path(source).is_absolute():
+            source = str(path.parent / source)
+
+        item_options = {k: v for k, v in item.items() if k in GENERATOR_OPTIONS}
+        if Path(source).is_dir():
+            if "name" in item or "address" in item:
+                raise InvalidInputError(
+                    f"Contract {index}: 'name' and 'address' cannot be set for a directory",
+                    argument="manifest",
+                )
+            from abi_to_mcp.fetchers import FileFetcher
+
+            contracts = list(FileFetcher().iter_contracts(source))
+            if not contracts:
+                raise InvalidInputError(
+                    f"Contract {index}: no contract ABIs found in {source}", argument="manifest"
+                )
+            prefix = base / item["output"] if item.get("output") else base
+            for result in contracts:
+                directory = _default_directory(
+                    result.contract_name, result.source_location, entry_network
+                )
+                entry_output = prefix / directory
+                suffix = 2
+                while entry_output in outputs:
+                    entry_output = prefix / f"{directory}_{suffix}"
+                    suffix += 1
+                outputs.add(entry_output)
+                entries.append(
+                    ManifestEntry(
+                        source=result.source_location,
+                        output=entry_output,
+                        network=entry_network,
+                        name=result.contract_name,
+                        options={**options, **item_options},
+                        abi=result.abi,
+                    )
+                )
+            continue
+
+        name = item.get("name")
+        directory = item.get("output") or _default_directory(name, source, entry_network)
+        entry_output = base / directory
+        if entry_output in outputs:
+            raise InvalidInputError(
+                f"Contract {index}: output directory {entry_output} is used twice",
+                argument="manifest",
+            )
+        outputs.add(entry_output)
+
+        entries.append(
+            ManifestEntry(
+                source=source,
+                output=entry_output,
+                network=entry_network,
+                address=address,
+                name=name,
+                options={**options, **item_options},
+            )
+        )
+
+    return entries
+
+
+def _address_or_str(value: Any) -> str:
+    """Convert a manifest value to a string, restoring addresses YAML read as hex ints."""
+    if isinstance(value, int) and not isinstance(value, bool):
+        return f"0x{value:040x}"
+    return str(value)
+
+
+def _default_directory(name: Optional[str], source: str, network: str) -> str:
+    """Output directory name for a contract without an explicit one."""
+    from abi_to_mcp.generator import ServerGenerator
+
+    if name:
+        return ServerGenerator._to_package_name(name)
+    if is_valid_address(source):
+        return f"{network}_{source.lower()}"
+    return ServerGenerator._to_package_name(Path(source).stem)
+
+
+def run_generation_job(job: GenerationJob) -> Dict[str, Any]:
+    """
+    Parse, map, render and write one server.
+
+    Runs in a worker process, so it only takes and returns picklable data.
+
+    Args:
+        job: The generation job
+
+    Returns:
+        Dict with timings, tool_count, written_files, changed_tools and
+        error (a message, or None on success)
+    """
+    from abi_to_mcp.core.config import GeneratorConfig
+    from abi_to_mcp.generator import MCPGenerator
+    from abi_to_mcp.mapper import EventMapper, FunctionMapper, TypeMapper
+    from abi_to_mcp.parser import ABIParser
+
+    timings: Dict[str, float] = {}
+    try:
+        start = time.perf_counter()
+        parsed = ABIParser().parse(job.abi)
+        timings["parse"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        read_only = job.options.get("read_only", False)
+        type_mapper = TypeMapper()
+        func_mapper = FunctionMapper(type_mapper)
+        event_mapper = EventMapper(type_mapper)
+        functions = [f for f in parsed.functions if not read_only or f.is_read_only]
+        tools = [func_mapper.map_function(f) for f in functions]
+        resources = (
+            [event_mapper.map_event(e) for e in parsed.events]
+            if job.options.get("include_events", True)
+            else []
+        )
+        timings["map"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        generator = MCPGenerator(GeneratorConfig(output_dir=job.output, **job.options))
+        server = generator.generate(
+            parsed=parsed,
+            tools=tools,
+            resources=resources,
+            contract_address=job.contract_address,
+            network=job.network,
+            contract_name=job.name or parsed.detected_standard or "Contract",
+        )
+        timings["render"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        generator.write_to_disk(server, job.output)
+        timings["write"] = time.perf_counter() - start
+    except Exception as e:
+        message = e.message if isinstance(e, ABIToMCPError) else str(e)
+        return {"timings": timings, "error": message or type(e).__name__}
+
+    return {
+        "timings": timings,
+        "tool_count": len(tools),
+        "written_files": server.written_files,
+        "changed_tools": server.changed_tools,
+        "error": None,
+    }
+
+
+def generate_manifest(
+    manifest: Path,
+    output: Path,
+    network: str,
+    concurrency: int = 4,
+    jobs: Optional[int] = None,
+    use_cache: bool = True,
+    refresh: bool = False,
+    hedge_delay: Optional[float] = None,
+    force: bool = False,
+    defaults: Optional[Dict[str, Any]] = None,
+) -> None:
+    """Generate one MCP server per contract listed in a manifest."""
+    asyncio.run(
+        _generate_manifest_async(
+            manifest=manifest,
+            output=output,
+            network=network,
+            concurrency=concurrency,
+            jobs=jobs,
+            use_cache=use_cache,
+            refresh=refresh,
+            hedge_delay=hedge_delay,
+            force=force,
+            defaults=defaults,
+        )
+    )
+
+
+async def run_manifest(
+    entries: List[ManifestEntry],
+    registry: "FetcherRegistry",
+    concurrency: int = 4,
+    jobs: Optional[int] = None,
+    refresh: bool = False,
+    force: bool = False,
+    on_done: Optional[Callable[[GenerationOutcome], None]] = None,
+) -> List[GenerationOutcome]:
+    """
+    Fetch, generate and write the servers of manifest entries.
+
+    ABIs are fetched concurrently (at most `concurrency` at once). As soon as
+    an ABI arrives, parsing, mapping and rendering run in a process pool and
+    the server is written; fetching continues meanwhile.
+
+    Args:
+        entries: Manifest entries
+        registry: Open FetcherRegistry
+        concurrency: Maximum number of ABIs fetched at once
+        jobs: Worker processes (default: number of CPUs)
+        refresh: Ignore cached ABIs and re-fetch
+        force: Render every file even if its inputs are unchanged
+        on_done: Optional callback receiving each GenerationOutcome
+
+    Returns:
+        One GenerationOutcome per entry, in manifest order
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    loop = asyncio.get_running_loop()
+    workers = max(1, min(jobs or os.cpu_count() or 1, len(entries)))
+
+    async def process(entry: ManifestEntry, pool: ProcessPoolExecutor) -> GenerationOutcome:
+        outcome = GenerationOutcome(entry=entry)
+        start = time.perf_counter()
+        try:
+            async with semaphore:
+                if entry.abi is not None:
+                    fetch_result = FetchResult(
+                        abi=entry.abi,
+                        source="file",
+                        source_location=entry.source,
+                        contract_name=entry.name,
+                    )
+                elif is_valid_address(entry.source):
+                    fetch_result = await registry.fetch(
+                        entry.source, network=entry.network, refresh=refresh
+                    )
+                else:
+                    fetch_result = await registry.fetch(entry.source)
+        except Exception as e:
+            outcome.error = e.message if isinstance(e, ABIToMCPError) else str(e)
+            return outcome
+        finally:
+            outcome.timings["fetch"] = time.perf_counter() - start
+
+        if entry.address:
+            address = entry.address
+        elif is_valid_address(entry.source):
+            address = entry.source
+        else:
+            address = PLACEHOLDER_ADDRESS
+
+        job = GenerationJob(
+            abi=fetch_result.abi,
+            output=entry.output,
+            network=entry.network,
+            contract_address=address,
+            name=entry.name or fetch_result.contract_name,
+            options={**entry.options, "incremental": not force},
+        )
+        result = await loop.run_in_executor(pool, run_generation_job, job)
+        outcome.timings.update(result.pop("timings"))
+        for key, value in result.items():
+            setattr(outcome, key, value)
+        return outcome
+
+    async def run(entry: ManifestEntry, pool: ProcessPoolExecutor) -> GenerationOutcome:
+        outcome = await process(entry, pool)
+        if on_done is not None:
+            on_done(outcome)
+        return outcome
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(await asyncio.gather(*(run(entry, pool) for entry in entries)))
+
+
+async def _generate_manifest_async(
+    manifest: Path,
+    output: Path,
+    network: str,
+    concurrency: int = 4,
+    jobs: Optional[int] = None,
+    use_cache: bool = True,
+    refresh: bool = False,
+    hedge_delay: Optional[float] = None,
+    force: bool = False,
+    defaults: Optional[Dict[str, Any]] = None,
+) -> None:
+    """Async implementation."""
+    try:
+        from abi_to_mcp.core.config import FetcherConfig
+        from abi_to_mcp.fetchers import create_default_registry
+
+        entries = read_manifest(manifest, output, network, defaults)
+        if not entries:
+            rprint("[yellow]Nothing to generate[/yellow]")
+            return
+
+        started = time.perf_counter()
+        with Progress(
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            TimeElapsedColumn(),
+            console=console,
+        ) as progress:
+            task = progress.add_task("Generating servers...", total=len(entries))
+
+            async with create_default_registry(
+                config=FetcherConfig(cache_enabled=use_cache, hedge_delay=hedge_delay)
+            ) as registry:
+                outcomes = await run_manifest(
+                    entries,
+                    registry,
+                    concurrency=concurrency,
+                    jobs=jobs,
+                    refresh=refresh,
+                    force=force,
+                    on_done=lambda outcome: progress.advance(task),
+                )
+        elapsed = time.perf_counter() - started
+
+        _print_summary(outcomes, elapsed)
+        if any(not outcome.ok for outcome in outcomes):
+            raise SystemExit(1)
+
+    except ABIToMCPError as e:
+        rprint(f"[bold red]Error:[/bold red] {e.message}")
+        raise SystemExit(1) from None
+    except OSError as e:
+        rprint(f"[bold red]Error:[/bold red] {e}")
+        raise SystemExit(1) from None
+
+
+def _print_summary(outcomes: List[GenerationOutcome], elapsed: float) -> None:
+    """Print per-server results and per-stage timings."""
+    succeeded = [o for o in outcomes if o.ok]
+    unchanged = [o for o in succeeded if not o.written_files]
+
+    rprint()
+    rprint(
+        f"[bold green]✓ Generated {len(succeeded)}/{len(outcomes)} servers[/bold green]"
+        f" in {elapsed:.2f}s ({len(unchanged)} unchanged)"
+    )
+    for outcome in outcomes:
+        if not outcome.ok:
+            rprint(f"  [red]✗[/red] {outcome.entry.source}: {outcome.error}")
+        elif outcome.written_files:
+            changed = ""
+            if outcome.changed_tools and len(outcome.changed_tools) < outcome.tool_count:
+                changed = f", {len(outcome.changed_tools)} tools changed"
+            rprint(
+                f"  [green]✓[/green] {outcome.entry.output}: {outcome.tool_count} tools"
+                f", wrote {len(outcome.written_files)} files{changed}"
+            )
+
+    totals = {stage: sum(o.timings.get(stage, 0.0) for o in outcomes) for stage in STAGES}
+    rprint()
+    rprint("[bold]Stage timings[/bold] (summed over servers):")
+    for stage in STAGES:
+        rprint(f"  {stage:<7} {totals[stage]:8.3f}s")
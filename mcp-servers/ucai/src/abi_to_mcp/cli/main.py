@@ -23,7 +23,7 @@ app = typer.Typer(
 console = Console()
 
 
-def version_callback(value: bool):
+def version_callback(value: bool) -> None:
     """Print version and exit."""
     if value:
         rprint(f"[bold blue]UCAI[/bold blue] version [green]{__version__}[/green]")
@@ -40,7 +40,7 @@ def main_callback(
         callback=version_callback,
         is_eager=True,
     ),
-):
+) -> None:
     """
     UCAI - The ABI-to-MCP Server Generator.
 
@@ -52,8 +52,8 @@ def main_callback(
 
 @app.command()
 def generate(
-    source: str = typer.Argument(
-        ...,
+    source: Optional[str] = typer.Argument(
+        None,
         help="ABI source: file path or contract address (0x...)",
     ),
     output: Path = typer.Option(
@@ -98,9 +98,79 @@ def generate(
         False,
         "--force",
         "-f",
-        help="Overwrite output directory if it exists",
+        help="Regenerate every file, even if its inputs are unchanged",
+    ),
+    use_cache: bool = typer.Option(
+        True,
+        "--cache/--no-cache",
+        help="Use the on-disk ABI cache for contract address lookups",
+    ),
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        help="Ignore cached ABIs and re-fetch (the cache is updated)",
+    ),
+    hedge_delay: Optional[float] = typer.Option(
+        None,
+        "--hedge-delay",
+        help="Also ask the next ABI source if one has not answered after this many seconds",
     ),
-):
+    multicall: bool = typer.Option(
+        True,
+        "--multicall/--no-multicall",
+        help="Batch concurrent read calls through Multicall3 in the generated server",
+    ),
+    async_runtime: bool = typer.Option(
+        False,
+        "--async-runtime",
+        help="Generate a server using AsyncWeb3 with a pooled HTTP session",
+    ),
+    read_cache: bool = typer.Option(
+        False,
+        "--read-cache",
+        help="Cache read tool results per block in the generated server",
+    ),
+    read_cache_ttl: float = typer.Option(
+        12.0,
+        "--read-cache-ttl",
+        help="Seconds a cached read result stays valid within a block",
+    ),
+    read_cache_size: int = typer.Option(
+        1024,
+        "--read-cache-size",
+        help="Maximum number of cached read results",
+    ),
+    event_index: bool = typer.Option(
+        False,
+        "--event-index",
+        help="Index events into a local SQLite database with filterable event tools",
+    ),
+    index_from_block: int = typer.Option(
+        0,
+        "--index-from-block",
+        help="First block the event indexer backfills (e.g. the deployment block)",
+    ),
+    manifest: Optional[Path] = typer.Option(
+        None,
+        "--manifest",
+        "-m",
+        help="YAML, JSON or TOML file listing contracts to generate servers for",
+        exists=True,
+        dir_okay=False,
+    ),
+    concurrency: int = typer.Option(
+        4,
+        "--concurrency",
+        "-c",
+        help="Maximum number of ABIs fetched at once (with --manifest)",
+    ),
+    jobs: Optional[int] = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        help="Worker processes generating servers (with --manifest, default: CPU count)",
+    ),
+) -> None:
     """
     Generate an MCP server from a smart contract ABI.
 
@@ -120,7 +190,51 @@ def generate(
 
         # Custom output directory
         abi-to-mcp generate ./abi.json -a 0x... -o ./my-mcp-server
+
+        # Re-fetch instead of using the ABI cache
+        abi-to-mcp generate 0x... --refresh
+
+        # Serve events from a local index, backfilled from the deployment block
+        abi-to-mcp generate 0x... --event-index --index-from-block 6082465
+
+        # One server per contract listed in a manifest, into ./servers/<name>
+        abi-to-mcp generate --manifest contracts.yaml -o ./servers
     """
+    if manifest is not None:
+        from abi_to_mcp.cli.commands import generate_manifest as cmd_generate_manifest
+
+        if source is not None:
+            rprint("[bold red]Error:[/bold red] Pass either SOURCE or --manifest, not both")
+            raise typer.Exit(2)
+        cmd_generate_manifest(
+            manifest=manifest,
+            output=output,
+            network=network,
+            concurrency=concurrency,
+            jobs=jobs,
+            use_cache=use_cache,
+            refresh=refresh,
+            hedge_delay=hedge_delay,
+            force=force,
+            defaults={
+                "read_only": read_only,
+                "include_events": include_events,
+                "simulation_default": simulation_default,
+                "multicall": multicall,
+                "async_runtime": async_runtime,
+                "read_cache": read_cache,
+                "read_cache_ttl": read_cache_ttl,
+                "read_cache_max_size": read_cache_size,
+                "event_index": event_index,
+                "event_index_start_block": index_from_block,
+            },
+        )
+        return
+
+    if source is None:
+        rprint("[bold red]Error:[/bold red] Missing SOURCE (or --manifest)")
+        raise typer.Exit(2)
+
     from abi_to_mcp.cli.commands import generate as cmd_generate
 
     cmd_generate(
@@ -132,6 +246,105 @@ def generate(
         read_only=read_only,
         include_events=include_events,
         simulation_default=simulation_default,
+        use_cache=use_cache,
+        refresh=refresh,
+        hedge_delay=hedge_delay,
+        multicall=multicall,
+        async_runtime=async_runtime,
+        read_cache=read_cache,
+        read_cache_ttl=read_cache_ttl,
+        read_cache_size=read_cache_size,
+        event_index=event_index,
+        index_from_block=index_from_block,
+        force=force,
+    )
+
+
+@app.command("fetch-batch")
+def fetch_batch(
+    input_file: Path = typer.Argument(
+        ...,
+        help="File with one 'address' or 'network,address' per line (CSV)",
+        exists=True,
+        dir_okay=False,
+    ),
+    output: Path = typer.Option(
+        Path("./abis"),
+        "--output",
+        "-o",
+        help="Output directory (ABIs are written to <output>/<network>/<address>.json)",
+    ),
+    network: str = typer.Option(
+        "mainnet",
+        "--network",
+        "-n",
+        help="Network for lines that do not specify one",
+    ),
+    concurrency: int = typer.Option(
+        4,
+        "--concurrency",
+        "-c",
+        help="Maximum number of contracts fetched at once",
+    ),
+    rate: float = typer.Option(
+        5.0,
+        "--rate",
+        help="Maximum explorer API requests per second, per explorer",
+    ),
+    detect_proxy: bool = typer.Option(
+        True,
+        "--proxy/--no-proxy",
+        help="Detect proxies and fetch the implementation ABI",
+    ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        "-f",
+        help="Re-fetch contracts whose output file already exists",
+    ),
+    use_cache: bool = typer.Option(
+        True,
+        "--cache/--no-cache",
+        help="Use the on-disk ABI cache",
+    ),
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        help="Ignore cached ABIs and re-fetch (the cache is updated)",
+    ),
+    hedge_delay: Optional[float] = typer.Option(
+        None,
+        "--hedge-delay",
+        help="Also ask the next ABI source if one has not answered after this many seconds",
+    ),
+) -> None:
+    """
+    Fetch many contract ABIs at once.
+
+    Requests are paced per explorer to stay within API rate limits, and each
+    ABI is written to disk as soon as it arrives.
+
+    EXAMPLES:
+
+        # addresses.csv contains lines like: mainnet,0xA0b8...
+        abi-to-mcp fetch-batch addresses.csv -o ./abis
+
+        # Plain list of Polygon addresses, with a paid-tier API key
+        abi-to-mcp fetch-batch addresses.txt -n polygon --rate 10
+    """
+    from abi_to_mcp.cli.commands import fetch_batch as cmd_fetch_batch
+
+    cmd_fetch_batch(
+        input_file=input_file,
+        output=output,
+        network=network,
+        concurrency=concurrency,
+        rate=rate,
+        detect_proxy=detect_proxy,
+        force=force,
+        use_cache=use_cache,
+        refresh=refresh,
+        hedge_delay=hedge_delay,
     )
 
 
@@ -147,7 +360,7 @@ def inspect(
         "-n",
         help="Network for contract lookups",
     ),
-):
+) -> None:
     """
     Inspect an ABI and show what would be generated.
 
@@ -176,7 +389,7 @@ def validate(
         "--strict",
         help="Enable strict validation (check for duplicates, unnamed params)",
     ),
-):
+) -> None:
     """
     Validate an ABI without generating.
 
@@ -211,7 +424,7 @@ def serve(
         "-t",
         help="Transport mode: stdio (default) or http",
     ),
-):
+) -> None:
     """
     Run a generated MCP server.
 
@@ -232,7 +445,7 @@ def serve(
 
 
 @app.command()
-def networks():
+def networks() -> None:
     """
     List all supported networks.
     """
@@ -255,7 +468,7 @@ def networks():
     console.print(table)
 
 
-def main():
+def main() -> None:
     """Main entry point."""
     app()
 
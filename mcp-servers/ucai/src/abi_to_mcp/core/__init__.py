@@ -62,6 +62,7 @@ from abi_to_mcp.core.models import (
     GeneratedFile,
     GeneratedServer,
     FetchResult,
+    BatchFetchResult,
 )
 
 __all__ = [
@@ -117,4 +118,5 @@ __all__ = [
     "GeneratedFile",
     "GeneratedServer",
     "FetchResult",
+    "BatchFetchResult",
 ]
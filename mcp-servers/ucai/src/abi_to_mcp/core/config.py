@@ -26,6 +26,7 @@ class GeneratorConfig:
     # Output settings
     output_dir: Path = field(default_factory=lambda: Path("./mcp-server"))
     overwrite: bool = False
+    incremental: bool = True  # Reuse files whose templates and inputs are unchanged
 
     # Feature flags
     read_only: bool = False
@@ -33,6 +34,16 @@ class GeneratorConfig:
     include_utilities: bool = True
     simulation_default: bool = True
 
+    # Generated runtime settings
+    async_runtime: bool = False  # Use AsyncWeb3 with a pooled aiohttp session
+    multicall: bool = True  # Batch concurrent reads through Multicall3
+    multicall_window_ms: float = 5.0  # How long reads wait to share a batch
+    read_cache: bool = False  # Cache read results per block
+    read_cache_ttl: float = 12.0  # Seconds a cached read stays valid within a block
+    read_cache_max_size: int = 1024  # Maximum number of cached reads
+    event_index: bool = False  # Index events into a local SQLite database
+    event_index_start_block: int = 0  # First block the event indexer backfills
+
     # Code generation settings
     include_docstrings: bool = True
     include_type_hints: bool = True
@@ -65,12 +76,37 @@ class FetcherConfig:
     max_retries: int = 3
     retry_delay: float = 1.0
 
+    # HTTP connection pool (shared per fetcher instance)
+    max_connections: int = 10
+    max_keepalive_connections: int = 5
+    keepalive_expiry: float = 30.0
+    http2: bool = True  # Used when the optional h2 package is installed
+
+    # Explorer request rate per API host (Etherscan free tier: 5 req/s)
+    requests_per_second: float = 5.0
+
+    # Hedged address lookups: start the next source if the current one has
+    # not answered within this many seconds (None = sequential fallback).
+    # Off by default, since hedging adds requests to rate-limited explorers.
+    hedge_delay: Optional[float] = None
+
     # Proxy detection
     detect_proxy: bool = True
     fetch_implementation: bool = True
 
+    # On-disk ABI cache
+    cache_enabled: bool = True
+    cache_dir: Path = field(default_factory=lambda: Path.home() / ".cache" / "abi-to-mcp")
+    cache_ttl: float = 604800.0  # Seconds to trust the ABI of a non-proxy contract
+    cache_negative_ttl: float = 3600.0  # Seconds to remember not-found/unverified
+    cache_proxy_ttl: float = 86400.0  # Seconds to trust a resolved implementation
+    cache_max_entries: int = 1000
+
     def __post_init__(self):
         """Load API keys from environment if not provided."""
+        if isinstance(self.cache_dir, str):
+            self.cache_dir = Path(self.cache_dir)
+
         env_mappings = {
             "etherscan_api_key": "ETHERSCAN_API_KEY",
             "polygonscan_api_key": "POLYGONSCAN_API_KEY",
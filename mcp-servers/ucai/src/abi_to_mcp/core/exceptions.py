@@ -310,10 +310,11 @@ class GasEstimationError(ABIToMCPError):
         self,
         message: str,
         function_name: Optional[str] = None,
+        details: Optional[dict] = None,
     ):
         super().__init__(
             message,
-            details={"function": function_name},
+            details={"function": function_name, **(details or {})},
         )
         self.function_name = function_name
 
@@ -4,10 +4,15 @@ These models are the contracts between different modules. All agents must use
 these exact classes to ensure seamless integration.
 """
 
+import sys
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 from enum import Enum
 
+# Distinct parameters kept by ABIParameter.interned() (LRU)
+PARAMETER_CACHE_SIZE = 65536
+
 
 # =============================================================================
 # Enums
@@ -46,10 +51,14 @@ class ToolType(Enum):
 # =============================================================================
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ABIParameter:
     """A function or event parameter from the ABI.
 
+    Parameters are immutable, so identical ones (the same name, type and
+    components) can be shared between functions, events and ABIs. The
+    parsers build them with interned().
+
     Attributes:
         name: Parameter name (may be empty string in ABI)
         type: Solidity type string (e.g., "address", "uint256", "tuple")
@@ -61,9 +70,32 @@ class ABIParameter:
     name: str
     type: str
     indexed: bool = False
-    components: Optional[List["ABIParameter"]] = None
+    components: Optional[Tuple["ABIParameter", ...]] = None
     internal_type: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        # Accept lists, but store tuples so parameters stay hashable
+        if self.components is not None and not isinstance(self.components, tuple):
+            object.__setattr__(self, "components", tuple(self.components))
+
+    @classmethod
+    def interned(
+        cls,
+        name: str,
+        type: str,
+        indexed: bool = False,
+        components: Optional[Sequence["ABIParameter"]] = None,
+        internal_type: Optional[str] = None,
+    ) -> "ABIParameter":
+        """Get the shared parameter with these values.
+
+        Strings are interned and equal parameters are returned as one
+        instance, so loading many ABIs stores each distinct parameter once.
+        """
+        if components is not None:
+            components = tuple(components)
+        return _interned_parameter(name, type, bool(indexed), components, internal_type)
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ABIParameter":
         """Create from ABI JSON dictionary."""
@@ -71,7 +103,7 @@ class ABIParameter:
         if "components" in data:
             components = [cls.from_dict(c) for c in data["components"]]
 
-        return cls(
+        return cls.interned(
             name=data.get("name", ""),
             type=data["type"],
             indexed=data.get("indexed", False),
@@ -80,7 +112,25 @@ class ABIParameter:
         )
 
 
-@dataclass
+@lru_cache(maxsize=PARAMETER_CACHE_SIZE)
+def _interned_parameter(
+    name: str,
+    type: str,
+    indexed: bool,
+    components: Optional[Tuple[ABIParameter, ...]],
+    internal_type: Optional[str],
+) -> ABIParameter:
+    """Shared ABIParameter instances, keyed by their values."""
+    return ABIParameter(
+        name=sys.intern(name),
+        type=sys.intern(type),
+        indexed=indexed,
+        components=components,
+        internal_type=sys.intern(internal_type) if internal_type else internal_type,
+    )
+
+
+@dataclass(slots=True)
 class ABIFunction:
     """A parsed contract function.
 
@@ -134,7 +184,7 @@ class ABIFunction:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ABIEvent:
     """A parsed contract event.
 
@@ -168,7 +218,7 @@ class ABIEvent:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ABIError:
     """A parsed custom error.
 
@@ -189,7 +239,7 @@ class ABIError:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedABI:
     """Complete parsed ABI.
 
@@ -231,7 +281,7 @@ class ParsedABI:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolParameter:
     """A parameter in an MCP tool definition.
 
@@ -254,7 +304,7 @@ class ToolParameter:
     required: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class MappedTool:
     """A function mapped to an MCP tool definition.
 
@@ -269,6 +319,8 @@ class MappedTool:
         return_schema: JSON Schema for return value
         return_description: Description of return value
         python_signature: Complete Python function signature
+        input_schema: JSON Schema of the tool arguments; structs used more
+            than once are defined once under "$defs"
     """
 
     name: str
@@ -279,6 +331,7 @@ class MappedTool:
     return_schema: Dict[str, Any]
     return_description: str
     python_signature: str
+    input_schema: Dict[str, Any] = field(default_factory=dict)
 
     @property
     def required_params(self) -> List[str]:
@@ -296,7 +349,7 @@ class MappedTool:
         return self.tool_type == "write_payable"
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceField:
     """A field in an MCP resource (event parameter).
 
@@ -317,7 +370,7 @@ class ResourceField:
     indexed: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class MappedResource:
     """An event mapped to an MCP resource definition.
 
@@ -330,6 +383,8 @@ class MappedResource:
         uri_template: MCP resource URI template
         fields: List of resource fields
         function_name: Python function name for the handler
+        event_schema: JSON Schema of a decoded event; structs used more
+            than once are defined once under "$defs"
     """
 
     name: str
@@ -338,6 +393,7 @@ class MappedResource:
     uri_template: str
     fields: List[ResourceField]
     function_name: str
+    event_schema: Dict[str, Any] = field(default_factory=dict)
 
     @property
     def indexed_fields(self) -> List[ResourceField]:
@@ -355,6 +411,26 @@ class MappedResource:
 # =============================================================================
 
 
+@dataclass
+class ProtocolContract:
+    """One contract hosted by a multi-contract (protocol) server.
+
+    Attributes:
+        name: Contract name, also the namespace of its tools
+            (e.g. "pool" -> pool_get_reserve_data)
+        address: Contract address
+        parsed: The parsed ABI
+        tools: Mapped tools of the contract
+        resources: Mapped event resources of the contract
+    """
+
+    name: str
+    address: str
+    parsed: ParsedABI
+    tools: List[MappedTool]
+    resources: List[MappedResource] = field(default_factory=list)
+
+
 @dataclass
 class GeneratedFile:
     """A generated file.
@@ -363,11 +439,14 @@ class GeneratedFile:
         path: Relative path within output directory
         content: File content as string
         is_executable: Whether file should be executable
+        digest: Digest of the templates and context the file is rendered
+            from (None for files built without templates)
     """
 
     path: str
     content: str
     is_executable: bool = False
+    digest: Optional[str] = None
 
 
 @dataclass
@@ -386,6 +465,13 @@ class GeneratedServer:
         server_name: Name of the generated server
         contract_address: Target contract address
         network: Target network
+        contracts: Contract name -> address, for protocol servers
+        tool_digests: Tool name -> digest of the mapped tool
+        changed_tools: Tools added or changed since the last generation
+        removed_tools: Tools removed since the last generation
+        reused_files: Files reused from the output directory unrendered
+        written_files: Files written by the last write_to_disk call
+        removed_files: Stale files deleted by the last write_to_disk call
     """
 
     files: List[GeneratedFile]
@@ -397,6 +483,13 @@ class GeneratedServer:
     server_name: str
     contract_address: str
     network: str
+    contracts: Dict[str, str] = field(default_factory=dict)
+    tool_digests: Dict[str, str] = field(default_factory=dict)
+    changed_tools: List[str] = field(default_factory=list)
+    removed_tools: List[str] = field(default_factory=list)
+    reused_files: List[str] = field(default_factory=list)
+    written_files: List[str] = field(default_factory=list)
+    removed_files: List[str] = field(default_factory=list)
 
     def get_file(self, path: str) -> Optional[GeneratedFile]:
         """Get a specific file by path."""
@@ -434,3 +527,25 @@ class FetchResult:
     source_code: Optional[str] = None
     is_proxy: bool = False
     implementation_address: Optional[str] = None
+
+
+@dataclass
+class BatchFetchResult:
+    """Outcome of one entry in a batch ABI fetch.
+
+    Attributes:
+        network: Network the contract was looked up on
+        address: Contract address
+        result: Fetch result if successful
+        error: Exception raised if the fetch failed
+    """
+
+    network: str
+    address: str
+    result: Optional[FetchResult] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        """Check if the fetch succeeded."""
+        return self.result is not None
@@ -0,0 +1,414 @@
+"""ABI cache module.
+
+This module provides a persistent on-disk cache that sits in front of
+FetcherRegistry, so regenerating a server for a contract that was already
+fetched does not hit Etherscan/Sourcify or re-run proxy detection.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from abi_to_mcp.core.models import FetchResult
+from abi_to_mcp.core.exceptions import ABINotFoundError, ContractNotVerifiedError
+from abi_to_mcp.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class ABICache:
+    """
+    Content-addressed, size-bounded cache for fetched ABIs.
+
+    Layout on disk:
+    - ``index.json``: one entry per (network, address, implementation address,
+      fetch options) with fetch metadata and access timestamps
+    - ``access.log``: cache hits since the index was last written, so reads
+      never rewrite the index
+    - ``blobs/<sha256>``: ABI and source code content, addressed by hash so a
+      proxy and its implementation (or many clones of one implementation)
+      share a single copy
+
+    Storing a result replaces the entry for the same address and options,
+    whatever implementation it resolved to. Results for plain contracts
+    expire after ``ttl`` (a contract can later be put behind a proxy), proxy
+    entries after ``proxy_ttl`` because the implementation can be upgraded,
+    and negative results (not found / not verified) after ``negative_ttl``.
+    When more than ``max_entries`` entries are stored, the least recently
+    used ones are evicted.
+
+    Example:
+        >>> cache = ABICache(Path.home() / ".cache" / "abi-to-mcp")
+        >>> cache.put("mainnet", "0x...", result)
+        >>> cached = cache.get("mainnet", "0x...")
+    """
+
+    INDEX_FILE = "index.json"
+    ACCESS_LOG = "access.log"
+    BLOB_DIR = "blobs"
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path],
+        negative_ttl: float = 3600.0,
+        proxy_ttl: float = 86400.0,
+        max_entries: int = 1000,
+        ttl: float = 604800.0,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory to store the cache in (created on first write)
+            negative_ttl: Seconds to remember "not found"/"not verified" results
+            proxy_ttl: Seconds to trust a resolved proxy implementation
+            max_entries: Maximum number of entries to keep
+            ttl: Seconds to trust the result for a contract that is not a proxy
+        """
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.negative_ttl = negative_ttl
+        self.proxy_ttl = proxy_ttl
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # Index loaded last, by the stat of its file, and its keys by address
+        self._loaded: Optional[Tuple[Tuple[int, int, int], Dict[str, Dict[str, Any]]]] = None
+        self._by_address: Optional[Tuple[Dict[str, Dict[str, Any]], Dict[str, List[str]]]] = None
+
+    # -------------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------------
+
+    def get(
+        self, network: str, address: str, options: Optional[Dict[str, Any]] = None
+    ) -> Optional[FetchResult]:
+        """
+        Look up a cached fetch result.
+
+        Args:
+            network: Network name the contract was fetched from
+            address: Contract address
+            options: Fetch options the result must have been fetched with
+
+        Returns:
+            Cached FetchResult, or None on a miss or expired entry
+
+        Raises:
+            ABINotFoundError: If a fresh negative result is cached
+            ContractNotVerifiedError: If a fresh "not verified" result is cached
+        """
+        index = self._load_index()
+        key = self._find(index, network, address, options)
+        if key is None:
+            return None
+        entry = index[key]
+
+        now = time.time()
+        if self._is_expired(entry, now):
+            logger.debug(f"ABI cache entry expired: {key}")
+            return None
+
+        error = entry.get("error")
+        if error:
+            if error.get("kind") == "not_verified":
+                raise ContractNotVerifiedError(address.lower(), network)
+            raise ABINotFoundError(address, f"{error.get('reason')} (cached)", network)
+
+        abi_blob = self._read_blob(entry["abi"])
+        if abi_blob is None:
+            return None
+
+        source_code = None
+        if entry.get("source_code"):
+            source_code = self._read_blob(entry["source_code"])
+
+        self._record_access(key, now)
+
+        logger.debug(f"ABI cache hit: {key}")
+        return FetchResult(
+            abi=json.loads(abi_blob),
+            source=entry["source"],
+            source_location=entry["source_location"],
+            contract_name=entry.get("contract_name"),
+            compiler_version=entry.get("compiler_version"),
+            source_code=source_code,
+            is_proxy=entry.get("is_proxy", False),
+            implementation_address=entry.get("implementation_address"),
+        )
+
+    def put(
+        self,
+        network: str,
+        address: str,
+        result: FetchResult,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Store a successful fetch result.
+
+        Args:
+            network: Network name the contract was fetched from
+            address: Contract address
+            result: Fetch result to store
+            options: Fetch options the result was fetched with
+        """
+        now = time.time()
+        entry: Dict[str, Any] = {
+            "abi": self._write_blob(json.dumps(result.abi, separators=(",", ":"))),
+            "source": result.source,
+            "source_location": result.source_location,
+            "contract_name": result.contract_name,
+            "compiler_version": result.compiler_version,
+            "source_code": self._write_blob(result.source_code) if result.source_code else None,
+            "is_proxy": result.is_proxy,
+            "implementation_address": (
+                result.implementation_address.lower() if result.implementation_address else None
+            ),
+            "created_at": now,
+            "accessed_at": now,
+        }
+        self._store(network, address, options, entry)
+
+    def put_negative(
+        self,
+        network: str,
+        address: str,
+        error: Union[ABINotFoundError, ContractNotVerifiedError],
+        options: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Remember that a contract could not be fetched.
+
+        Args:
+            network: Network name the lookup was made on
+            address: Contract address
+            error: The error raised by the fetchers
+            options: Fetch options of the lookup
+        """
+        now = time.time()
+        if isinstance(error, ContractNotVerifiedError):
+            kind, reason = "not_verified", error.message
+        else:
+            kind, reason = "not_found", error.reason or error.message
+
+        entry = {
+            "error": {"kind": kind, "reason": reason},
+            "created_at": now,
+            "accessed_at": now,
+        }
+        self._store(network, address, options, entry)
+
+    def invalidate(self, network: str, address: str) -> bool:
+        """
+        Drop every entry for an address, whatever its options.
+
+        Returns:
+            True if an entry was removed
+        """
+        index = self._load_index()
+        stale = list(self._keys_for(index, network, address))
+        for key in stale:
+            del index[key]
+        if stale:
+            self._save_index(index)
+            self._collect_garbage(index)
+        return bool(stale)
+
+    def clear(self) -> None:
+        """Remove every cached entry and blob."""
+        self._apply_access_log({})
+        self._save_index({})
+        self._collect_garbage({})
+
+    def __len__(self) -> int:
+        """Number of entries currently stored."""
+        return len(self._load_index())
+
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _key(
+        network: str,
+        address: str,
+        implementation: str = "",
+        options: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Build the index key for (network, address, implementation, options)."""
+        key = f"{network.lower()}:{address.lower()}:{implementation.lower()}"
+        if options:
+            key += "?" + "&".join(f"{name}={options[name]}" for name in sorted(options))
+        return key
+
+    def _find(
+        self,
+        index: Dict[str, Dict[str, Any]],
+        network: str,
+        address: str,
+        options: Optional[Dict[str, Any]],
+    ) -> Optional[str]:
+        """Find the key of the entry for an address and options, if any."""
+        for key in self._keys_for(index, network, address):
+            implementation = index[key].get("implementation_address") or ""
+            if key == self._key(network, address, implementation, options):
+                return key
+        return None
+
+    def _keys_for(
+        self, index: Dict[str, Dict[str, Any]], network: str, address: str
+    ) -> List[str]:
+        """Keys of every entry for an address, whatever its implementation and options."""
+        if self._by_address is None or self._by_address[0] is not index:
+            by_address: Dict[str, List[str]] = {}
+            for key in index:
+                parts = key.split(":", 2)
+                if len(parts) == 3:
+                    by_address.setdefault(f"{parts[0]}:{parts[1]}:", []).append(key)
+            self._by_address = (index, by_address)
+        return self._by_address[1].get(f"{network.lower()}:{address.lower()}:", [])
+
+    def _is_expired(self, entry: Dict[str, Any], now: float) -> bool:
+        """Check whether an entry is past its TTL."""
+        age = now - float(entry.get("created_at", 0))
+        if entry.get("error"):
+            return age > self.negative_ttl
+        if entry.get("is_proxy"):
+            return age > self.proxy_ttl
+        return age > self.ttl
+
+    def _store(
+        self,
+        network: str,
+        address: str,
+        options: Optional[Dict[str, Any]],
+        entry: Dict[str, Any],
+    ) -> None:
+        """Insert an entry and evict least recently used ones if over capacity."""
+        index = self._load_index()
+        self._apply_access_log(index)
+        replaced = self._find(index, network, address, options)
+        if replaced is not None:
+            del index[replaced]
+        key = self._key(network, address, entry.get("implementation_address") or "", options)
+        index[key] = entry
+
+        evicted = len(index) > self.max_entries
+        if evicted:
+            by_age = sorted(index, key=lambda k: index[k].get("accessed_at", 0))
+            for stale in by_age[: len(index) - self.max_entries]:
+                del index[stale]
+        self._save_index(index)
+        # A replaced entry (e.g. a proxy upgraded to a new implementation)
+        # can leave its ABI and source blobs unreferenced too
+        if evicted or replaced is not None:
+            self._collect_garbage(index)
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """Load the index, treating a missing or corrupt file as empty.
+
+        The parsed index is reused until the file changes on disk.
+        """
+        path = self.cache_dir / self.INDEX_FILE
+        try:
+            stat = path.stat()
+            signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+            if self._loaded is not None and self._loaded[0] == signature:
+                return self._loaded[1]
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            self._loaded = None
+            return {}
+        if not isinstance(data, dict):
+            self._loaded = None
+            return {}
+        self._loaded = (signature, data)
+        return data
+
+    def _save_index(self, index: Dict[str, Dict[str, Any]]) -> None:
+        """Atomically write the index."""
+        # The index may have been changed in place; reload it next time
+        self._loaded = None
+        self._by_address = None
+        self._atomic_write(self.cache_dir / self.INDEX_FILE, json.dumps(index))
+
+    def _record_access(self, key: str, now: float) -> None:
+        """Append a cache hit to the access log (folded in on the next write)."""
+        try:
+            with open(self.cache_dir / self.ACCESS_LOG, "a", encoding="utf-8") as f:
+                f.write(json.dumps([key, now]) + "\n")
+        except OSError:
+            pass
+
+    def _apply_access_log(self, index: Dict[str, Dict[str, Any]]) -> None:
+        """Fold logged cache hits into the index's access times and drop the log."""
+        path = self.cache_dir / self.ACCESS_LOG
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+            os.unlink(path)
+        except OSError:
+            return
+
+        for line in lines:
+            try:
+                key, accessed_at = json.loads(line)
+            except (ValueError, TypeError):
+                continue  # Torn line from a concurrent writer
+            entry = index.get(key)
+            if entry is not None and accessed_at > entry.get("accessed_at", 0):
+                entry["accessed_at"] = accessed_at
+
+    def _write_blob(self, content: str) -> str:
+        """Store content under its SHA-256 digest and return the digest."""
+        digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        path = self.cache_dir / self.BLOB_DIR / digest
+        if not path.exists():
+            self._atomic_write(path, content)
+        return digest
+
+    def _read_blob(self, digest: str) -> Optional[str]:
+        """Read a blob by digest, or None if it has gone missing."""
+        try:
+            return (self.cache_dir / self.BLOB_DIR / digest).read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def _collect_garbage(self, index: Dict[str, Dict[str, Any]]) -> None:
+        """Delete blobs that are no longer referenced by any entry."""
+        blob_dir = self.cache_dir / self.BLOB_DIR
+        if not blob_dir.is_dir():
+            return
+
+        referenced = set()
+        for entry in index.values():
+            for field in ("abi", "source_code"):
+                if entry.get(field):
+                    referenced.add(entry[field])
+
+        for path in blob_dir.iterdir():
+            if path.name not in referenced and not path.name.startswith("."):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    @staticmethod
+    def _atomic_write(path: Path, content: str) -> None:
+        """Write a file via a temp file + rename so readers never see partial data."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
@@ -4,14 +4,26 @@ This module provides the EtherscanFetcher class for fetching ABIs from
 Etherscan-compatible block explorers.
 """
 
+import asyncio
 import os
 import re
 import json
-from typing import Optional, Dict, Any
+from types import TracebackType
+from typing import Any, Awaitable, Dict, List, Optional
 
 import httpx
 
+# HTTP/2 support in httpx requires the optional h2 package
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 from abi_to_mcp.fetchers.base import ABIFetcher
+from abi_to_mcp.fetchers.ratelimit import RateLimiter
+from abi_to_mcp.core.config import FetcherConfig
 from abi_to_mcp.core.models import FetchResult
 from abi_to_mcp.core.constants import NETWORKS
 from abi_to_mcp.core.exceptions import (
@@ -40,6 +52,12 @@ class EtherscanFetcher(ABIFetcher):
     - Automatic proxy detection
     - Rate limit handling
     - API key management
+    - Pooled keep-alive connections shared by all requests
+    - Per-host request pacing (``FetcherConfig.requests_per_second``)
+
+    The underlying HTTP client is created on first use and reused until
+    aclose() is called, so use the fetcher as an async context manager
+    (or close it explicitly) when done.
     """
 
     ADDRESS_PATTERN = re.compile(r"^0x[a-fA-F0-9]{40}$")
@@ -47,22 +65,91 @@ class EtherscanFetcher(ABIFetcher):
     # EIP-1967 implementation slot
     IMPLEMENTATION_SLOT = "0x360894a13ba1a3210667c828492db98dca3e2076cc3735a920a3ca505d382bbc"
 
-    def __init__(self, api_key: Optional[str] = None):
+    # EIP-1967 beacon slot (beacon exposes implementation())
+    BEACON_SLOT = "0xa3f0ad74e5423aebfd80d3ef4346578335a9a72aeaee59ff6cb3582b35133d50"
+
+    # EIP-1822 (UUPS) PROXIABLE slot
+    PROXIABLE_SLOT = "0xc5f16f0fcc639fa48a6947836d9850f504798523bf8c9a3a87d5876cf622bcf7"
+
+    # Timeout for proxy detection probes (seconds)
+    PROBE_TIMEOUT = 10.0
+
+    # Back-off when Etherscan reports a rate limit inside an HTTP 200 response
+    SOFT_RATE_LIMIT_RETRY = 1
+
+    # Requests sent at once per host: the ABI request with the first proxy
+    # probes, or the second round of probes
+    REQUEST_BURST = 3
+
+    # DELEGATECALL and CALLCODE; a contract without either cannot be a proxy
+    DELEGATING_OPCODES = frozenset({0xF2, 0xF4})
+
+    def __init__(self, api_key: Optional[str] = None, config: Optional[FetcherConfig] = None):
         """
         Initialize with optional API key.
 
         If no key provided, will check environment variables:
         - ETHERSCAN_API_KEY
         - Network-specific: POLYGONSCAN_API_KEY, etc.
+
+        Args:
+            api_key: Explicit API key for all networks
+            config: Fetcher configuration (timeouts and connection pool limits)
         """
         self._api_key = api_key
+        self._config = config or FetcherConfig()
         self._client: Optional[httpx.AsyncClient] = None
+        self._rate_limiter = RateLimiter(
+            self._config.requests_per_second, capacity=self.REQUEST_BURST
+        )
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self._config.timeout,
+                limits=httpx.Limits(
+                    max_connections=self._config.max_connections,
+                    max_keepalive_connections=self._config.max_keepalive_connections,
+                    keepalive_expiry=self._config.keepalive_expiry,
+                ),
+                http2=self._config.http2 and HTTP2_AVAILABLE,
+            )
+        return self._client
+
+    async def _get(
+        self, api_url: str, params: Dict[str, Any], timeout: Optional[float] = None
+    ) -> httpx.Response:
+        """Issue a GET request on the shared client, paced per API host."""
+        await self._rate_limiter.acquire(api_url)
+        return await self._get_client().get(
+            api_url, params=params, timeout=timeout or self._config.timeout
+        )
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "EtherscanFetcher":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """Async context manager exit."""
+        await self.aclose()
 
     async def fetch(
         self,
         source: str,
         network: str = "mainnet",
-        **kwargs,
+        **kwargs: Any,
     ) -> FetchResult:
         """
         Fetch ABI from Etherscan API.
@@ -77,8 +164,9 @@ class EtherscanFetcher(ABIFetcher):
         Raises:
             ABINotFoundError: If contract not found
             ContractNotVerifiedError: If source code not verified
-            NetworkError: If API request fails
-            RateLimitError: If rate limit exceeded
+            NetworkError: If API request fails (including a proxy probe, so
+                a proxy is never returned with its own ABI by mistake)
+            RateLimitError: If rate limit exceeded (including a proxy probe)
         """
         # Validate address
         if not self.ADDRESS_PATTERN.match(source):
@@ -94,25 +182,38 @@ class EtherscanFetcher(ABIFetcher):
         api_url = net_config["etherscan_api"]
         api_key = self._get_api_key(network)
 
-        # Fetch ABI
-        abi_data = await self._fetch_abi(api_url, address, api_key, network)
+        # Fetch ABI, probing for a proxy concurrently so that non-proxies
+        # cost a single round trip
+        abi_task = asyncio.ensure_future(self._fetch_abi(api_url, address, api_key, network))
+        proxy_task = None
+        if kwargs.get("detect_proxy", True):
+            proxy_task = asyncio.ensure_future(
+                self._detect_proxy(address, network, api_url, api_key)
+            )
 
-        if abi_data is None:
-            raise ContractNotVerifiedError(address, network)
+        try:
+            abi_data = await abi_task
+            if abi_data is None:
+                raise ContractNotVerifiedError(address, network)
+            impl = await proxy_task if proxy_task is not None else None
+        finally:
+            if proxy_task is not None:
+                if not proxy_task.done():
+                    proxy_task.cancel()
+                elif not proxy_task.cancelled():
+                    proxy_task.exception()  # Retrieved; the ABI error wins
 
         # Check for proxy
         is_proxy = False
         implementation_address = None
 
-        if kwargs.get("detect_proxy", True):
-            impl = await self._detect_proxy(address, network, api_url, api_key)
-            if impl:
-                is_proxy = True
-                implementation_address = impl
-                # Fetch implementation ABI instead
-                impl_abi = await self._fetch_abi(api_url, impl, api_key, network)
-                if impl_abi:
-                    abi_data = impl_abi
+        if impl:
+            is_proxy = True
+            implementation_address = impl
+            # Fetch implementation ABI instead
+            impl_abi = await self._fetch_abi(api_url, impl, api_key, network)
+            if impl_abi:
+                abi_data = impl_abi
 
         return FetchResult(
             abi=json.loads(abi_data),
@@ -178,35 +279,93 @@ class EtherscanFetcher(ABIFetcher):
         if api_key:
             params["apikey"] = api_key
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(api_url, params=params, timeout=30.0)
-                response.raise_for_status()
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 429:
-                    raise RateLimitError("Etherscan", retry_after=60) from e
-                raise NetworkError(
-                    f"HTTP error fetching ABI: {e}", url=api_url, status_code=e.response.status_code
-                ) from e
-            except httpx.TimeoutException as e:
-                raise NetworkError(f"Timeout fetching ABI from {network}", url=api_url) from e
-            except httpx.RequestError as e:
-                raise NetworkError(f"Request failed: {e}", url=api_url) from e
-
-            data = response.json()
-
-            if data.get("status") == "1":
-                return data.get("result")
-
-            # Check for specific errors
-            result = data.get("result", "")
-
-            if "not verified" in result.lower() or "source code not verified" in result.lower():
-                return None
-
-            # Other error
+        data = await self._request(api_url, params, f"fetching ABI from {network}")
+
+        if data.get("status") == "1":
+            return data.get("result")
+
+        # Check for specific errors
+        result = data.get("result", "")
+
+        if "not verified" in result.lower() or "source code not verified" in result.lower():
             return None
 
+        # Other error
+        return None
+
+    async def _request(
+        self,
+        api_url: str,
+        params: Dict[str, Any],
+        action: str,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Issue an API request and return its JSON body.
+
+        Args:
+            api_url: Etherscan API base URL
+            params: Query parameters
+            action: What the request does, for error messages
+            timeout: Request timeout (default: the configured timeout)
+
+        Raises:
+            RateLimitError: On HTTP 429 or an HTTP 200 "rate limit" answer
+            NetworkError: If the request fails or the body is not JSON
+        """
+        try:
+            response = await self._get(api_url, params, timeout=timeout)
+            response.raise_for_status()
+            data: Dict[str, Any] = response.json()
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 429:
+                self._rate_limiter.pause(api_url, 60)
+                raise RateLimitError("Etherscan", retry_after=60) from e
+            raise NetworkError(
+                f"HTTP error {action}: {e}", url=api_url, status_code=e.response.status_code
+            ) from e
+        except httpx.TimeoutException as e:
+            raise NetworkError(f"Timeout {action}", url=api_url) from e
+        except httpx.RequestError as e:
+            raise NetworkError(f"Request failed: {e}", url=api_url) from e
+        except ValueError as e:
+            raise NetworkError(f"Invalid JSON response {action}", url=api_url) from e
+
+        # Etherscan reports rate limiting with HTTP 200 and status "0"
+        result = data.get("result")
+        if data.get("status") == "0" and isinstance(result, str) and "rate limit" in result.lower():
+            self._rate_limiter.pause(api_url, self.SOFT_RATE_LIMIT_RETRY)
+            raise RateLimitError("Etherscan", retry_after=self.SOFT_RATE_LIMIT_RETRY)
+
+        return data
+
+    async def _proxy_call(
+        self, api_url: str, params: Dict[str, Any], api_key: Optional[str]
+    ) -> Optional[str]:
+        """
+        Make a JSON-RPC call through Etherscan's proxy module.
+
+        Returns:
+            The call's result, or None if the node answered with an error
+            (such as a reverted eth_call)
+
+        Raises:
+            RateLimitError: If rate limited
+            NetworkError: If the request failed or Etherscan rejected it
+        """
+        if api_key:
+            params["apikey"] = api_key
+
+        data = await self._request(
+            api_url, params, f"probing {params['action']}", timeout=self.PROBE_TIMEOUT
+        )
+        if data.get("status") == "0":
+            raise NetworkError(f"Etherscan rejected {params['action']}: {data.get('result')}")
+        if "error" in data:
+            return None
+        result = data.get("result")
+        return result if isinstance(result, str) else None
+
     async def _detect_proxy(
         self,
         address: str,
@@ -217,11 +376,21 @@ class EtherscanFetcher(ABIFetcher):
         """
         Detect if address is a proxy and return implementation.
 
-        Checks for common proxy patterns:
-        - EIP-1967 storage slots
-        - EIP-1822 (UUPS)
-        - OpenZeppelin TransparentProxy
-        - Minimal proxy (EIP-1167)
+        Checks for common proxy patterns, in priority order:
+        - EIP-1967 implementation slot (OpenZeppelin TransparentProxy)
+        - EIP-1967 beacon slot
+        - EIP-1822 (UUPS) PROXIABLE slot
+        - implementation() function
+        - Minimal proxy (EIP-1167) bytecode
+
+        The implementation slot and the bytecode are fetched first, together.
+        Minimal proxies are recognized from the bytecode, and bytecode without
+        DELEGATECALL cannot belong to a proxy, so plain contracts cost two
+        probes; only contracts that may delegate are probed for the remaining
+        patterns, again concurrently. The
+        highest-priority positive answer wins. A probe that fails before a
+        higher-priority one answered positively fails the detection, so a
+        throttled or failed probe is never taken to mean "not a proxy".
 
         Args:
             address: Proxy contract address
@@ -231,26 +400,71 @@ class EtherscanFetcher(ABIFetcher):
 
         Returns:
             Implementation address if proxy, None otherwise
+
+        Raises:
+            RateLimitError: If a probe was rate limited
+            NetworkError: If a probe failed
         """
-        # Try EIP-1967 implementation slot using Etherscan proxy API
-        impl = await self._get_storage_at(api_url, address, self.IMPLEMENTATION_SLOT, api_key)
-        if impl and impl != "0x" + "0" * 64 and len(impl) >= 42:
-            # Extract address from bytes32 (last 20 bytes = 40 hex chars)
-            impl_addr = "0x" + impl[-40:]
-            if self._is_valid_address(impl_addr) and impl_addr != "0x" + "0" * 40:
-                return impl_addr
+        slot_impl, code = await self._first_answers(
+            self._get_slot_address(api_url, address, self.IMPLEMENTATION_SLOT, api_key),
+            self._get_code(api_url, address, api_key),
+        )
+        if slot_impl:
+            return slot_impl
+        code = code or "0x"
+        # EIP-1167 bytecode only forwards calls, so nothing else can match
+        minimal_impl = self._minimal_proxy_target(code)
+        if minimal_impl or not self._may_delegate(code):
+            return minimal_impl
+
+        beacon_impl, uups_impl, call_impl = await self._first_answers(
+            self._get_beacon_implementation(api_url, address, api_key),
+            self._get_slot_address(api_url, address, self.PROXIABLE_SLOT, api_key),
+            self._call_implementation_function(api_url, address, api_key),
+        )
+        return beacon_impl or uups_impl or call_impl
 
-        # Try calling implementation() function
-        impl = await self._call_implementation_function(api_url, address, api_key)
-        if impl:
-            return impl
+    @staticmethod
+    async def _first_answers(*probes: Awaitable[Optional[str]]) -> List[Optional[str]]:
+        """
+        Run probes concurrently and collect their answers in priority order.
 
-        # Try detecting EIP-1167 minimal proxy from bytecode
-        impl = await self._detect_minimal_proxy(api_url, address, api_key)
-        if impl:
-            return impl
+        Answers after the first positive one are left as None and their
+        probes cancelled. Every probe is awaited before returning, so no
+        exception goes unretrieved.
 
-        return None
+        Raises:
+            Exception: The error of a probe that failed before a
+                higher-priority probe answered positively
+        """
+        tasks = [asyncio.ensure_future(probe) for probe in probes]
+        answers: List[Optional[str]] = [None] * len(tasks)
+        try:
+            for i, task in enumerate(tasks):
+                answers[i] = await task
+                if answers[i]:
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return answers
+
+    async def _get_slot_address(
+        self, api_url: str, address: str, slot: str, api_key: Optional[str]
+    ) -> Optional[str]:
+        """Read a storage slot and decode it as an address."""
+        value = await self._get_storage_at(api_url, address, slot, api_key)
+        return self._word_to_address(value)
+
+    async def _get_beacon_implementation(
+        self, api_url: str, address: str, api_key: Optional[str]
+    ) -> Optional[str]:
+        """Resolve an EIP-1967 beacon proxy via the beacon's implementation()."""
+        beacon = await self._get_slot_address(api_url, address, self.BEACON_SLOT, api_key)
+        if beacon is None:
+            return None
+        return await self._call_implementation_function(api_url, beacon, api_key)
 
     async def _get_storage_at(
         self, api_url: str, address: str, slot: str, api_key: Optional[str]
@@ -263,19 +477,7 @@ class EtherscanFetcher(ABIFetcher):
             "position": slot,
             "tag": "latest",
         }
-        if api_key:
-            params["apikey"] = api_key
-
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(api_url, params=params, timeout=10.0)
-                data = response.json()
-                if data.get("result"):
-                    return data["result"]
-        except Exception:
-            pass
-
-        return None
+        return await self._proxy_call(api_url, params, api_key)
 
     async def _call_implementation_function(
         self, api_url: str, address: str, api_key: Optional[str]
@@ -289,49 +491,52 @@ class EtherscanFetcher(ABIFetcher):
             "data": "0x5c60da1b",
             "tag": "latest",
         }
-        if api_key:
-            params["apikey"] = api_key
-
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(api_url, params=params, timeout=10.0)
-                result = response.json().get("result")
-
-                if result and result != "0x" and len(result) >= 42:
-                    impl_addr = "0x" + result[-40:]
-                    if self._is_valid_address(impl_addr) and impl_addr != "0x" + "0" * 40:
-                        return impl_addr
-        except Exception:
-            pass
+        return self._word_to_address(await self._proxy_call(api_url, params, api_key))
 
-        return None
-
-    async def _detect_minimal_proxy(
-        self, api_url: str, address: str, api_key: Optional[str]
-    ) -> Optional[str]:
-        """Detect EIP-1167 minimal proxy and extract implementation."""
+    async def _get_code(self, api_url: str, address: str, api_key: Optional[str]) -> str:
+        """Get the runtime bytecode of an address ("0x" if it has none)."""
         params = {
             "module": "proxy",
             "action": "eth_getCode",
             "address": address,
             "tag": "latest",
         }
-        if api_key:
-            params["apikey"] = api_key
+        return await self._proxy_call(api_url, params, api_key) or "0x"
+
+    def _minimal_proxy_target(self, code: str) -> Optional[str]:
+        """Extract the implementation of an EIP-1167 minimal proxy from its bytecode."""
+        # EIP-1167 pattern: 0x363d3d373d3d3d363d73[20-byte-address]5af43d82803e903d91602b57fd5bf3
+        if len(code) >= 44 and code.startswith("0x363d3d373d3d3d363d73"):
+            impl_addr = "0x" + code[22:62]
+            if self._is_valid_address(impl_addr):
+                return impl_addr
 
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(api_url, params=params, timeout=10.0)
-                code = response.json().get("result", "")
-
-                # EIP-1167 pattern: 0x363d3d373d3d3d363d73[20-byte-address]5af43d82803e903d91602b57fd5bf3
-                if len(code) >= 44 and code.startswith("0x363d3d373d3d3d363d73"):
-                    impl_addr = "0x" + code[22:62]
-                    if self._is_valid_address(impl_addr):
-                        return impl_addr
-        except Exception:
-            pass
+        return None
 
+    def _may_delegate(self, code: str) -> bool:
+        """Check whether bytecode contains a DELEGATECALL or CALLCODE instruction."""
+        try:
+            ops = bytes.fromhex(code[2:])
+        except ValueError:
+            return True  # Unreadable bytecode: probe everything
+        i = 0
+        while i < len(ops):
+            op = ops[i]
+            if op in self.DELEGATING_OPCODES:
+                return True
+            # Skip the immediate data of PUSH1..PUSH32
+            if 0x60 <= op <= 0x7F:
+                i += op - 0x5F
+            i += 1
+        return False
+
+    def _word_to_address(self, value: Optional[str]) -> Optional[str]:
+        """Extract a non-zero address from a 32-byte hex word (last 20 bytes)."""
+        if not value or value == "0x" or len(value) < 42:
+            return None
+        impl_addr = "0x" + value[-40:]
+        if self._is_valid_address(impl_addr) and impl_addr != "0x" + "0" * 40:
+            return impl_addr
         return None
 
     def _is_valid_address(self, address: str) -> bool:
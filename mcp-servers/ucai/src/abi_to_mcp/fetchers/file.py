@@ -6,12 +6,36 @@ AGENT 2: This file needs full implementation. See AGENTS.md for requirements.
 """
 
 import json
+from itertools import chain
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 
 from abi_to_mcp.fetchers.base import ABIFetcher
 from abi_to_mcp.core.models import FetchResult
-from abi_to_mcp.core.exceptions import ABINotFoundError, ABIParseError
+from abi_to_mcp.core.exceptions import ABIToMCPError, ABINotFoundError, ABIParseError
+from abi_to_mcp.utils.json_stream import iter_json_paths
+from abi_to_mcp.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Bytes read from artifact files at a time
+CHUNK_SIZE = 1 << 16
+
+# Artifact keys that are read; bytecode, ASTs and sources are skipped
+ARTIFACT_PATHS = [
+    ("abi",),
+    ("contractName",),
+    ("name",),
+    ("compiler",),
+    ("solcVersion",),
+    ("metadata",),
+]
+
+# Contract ABIs in build-info files: output.contracts.<source file>.<contract>.abi
+BUILD_INFO_ABI_PATH = ("output", "contracts", "*", "*", "abi")
+
+# A contract in a build-info file: (source file, contract name, ABI)
+BuildInfoContract = Tuple[str, str, List[Dict[str, Any]]]
 
 
 class FileFetcher(ABIFetcher):
@@ -22,14 +46,20 @@ class FileFetcher(ABIFetcher):
     - Plain ABI array: [{"type": "function", ...}]
     - Truffle/Hardhat artifact: {"abi": [...], "contractName": "..."}
     - Foundry output: {"abi": [...]}
+    - Hardhat/Foundry build-info: {"output": {"contracts": {...}}, ...}
+
+    Artifacts are streamed: only the keys above are decoded, so large
+    build-info files are read without loading their sources and ASTs.
     """
 
-    async def fetch(self, source: str, **kwargs) -> FetchResult:
+    async def fetch(self, source: str, contract_name: Optional[str] = None, **kwargs) -> FetchResult:
         """
         Load ABI from local file.
 
         Args:
             source: Path to JSON file
+            contract_name: Contract to use from a build-info file that
+                holds several ("Name" or "path/File.sol:Name")
 
         Returns:
             FetchResult with ABI data
@@ -42,13 +72,10 @@ class FileFetcher(ABIFetcher):
         if not path.is_file():
             raise ABINotFoundError(source, f"Not a file: {path}")
 
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        except json.JSONDecodeError as e:
-            raise ABIParseError(f"Invalid JSON in {path}: {e}", entry_type="file") from e
-        except Exception as e:
-            raise ABINotFoundError(source, f"Failed to read file: {e}") from e
+        data, contracts = self._read(path, source)
+
+        if contracts:
+            return self._select_contract(contracts, data, path, contract_name)
 
         # Extract ABI from various formats
         abi, contract_name, compiler_version = self._extract_abi(data, str(path))
@@ -61,6 +88,55 @@ class FileFetcher(ABIFetcher):
             compiler_version=compiler_version,
         )
 
+    def iter_contracts(self, directory: str) -> Iterator[FetchResult]:
+        """
+        Enumerate every contract with an ABI in a build directory.
+
+        Accepts a Foundry ``out/`` directory, a Hardhat ``artifacts/``
+        directory, a ``build-info`` directory or a directory of ABI files.
+        Each file is streamed once. Artifacts describe the same contracts
+        as the build-info files next to them, so build-info files are only
+        read when there are no artifacts. Hardhat ``.dbg.json`` files,
+        contracts with an empty ABI and files that are not ABIs are skipped.
+
+        Args:
+            directory: Build output directory
+
+        Yields:
+            FetchResult per contract, in path order
+
+        Raises:
+            ABINotFoundError: If the directory does not exist
+        """
+        root = Path(directory).expanduser().resolve()
+        if not root.is_dir():
+            raise ABINotFoundError(str(directory), f"Not a directory: {root}")
+
+        files = sorted(p for p in root.rglob("*.json") if not p.name.endswith(".dbg.json"))
+        artifacts = [p for p in files if p.parent.name != "build-info"]
+
+        for path in artifacts or files:
+            try:
+                data, contracts = self._read(path, str(path))
+                if not contracts:
+                    abi, contract_name, compiler_version = self._extract_abi(data, str(path))
+            except ABIToMCPError as e:
+                logger.debug(f"Skipping {path}: {e}")
+                continue
+
+            if contracts:
+                for source_file, name, abi in contracts:
+                    yield self._build_info_result(data, path, source_file, name, abi)
+                continue
+
+            yield FetchResult(
+                abi=abi,
+                source="file",
+                source_location=str(path),
+                contract_name=contract_name or path.stem,
+                compiler_version=compiler_version,
+            )
+
     def can_handle(self, source: str) -> bool:
         """Check if source is a local file path."""
         # Check for common file path patterns
@@ -87,6 +163,84 @@ class FileFetcher(ABIFetcher):
 
         return False
 
+    def _read(self, path: Path, source: str) -> Tuple[Any, List[BuildInfoContract]]:
+        """
+        Read the parts of an ABI file that are needed.
+
+        Plain ABI arrays are loaded whole. For objects, only the artifact
+        keys and build-info contract ABIs are decoded.
+
+        Returns:
+            Tuple of (ABI array or dict of artifact keys, build-info contracts
+            with a non-empty ABI)
+        """
+        try:
+            with open(path, "rb") as f:
+                head = f.read(CHUNK_SIZE)
+                if head.lstrip()[:1] == b"[":
+                    return json.loads(head + f.read()), []
+
+                chunks = iter(lambda: f.read(CHUNK_SIZE), b"")
+                data: Dict[str, Any] = {}
+                contracts: List[BuildInfoContract] = []
+                for key, value in iter_json_paths(
+                    chain([head], chunks), ARTIFACT_PATHS + [BUILD_INFO_ABI_PATH]
+                ):
+                    if len(key) == 1:
+                        data[key[0]] = value
+                    elif isinstance(value, list) and value:
+                        contracts.append((key[2], key[3], value))
+                return data, contracts
+        except ValueError as e:
+            raise ABIParseError(f"Invalid JSON in {path}: {e}", entry_type="file") from e
+        except Exception as e:
+            raise ABINotFoundError(source, f"Failed to read file: {e}") from e
+
+    def _select_contract(
+        self,
+        contracts: List[BuildInfoContract],
+        data: Dict[str, Any],
+        path: Path,
+        contract_name: Optional[str],
+    ) -> FetchResult:
+        """Pick one contract of a build-info file."""
+        matches = contracts
+        if contract_name:
+            matches = [
+                c for c in contracts if contract_name in (c[1], f"{c[0]}:{c[1]}")
+            ]
+        if len(matches) != 1:
+            names = ", ".join(f"{c[0]}:{c[1]}" for c in matches or contracts)
+            if not contract_name:
+                problem = f"has {len(contracts)} contracts"
+            elif matches:
+                problem = f"has {len(matches)} contracts named {contract_name}"
+            else:
+                problem = f"has no contract named {contract_name}"
+            raise ABIParseError(
+                f"Build-info file {path} {problem} ({names}); "
+                "select one with contract_name",
+                entry_type="file",
+            )
+        return self._build_info_result(data, path, *matches[0])
+
+    def _build_info_result(
+        self,
+        data: Dict[str, Any],
+        path: Path,
+        source_file: str,
+        name: str,
+        abi: List[Dict[str, Any]],
+    ) -> FetchResult:
+        """FetchResult for one contract of a build-info file."""
+        return FetchResult(
+            abi=abi,
+            source="file",
+            source_location=f"{path}:{source_file}:{name}",
+            contract_name=name,
+            compiler_version=data.get("solcVersion"),
+        )
+
     def _extract_abi(self, data: Any, source_location: str = "memory") -> tuple:
         """
         Extract ABI from various file formats.
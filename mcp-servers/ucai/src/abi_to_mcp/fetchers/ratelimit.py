@@ -0,0 +1,107 @@
+"""Rate limiting module.
+
+This module provides token buckets used to pace requests to block explorer
+APIs, which enforce per-key request rates (5 req/s on the Etherscan free tier).
+"""
+
+import asyncio
+import time
+from typing import Dict
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """
+    Async token bucket.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``;
+    each acquire() takes one token, waiting until one is available.
+
+    Example:
+        >>> bucket = TokenBucket(rate=5.0)
+        >>> await bucket.acquire()
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """
+        Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second (<= 0 disables limiting)
+            capacity: Maximum burst size
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait for and consume one token."""
+        if self.rate <= 0:
+            return
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        """
+        Stop handing out tokens for a while (e.g. after a rate limit response).
+
+        Args:
+            seconds: How long to pause from now
+        """
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+        self._tokens = 0.0
+
+
+class RateLimiter:
+    """
+    Per-host collection of token buckets.
+
+    Each explorer API host (api.etherscan.io, api.polygonscan.com, ...) has
+    its own limit, so requests are paced per host rather than globally.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate: Requests per second allowed per host
+            capacity: Maximum burst size per host
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def bucket(self, url: str) -> TokenBucket:
+        """Get the bucket for a URL's host, creating it on first use."""
+        host = urlparse(url).netloc or url
+        if host not in self._buckets:
+            self._buckets[host] = TokenBucket(self.rate, self.capacity)
+        return self._buckets[host]
+
+    async def acquire(self, url: str) -> None:
+        """Wait for a request slot on the URL's host."""
+        await self.bucket(url).acquire()
+
+    def pause(self, url: str, seconds: float) -> None:
+        """Pause requests to the URL's host."""
+        self.bucket(url).pause(seconds)
@@ -3,22 +3,78 @@
 AGENT 2: This file needs full implementation. See AGENTS.md for requirements.
 """
 
-from typing import List, Optional, Dict, Any
+import asyncio
+import time
+from types import TracebackType
+from typing import List, Optional, Dict, Any, AsyncIterator, Iterable, Tuple
 from abi_to_mcp.fetchers.base import ABIFetcher
-from abi_to_mcp.core.models import FetchResult
-from abi_to_mcp.core.exceptions import ABINotFoundError
+from abi_to_mcp.fetchers.cache import ABICache
+from abi_to_mcp.core.config import FetcherConfig
+from abi_to_mcp.core.models import FetchResult, BatchFetchResult
+from abi_to_mcp.core.exceptions import (
+    ABINotFoundError,
+    ContractNotVerifiedError,
+    NetworkError,
+    RateLimitError,
+)
+from abi_to_mcp.utils.logging import get_logger
+
+logger = get_logger(__name__)
 
 
 class FetcherRegistry:
-    """Registry that selects appropriate fetcher for a source."""
+    """
+    Registry that selects appropriate fetcher for a source.
+
+    Address lookups use sequential fallback by default: the first matching
+    fetcher is tried, and the others only after it fails. With a
+    ``hedge_delay``, lookups are hedged instead: fetchers are started in
+    order of observed latency, the next one is started whenever the running
+    ones have not answered within ``hedge_delay`` seconds (or one fails), and
+    the first successful result wins.
+    """
+
+    # Weight of the newest sample in the per-source latency average
+    LATENCY_ALPHA = 0.3
 
-    def __init__(self):
+    def __init__(self, cache: Optional[ABICache] = None, hedge_delay: Optional[float] = None):
+        """
+        Initialize the registry.
+
+        Args:
+            cache: Optional ABI cache for address lookups
+            hedge_delay: Seconds before starting the next fetcher for an
+                address (0 starts all at once; None disables hedging)
+        """
         self.fetchers: List[ABIFetcher] = []
+        self.cache = cache
+        self.hedge_delay = hedge_delay
+        self.latency: Dict[str, float] = {}
 
     def register(self, fetcher: ABIFetcher) -> None:
         """Register a fetcher."""
         self.fetchers.append(fetcher)
 
+    async def aclose(self) -> None:
+        """Close network resources (HTTP clients) held by registered fetchers."""
+        for fetcher in self.fetchers:
+            close = getattr(fetcher, "aclose", None)
+            if close is not None:
+                await close()
+
+    async def __aenter__(self) -> "FetcherRegistry":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """Async context manager exit."""
+        await self.aclose()
+
     def get_fetcher(self, source: str) -> Optional[ABIFetcher]:
         """Get first fetcher that can handle the source."""
         for fetcher in self.fetchers:
@@ -26,20 +82,112 @@ class FetcherRegistry:
                 return fetcher
         return None
 
-    async def fetch(self, source: str, **kwargs) -> FetchResult:
+    async def fetch(self, source: str, refresh: bool = False, **kwargs: Any) -> FetchResult:
         """
         Fetch from appropriate source with fallback.
 
+        Contract addresses are served from the cache when one is configured;
+        local files are always read fresh. Only a definite answer (no
+        fetcher has a verified ABI) is cached as negative; rate limits and
+        network failures are raised without being cached.
+
         Args:
             source: Source identifier
+            refresh: Bypass cached results (the fresh result is still stored)
             **kwargs: Additional fetch options
 
         Returns:
             FetchResult from successful fetcher
 
         Raises:
-            ABINotFoundError: If no fetcher can retrieve the ABI
+            ABINotFoundError: If no fetcher has the ABI
+            RateLimitError: If a fetcher was rate limited and none succeeded
+            NetworkError: If a fetcher failed for another reason and none succeeded
+        """
+        if self.cache is None or not self._is_address(source):
+            return await self._fetch_uncached(source, **kwargs)
+
+        network = kwargs.get("network") or (
+            f"chain-{kwargs['chain_id']}" if "chain_id" in kwargs else "mainnet"
+        )
+
+        # Options that change the result (include_source, ...) are part of the key
+        options = {k: v for k, v in kwargs.items() if k not in ("network", "chain_id")}
+
+        if not refresh:
+            cached = self.cache.get(network, source, options)
+            if cached is not None:
+                return cached
+
+        try:
+            result = await self._fetch_uncached(source, **kwargs)
+        except (ABINotFoundError, ContractNotVerifiedError) as e:
+            self.cache.put_negative(network, source, e, options)
+            raise
+
+        self.cache.put(network, source, result, options)
+        return result
+
+    async def fetch_many(
+        self,
+        targets: Iterable[Tuple[str, str]],
+        concurrency: int = 4,
+        max_retries: int = 3,
+        **kwargs: Any,
+    ) -> AsyncIterator[BatchFetchResult]:
+        """
+        Fetch many contract ABIs concurrently.
+
+        Request pacing is left to the fetchers (EtherscanFetcher applies a
+        per-host token bucket); this method bounds the number of in-flight
+        lookups and backs off when a fetcher reports a rate limit.
+
+        Args:
+            targets: (network, address) pairs
+            concurrency: Maximum number of lookups in flight
+            max_retries: Retries per address after a RateLimitError
+            **kwargs: Additional fetch options passed to fetch()
+
+        Yields:
+            BatchFetchResult for each target, in completion order
         """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch_one(network: str, address: str) -> BatchFetchResult:
+            attempt = 0
+            while True:
+                try:
+                    async with semaphore:
+                        result = await self.fetch(address, network=network, **kwargs)
+                    return BatchFetchResult(network=network, address=address, result=result)
+                except RateLimitError as e:
+                    if attempt >= max_retries:
+                        return BatchFetchResult(network=network, address=address, error=e)
+                    attempt += 1
+                    delay = e.retry_after or 1
+                    logger.debug(f"Rate limited fetching {address}, retrying in {delay}s")
+                    await asyncio.sleep(delay)
+                except Exception as e:
+                    return BatchFetchResult(network=network, address=address, error=e)
+
+        tasks = [asyncio.ensure_future(fetch_one(network, address)) for network, address in targets]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    @staticmethod
+    def _is_address(source: str) -> bool:
+        """Check if the source looks like a contract address."""
+        return source.startswith("0x") and len(source) == 42
+
+    async def _fetch_uncached(self, source: str, **kwargs: Any) -> FetchResult:
+        """Fetch from the fetchers themselves, bypassing the cache."""
+        if self.hedge_delay is not None and self._is_address(source):
+            return await self._fetch_hedged(source, **kwargs)
+
         # Try fetcher that can handle the source
         fetcher = self.get_fetcher(source)
         if fetcher:
@@ -47,14 +195,15 @@ class FetcherRegistry:
                 return await fetcher.fetch(source, **kwargs)
             except ABINotFoundError:
                 # For addresses, try fallback fetchers
-                if source.startswith("0x") and len(source) == 42:
+                if self._is_address(source):
                     pass  # Continue to fallback
                 else:
                     raise
 
         # For Ethereum addresses, try all address-based fetchers as fallback
-        if source.startswith("0x") and len(source) == 42:
+        if self._is_address(source):
             errors = []
+            transient: List[Exception] = []
             for fetcher in self.fetchers:
                 if fetcher.can_handle(source):
                     try:
@@ -63,26 +212,144 @@ class FetcherRegistry:
                         errors.append(f"{fetcher.__class__.__name__}: {e.reason}")
                     except Exception as e:
                         errors.append(f"{fetcher.__class__.__name__}: {str(e)}")
+                        if not isinstance(e, ContractNotVerifiedError):
+                            transient.append(e)
 
             if errors:
-                raise ABINotFoundError(source, f"All fetchers failed. Errors: {'; '.join(errors)}")
+                raise self._all_failed(source, errors, transient)
 
         raise ABINotFoundError(source, "No fetcher can handle this source")
 
+    async def _fetch_hedged(self, source: str, **kwargs: Any) -> FetchResult:
+        """Race address-capable fetchers, returning the first success."""
+        queue = sorted(
+            (f for f in self.fetchers if f.can_handle(source)),
+            key=lambda f: self.latency.get(self._source_name(f), 0.0),
+        )
+        if not queue:
+            raise ABINotFoundError(source, "No fetcher can handle this source")
+
+        pending: Dict[asyncio.Future[FetchResult], Tuple[ABIFetcher, float]] = {}
+        errors: List[str] = []
+        transient: List[Exception] = []
+
+        def launch() -> None:
+            fetcher = queue.pop(0)
+            task = asyncio.ensure_future(fetcher.fetch(source, **kwargs))
+            pending[task] = (fetcher, time.monotonic())
+
+        launch()
+        try:
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending,
+                    timeout=self.hedge_delay if queue else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    # Nobody answered in time: hedge with the next fetcher
+                    launch()
+                    continue
+
+                for task in done:
+                    fetcher, started = pending.pop(task)
+                    name = self._source_name(fetcher)
+                    self._record_latency(name, time.monotonic() - started)
+                    try:
+                        return task.result()
+                    except ABINotFoundError as e:
+                        errors.append(f"{name}: {e.reason}")
+                    except Exception as e:
+                        errors.append(f"{name}: {str(e)}")
+                        if not isinstance(e, ContractNotVerifiedError):
+                            transient.append(e)
 
-def create_default_registry(api_keys: Optional[Dict[str, str]] = None) -> FetcherRegistry:
-    """Create registry with all default fetchers."""
+                # A failure frees a slot: start the next fetcher right away
+                if queue:
+                    launch()
+        finally:
+            for task, (fetcher, started) in pending.items():
+                task.cancel()
+                # Losers took at least this long; only ever slow them down
+                name = self._source_name(fetcher)
+                elapsed = time.monotonic() - started
+                if elapsed > self.latency.get(name, 0.0):
+                    self._record_latency(name, elapsed)
+            # Retrieve the outcome of every loser, including ones that
+            # finished alongside the winner
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        raise self._all_failed(source, errors, transient)
+
+    @staticmethod
+    def _all_failed(source: str, errors: List[str], transient: List[Exception]) -> Exception:
+        """
+        Error for a lookup that no fetcher answered.
+
+        Only when every fetcher said the ABI does not exist is the result
+        ABINotFoundError (which the cache remembers). Otherwise a rate limit
+        is raised so callers back off and retry, and other failures become a
+        NetworkError.
+        """
+        reason = f"All fetchers failed. Errors: {'; '.join(errors)}"
+        if not transient:
+            return ABINotFoundError(source, reason)
+        for error in transient:
+            if isinstance(error, RateLimitError):
+                return error
+        return NetworkError(f"Could not fetch {source}: {reason}")
+
+    @staticmethod
+    def _source_name(fetcher: ABIFetcher) -> str:
+        """Name used to track a fetcher's latency."""
+        return fetcher.__class__.__name__
+
+    def _record_latency(self, name: str, elapsed: float) -> None:
+        """Fold a latency sample into the source's moving average."""
+        previous = self.latency.get(name)
+        if previous is None:
+            self.latency[name] = elapsed
+        else:
+            self.latency[name] = previous + self.LATENCY_ALPHA * (elapsed - previous)
+
+
+def create_default_registry(
+    api_keys: Optional[Dict[str, str]] = None,
+    config: Optional[FetcherConfig] = None,
+) -> FetcherRegistry:
+    """
+    Create registry with all default fetchers.
+
+    Args:
+        api_keys: Optional API keys by service (e.g. {"etherscan": "..."})
+        config: Fetcher configuration; when given with caching enabled, the
+            registry is backed by an on-disk ABICache in ``config.cache_dir``,
+            and address lookups are hedged after ``config.hedge_delay``
+    """
     from abi_to_mcp.fetchers.file import FileFetcher
     from abi_to_mcp.fetchers.etherscan import EtherscanFetcher
     from abi_to_mcp.fetchers.sourcify import SourcifyFetcher
 
-    registry = FetcherRegistry()
+    cache = None
+    if config is not None and config.cache_enabled:
+        cache = ABICache(
+            config.cache_dir,
+            negative_ttl=config.cache_negative_ttl,
+            proxy_ttl=config.cache_proxy_ttl,
+            max_entries=config.cache_max_entries,
+            ttl=config.cache_ttl,
+        )
+
+    registry = FetcherRegistry(
+        cache=cache,
+        hedge_delay=config.hedge_delay if config is not None else None,
+    )
 
     # Order matters - file first, then etherscan, then sourcify
     registry.register(FileFetcher())
 
     etherscan_key = (api_keys or {}).get("etherscan")
-    registry.register(EtherscanFetcher(api_key=etherscan_key))
+    registry.register(EtherscanFetcher(api_key=etherscan_key, config=config))
 
     registry.register(SourcifyFetcher())
 
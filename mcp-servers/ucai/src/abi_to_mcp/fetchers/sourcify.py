@@ -3,6 +3,7 @@
 This module handles fetching ABIs from Sourcify.
 """
 
+import asyncio
 import json
 import re
 from typing import Optional, Dict, Any, List
@@ -16,6 +17,10 @@ from abi_to_mcp.fetchers.base import ABIFetcher
 from abi_to_mcp.core.models import FetchResult
 from abi_to_mcp.core.constants import NETWORKS
 from abi_to_mcp.core.exceptions import ABINotFoundError, NetworkError, InvalidAddressError
+from abi_to_mcp.utils.json_stream import aiter_json_items
+from abi_to_mcp.utils.logging import get_logger
+
+logger = get_logger(__name__)
 
 
 class SourcifyFetcher(ABIFetcher):
@@ -23,11 +28,19 @@ class SourcifyFetcher(ABIFetcher):
     Fetch ABI from Sourcify.
 
     Sourcify is a decentralized source code verification service.
+
+    By default only the ABI and compilation metadata are requested from the
+    v2 contract endpoint. Source files are downloaded (from the legacy files
+    endpoints, streamed item by item) only when ``include_source=True`` is
+    passed, or when the v2 endpoint is unavailable.
     """
 
     SOURCIFY_API = "https://sourcify.dev/server"
     ADDRESS_PATTERN = re.compile(r"^0x[a-fA-F0-9]{40}$")
 
+    # Legacy match types, in order of preference
+    MATCH_TYPES = ("full_match", "partial_match")
+
     def __init__(self):
         """Initialize Sourcify fetcher."""
         if httpx is None:
@@ -38,7 +51,13 @@ class SourcifyFetcher(ABIFetcher):
         self.client = httpx.AsyncClient(timeout=30.0)
 
     async def fetch(
-        self, source: str, chain_id: int = 1, network: Optional[str] = None, **kwargs
+        self,
+        source: str,
+        chain_id: int = 1,
+        network: Optional[str] = None,
+        include_source: bool = False,
+        source_code: Optional[bool] = None,
+        **kwargs,
     ) -> FetchResult:
         """
         Fetch ABI from Sourcify.
@@ -47,34 +66,41 @@ class SourcifyFetcher(ABIFetcher):
             source: Contract address
             chain_id: Chain ID (default: 1)
             network: Network name (optional)
+            include_source: Also download the contract source code
+            source_code: Alias for ``include_source``
 
         Returns:
             FetchResult with ABI and metadata
+
+        Raises:
+            ABINotFoundError: If the contract is not verified on Sourcify
+            NetworkError: If no lookup succeeded and one of them failed
         """
         if not self.ADDRESS_PATTERN.match(source):
             raise InvalidAddressError(source)
 
         address = source.lower()
+        if source_code is not None:
+            include_source = source_code
 
         # Convert network name to chain_id
         if network and network in NETWORKS:
             chain_id = NETWORKS[network]["chain_id"]
 
-        # Try full match first
-        try:
-            result = await self._fetch_match(address, chain_id, "full_match")
-            if result:
-                return result
-        except ABINotFoundError:
-            pass
-
-        # Try partial match
-        try:
-            result = await self._fetch_match(address, chain_id, "partial_match")
-            if result:
-                return result
-        except ABINotFoundError:
-            pass
+        result = None
+        if not include_source:
+            try:
+                result = await self._fetch_v2(address, chain_id)
+            except ABINotFoundError:
+                pass
+            except NetworkError as e:
+                logger.debug(f"Sourcify v2 lookup failed, using files endpoints: {e.message}")
+                result = await self._fetch_files(address, chain_id, include_source)
+        else:
+            result = await self._fetch_files(address, chain_id, include_source)
+
+        if result:
+            return result
 
         raise ABINotFoundError(
             source=address,
@@ -82,20 +108,100 @@ class SourcifyFetcher(ABIFetcher):
             network=network,
         )
 
-    async def _fetch_match(
-        self, address: str, chain_id: int, match_type: str
-    ) -> Optional[FetchResult]:
-        """Fetch contract files from Sourcify."""
-        url = f"{self.SOURCIFY_API}/files/{match_type}/{chain_id}/{address}"
+    async def _fetch_v2(self, address: str, chain_id: int) -> FetchResult:
+        """Fetch ABI and compilation info (no sources) from the v2 API."""
+        url = f"{self.SOURCIFY_API}/v2/contract/{chain_id}/{address}"
 
         try:
-            response = await self.client.get(url)
+            response = await self.client.get(url, params={"fields": "abi,compilation"})
 
             if response.status_code == 404:
-                raise ABINotFoundError(source=address, reason=f"No {match_type} found")
+                raise ABINotFoundError(source=address, reason="Not verified on Sourcify")
 
             response.raise_for_status()
-            files = response.json()
+            data = response.json()
+
+        except httpx.HTTPStatusError as e:
+            raise NetworkError(
+                f"HTTP error: {e}", url=url, status_code=e.response.status_code
+            ) from e
+        except httpx.RequestError as e:
+            raise NetworkError(f"Request failed: {e}", url=url) from e
+
+        abi = data.get("abi") if isinstance(data, dict) else None
+        if not isinstance(abi, list):
+            raise NetworkError("Unexpected response from Sourcify v2 API", url=url)
+
+        compilation = data.get("compilation") or {}
+        return FetchResult(
+            abi=abi,
+            source="sourcify",
+            source_location=address,
+            contract_name=compilation.get("name"),
+            compiler_version=compilation.get("compilerVersion"),
+        )
+
+    async def _fetch_files(
+        self, address: str, chain_id: int, include_source: bool
+    ) -> Optional[FetchResult]:
+        """
+        Probe all legacy match types concurrently, preferring full matches.
+
+        A full-match probe that fails still lets the partial match answer;
+        the failure is raised only when no match type has the contract.
+        """
+        tasks = [
+            asyncio.ensure_future(self._fetch_match(address, chain_id, match_type, include_source))
+            for match_type in self.MATCH_TYPES
+        ]
+
+        error: Optional[NetworkError] = None
+        try:
+            for task in tasks:
+                try:
+                    result = await task
+                    if result:
+                        return result
+                except ABINotFoundError:
+                    pass
+                except NetworkError as e:
+                    logger.debug(f"Sourcify lookup failed: {e.message}")
+                    error = error or e
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()  # Mark as retrieved so asyncio does not log it
+
+        if error is not None:
+            raise error
+        return None
+
+    async def _fetch_match(
+        self, address: str, chain_id: int, match_type: str, include_source: bool = True
+    ) -> Optional[FetchResult]:
+        """Fetch contract files from Sourcify, streaming the file list."""
+        url = f"{self.SOURCIFY_API}/files/{match_type}/{chain_id}/{address}"
+        files = []
+
+        try:
+            async with self.client.stream("GET", url) as response:
+                if response.status_code == 404:
+                    raise ABINotFoundError(source=address, reason=f"No {match_type} found")
+
+                response.raise_for_status()
+
+                # Files arrive one at a time; source bodies are dropped unless
+                # requested, and without them metadata.json is all we need
+                async for file in aiter_json_items(response.aiter_bytes()):
+                    name = file.get("name", "")
+                    if name == "metadata.json":
+                        files.append(file)
+                        if not include_source:
+                            break
+                    elif include_source:
+                        files.append(file)
 
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
@@ -105,6 +211,8 @@ class SourcifyFetcher(ABIFetcher):
             ) from e
         except httpx.RequestError as e:
             raise NetworkError(f"Request failed: {e}", url=url) from e
+        except ValueError as e:
+            raise NetworkError(f"Invalid JSON from Sourcify: {e}", url=url) from e
 
         return self._parse_files(files, address)
 
@@ -163,10 +271,14 @@ class SourcifyFetcher(ABIFetcher):
         """Check if source is an Ethereum address."""
         return bool(self.ADDRESS_PATTERN.match(source))
 
+    async def aclose(self) -> None:
+        """Close the HTTP client."""
+        await self.client.aclose()
+
     async def __aenter__(self):
         """Async context manager entry."""
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        await self.client.aclose()
+        await self.aclose()
@@ -4,6 +4,7 @@ This module provides code generation capabilities for converting parsed ABIs
 and mapped tools/resources into complete, runnable MCP server packages.
 """
 
+from abi_to_mcp.generator.manifest import BuildManifest
 from abi_to_mcp.generator.resource_generator import ResourceGenerator
 from abi_to_mcp.generator.server_generator import ServerGenerator
 from abi_to_mcp.generator.tool_generator import ToolGenerator
@@ -16,4 +17,5 @@ __all__ = [
     "ResourceGenerator",
     "ServerGenerator",
     "MCPGenerator",
+    "BuildManifest",
 ]
@@ -0,0 +1,141 @@
+"""Build manifest for incremental server regeneration.
+
+The manifest records, for every file written to an output directory, a
+digest of the inputs it was rendered from (templates and context) and a
+hash of the content written. When the inputs of a file have not changed
+and the file on disk still matches, the generator reuses it instead of
+rendering the templates again.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, field, fields, is_dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+from abi_to_mcp.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+MANIFEST_FILENAME = ".abi-to-mcp-manifest.json"
+MANIFEST_VERSION = 1
+
+
+def _encode(obj: Any) -> Any:
+    """JSON encoder for the objects found in template contexts."""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj, key=str)
+    return str(obj)
+
+
+def fingerprint(*parts: Any) -> str:
+    """Stable SHA-256 digest of JSON-serializable parts (dataclasses allowed)."""
+    payload = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=_encode)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def content_hash(content: str) -> str:
+    """SHA-256 digest of file content."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class BuildManifest:
+    """Digests of the files and tools generated into an output directory.
+
+    Attributes:
+        files: Path -> {"inputs": input digest, "sha256": content hash,
+            "executable": bool} for every generated file
+        tools: Tool name -> digest of the mapped tool
+    """
+
+    files: dict[str, dict[str, Any]] = field(default_factory=dict)
+    tools: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, output_dir: Path) -> "BuildManifest":
+        """Load the manifest of an output directory.
+
+        Missing, unreadable or outdated manifests load as empty, so every
+        file is rendered again.
+
+        Args:
+            output_dir: Directory a server was generated into
+
+        Returns:
+            The stored manifest, or an empty one
+        """
+        path = Path(output_dir) / MANIFEST_FILENAME
+        try:
+            data = json.loads(path.read_text())
+        except FileNotFoundError:
+            return cls()
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable manifest {path}: {e}")
+            return cls()
+
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            return cls()
+        return cls(files=data.get("files", {}), tools=data.get("tools", {}))
+
+    def save(self, output_dir: Path) -> None:
+        """Write the manifest into an output directory."""
+        data = {"version": MANIFEST_VERSION, "files": self.files, "tools": self.tools}
+        path = Path(output_dir) / MANIFEST_FILENAME
+        path.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n")
+
+    def cached_content(self, output_dir: Path, path: str, inputs: str) -> str | None:
+        """Get a file's content if it was generated from the same inputs.
+
+        Args:
+            output_dir: Directory the file was generated into
+            path: Relative file path
+            inputs: Digest of the inputs the file would be rendered from
+
+        Returns:
+            The file content, or None if it must be rendered again (changed
+            inputs, missing file or file edited since it was generated)
+        """
+        entry = self.files.get(path)
+        if not entry or entry.get("inputs") != inputs:
+            return None
+        try:
+            content = (Path(output_dir) / path).read_text()
+        except OSError:
+            return None
+        if content_hash(content) != entry.get("sha256"):
+            return None
+        return content
+
+    def unchanged_on_disk(self, output_dir: Path, path: str) -> bool:
+        """Check whether a recorded file is still on disk as it was generated."""
+        entry = self.files.get(path)
+        if not entry:
+            return False
+        try:
+            content = (Path(output_dir) / path).read_text()
+        except OSError:
+            return False
+        return content_hash(content) == entry.get("sha256")
+
+    def is_executable(self, path: str) -> bool:
+        """Check whether a recorded file was generated executable."""
+        return bool(self.files.get(path, {}).get("executable", False))
+
+    def diff_tools(self, tools: dict[str, str]) -> tuple[list[str], list[str]]:
+        """Compare tool digests with the recorded ones.
+
+        Args:
+            tools: Tool name -> digest of the tools being generated
+
+        Returns:
+            Tuple of (added or changed tool names, removed tool names)
+        """
+        changed = [name for name, digest in tools.items() if self.tools.get(name) != digest]
+        removed = [name for name in self.tools if name not in tools]
+        return changed, removed
@@ -3,10 +3,16 @@
 Generates MCP resource code from mapped event definitions.
 """
 
+import keyword
+from typing import Any
+
 from jinja2 import Environment
 
 from abi_to_mcp.core.models import MappedResource
 
+# Parameters of indexed event tools that filter names must not shadow
+INDEX_QUERY_PARAMS = {"from_block", "to_block", "limit", "offset", "ascending"}
+
 
 class ResourceGenerator:
     """Generate MCP resource code from mapped events.
@@ -75,6 +81,48 @@ class ResourceGenerator:
 
         return "\n\n".join(sections)
 
+    def index_table(self, resource: MappedResource) -> dict[str, Any]:
+        """Describe the SQLite table that indexes a resource's event.
+
+        Each indexed event argument gets its own column, which the
+        generated event tool exposes as an optional filter parameter.
+
+        Args:
+            resource: The mapped resource definition
+
+        Returns:
+            Dict with the table name and a list of filters, each holding the
+            column/parameter name, the ABI argument name, a description and
+            the Python type of the filter parameter
+        """
+        filters: list[dict[str, Any]] = []
+        used: set[str] = set()
+        for position, field in enumerate(resource.indexed_fields):
+            name = field.name
+            if keyword.iskeyword(name) or name in INDEX_QUERY_PARAMS:
+                name = f"{name}_"
+            if name in used:
+                name = f"{name}_{position}"
+            used.add(name)
+            filters.append(
+                {
+                    "name": name,
+                    "original_name": field.original_name,
+                    "description": field.description,
+                    "python_type": self._filter_type(field.solidity_type),
+                }
+            )
+
+        return {"table": f"event_{resource.name}", "filters": filters}
+
+    def _filter_type(self, solidity_type: str) -> str:
+        """Python annotation for an indexed argument filter."""
+        if solidity_type == "bool":
+            return "bool"
+        if solidity_type.startswith(("uint", "int")) and not solidity_type.endswith("]"):
+            return "int"
+        return "str"
+
     def _generate_section_header(self, title: str) -> str:
         """Generate a section header comment."""
         return "\n".join(
@@ -4,22 +4,28 @@ Orchestrates all generators to produce a complete MCP server package.
 """
 
 import json
+import os
+from dataclasses import replace
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from jinja2 import Environment, PackageLoader, select_autoescape
 
 from abi_to_mcp.core.config import GeneratorConfig
 from abi_to_mcp.core.constants import NETWORKS
+from abi_to_mcp.core.exceptions import GeneratorError
 from abi_to_mcp.core.models import (
     GeneratedFile,
     GeneratedServer,
     MappedResource,
     MappedTool,
     ParsedABI,
+    ProtocolContract,
 )
+from abi_to_mcp.generator.manifest import BuildManifest, content_hash, fingerprint
 from abi_to_mcp.generator.resource_generator import ResourceGenerator
 from abi_to_mcp.generator.tool_generator import ToolGenerator
+from abi_to_mcp.version import __version__
 
 
 class ServerGenerator:
@@ -41,11 +47,17 @@ class ServerGenerator:
         >>> for f in server.files:
         ...     print(f.path)
         server.py
+        abi.json
         config.py
         README.md
         pyproject.toml
         requirements.txt
         .env.example
+
+    With config.incremental set, a manifest in the output directory records
+    the digest of the templates and inputs of every file. Files whose
+    inputs are unchanged are reused from disk instead of being rendered,
+    and write_to_disk only rewrites files whose content changed.
     """
 
     def __init__(self, config: GeneratorConfig | None = None):
@@ -58,6 +70,7 @@ class ServerGenerator:
         self.jinja_env = self._create_jinja_env()
         self.tool_gen = ToolGenerator(self.jinja_env)
         self.resource_gen = ResourceGenerator(self.jinja_env)
+        self._templates_digest: str | None = None
 
     def _create_jinja_env(self) -> Environment:
         """Create and configure the Jinja2 environment."""
@@ -96,14 +109,148 @@ class ServerGenerator:
 
         Returns:
             GeneratedServer with all generated files
+
+        Raises:
+            GeneratorError: If the ABI was parsed without keeping its JSON
         """
         # Determine server name
         server_name = self._determine_server_name(
             contract_name, parsed.detected_standard, contract_address
         )
 
-        # Get network configuration
-        network_config = NETWORKS.get(network, NETWORKS["mainnet"])
+        contract = self._contract_entry(
+            key="contract",
+            var="contract",
+            address_env="CONTRACT_ADDRESS",
+            address=contract_address,
+            parsed=parsed,
+            tools=tools,
+            resources=resources,
+        )
+
+        # Prepare template context
+        context = self._build_context(
+            contracts=[contract],
+            contract_address=contract_address,
+            detected_standard=parsed.detected_standard,
+            network=network,
+            server_name=server_name,
+        )
+        context["abi_json"] = contract["abi_json"]
+
+        return self._generate_files(
+            context,
+            abi_files=[self._generate_abi_file(context)],
+            contract_address=contract_address,
+        )
+
+    def generate_protocol(
+        self,
+        contracts: list[ProtocolContract],
+        network: str,
+        protocol_name: str | None = None,
+    ) -> GeneratedServer:
+        """Generate one MCP server hosting several contracts of a protocol.
+
+        Each contract's tools are namespaced with its name (a contract named
+        "pool" gets pool_get_reserve_data, pool_supply, ...). All contracts
+        share one Web3 provider and connection pool, the Multicall3 batcher,
+        the read cache and the transaction nonce/fee state. Their ABIs are
+        written to abis/<name>.json and loaded on first use.
+
+        The local event index (config.event_index) is not supported in
+        protocol servers; their event tools scan logs instead.
+
+        Args:
+            contracts: Contracts to host, each with its own mapped tools
+            network: Target network name
+            protocol_name: Protocol name (e.g. "Aave V3")
+
+        Returns:
+            GeneratedServer with all generated files
+
+        Raises:
+            GeneratorError: If no contracts are given, two names clash or an
+                ABI was parsed without keeping its JSON
+        """
+        if not contracts:
+            raise GeneratorError("A protocol server needs at least one contract")
+
+        entries: list[dict[str, Any]] = []
+        for contract in contracts:
+            key = self._to_package_name(contract.name)
+            if any(entry["key"] == key for entry in entries):
+                raise GeneratorError(
+                    f"Contract names must be unique: '{contract.name}' clashes as '{key}'"
+                )
+            entries.append(
+                self._contract_entry(
+                    key=key,
+                    var=f"{key}_contract",
+                    address_env=f"{key.upper()}_ADDRESS",
+                    address=contract.address,
+                    parsed=contract.parsed,
+                    tools=[
+                        replace(
+                            tool,
+                            name=f"{key}_{tool.name}",
+                            description=f"[{contract.name}] {tool.description}",
+                        )
+                        for tool in contract.tools
+                    ],
+                    resources=[
+                        replace(
+                            resource,
+                            name=f"{key}_{resource.name}",
+                            description=f"[{contract.name}] {resource.description}",
+                            uri_template=f"events://{key}/{resource.name}",
+                            function_name=f"{key}_{resource.function_name}",
+                        )
+                        for resource in contract.resources
+                    ],
+                    name=contract.name,
+                )
+            )
+
+        server_name = self.config.server_name or (
+            f"{protocol_name} MCP Server" if protocol_name else "Protocol MCP Server"
+        )
+        context = self._build_context(
+            contracts=entries,
+            contract_address=None,
+            detected_standard=None,
+            network=network,
+            server_name=server_name,
+            protocol=True,
+        )
+
+        return self._generate_files(
+            context,
+            abi_files=[
+                GeneratedFile(path=f"abis/{entry['key']}.json", content=entry["abi_json"] + "\n")
+                for entry in entries
+            ],
+            contract_address=", ".join(entry["address"] for entry in entries),
+            contracts={entry["key"]: entry["address"] for entry in entries},
+        )
+
+    def _contract_entry(
+        self,
+        key: str,
+        var: str,
+        address_env: str,
+        address: str,
+        parsed: ParsedABI,
+        tools: list[MappedTool],
+        resources: list[MappedResource],
+        name: str | None = None,
+    ) -> dict[str, Any]:
+        """Describe one contract hosted by a server for the templates."""
+        if not parsed.raw_abi and (parsed.functions or parsed.events):
+            raise GeneratorError(
+                f"The ABI of {name or key} was parsed without its JSON "
+                "(keep_raw_abi=False); parse it with keep_raw_abi=True to generate a server"
+            )
 
         # Separate read/write tools
         read_tools = [t for t in tools if t.tool_type == "read"]
@@ -114,33 +261,78 @@ class ServerGenerator:
             tools = read_tools
             write_tools = []
 
-        # Prepare template context
-        context = self._build_context(
-            parsed=parsed,
-            tools=tools,
-            resources=resources,
-            read_tools=read_tools,
-            write_tools=write_tools,
-            contract_address=contract_address,
-            network=network,
-            network_config=network_config,
-            server_name=server_name,
+        if not self.config.include_events:
+            resources = []
+
+        return {
+            "key": key,
+            "name": name or key,
+            "var": var,
+            "address_env": address_env,
+            "address": address,
+            # Minified ABI for the sidecar file the server loads on first use
+            "abi_json": json.dumps(parsed.raw_abi, separators=(",", ":")),
+            "tools": tools,
+            "read_tools": read_tools,
+            "write_tools": write_tools,
+            "resources": resources,
+        }
+
+    def _generate_files(
+        self,
+        context: dict[str, Any],
+        abi_files: list[GeneratedFile],
+        contract_address: str,
+        contracts: dict[str, str] | None = None,
+    ) -> GeneratedServer:
+        """Render (or reuse) every file of a server package."""
+        tools = context["tools"]
+
+        # Compare with the last generation into the output directory
+        manifest = (
+            BuildManifest.load(self.config.output_dir)
+            if self.config.incremental
+            else BuildManifest()
         )
+        tool_digests = {t.name: fingerprint(t) for t in tools}
+        changed_tools, removed_tools = manifest.diff_tools(tool_digests)
+        inputs = fingerprint(self._get_templates_digest(), context)
+        reused: list[str] = []
+
+        def render(
+            path: str, generate_file: Callable[[dict[str, Any]], GeneratedFile]
+        ) -> GeneratedFile:
+            digest = fingerprint(inputs, path)
+            content = manifest.cached_content(self.config.output_dir, path, digest)
+            if content is not None:
+                reused.append(path)
+                return GeneratedFile(
+                    path=path,
+                    content=content,
+                    is_executable=manifest.is_executable(path),
+                    digest=digest,
+                )
+            generated = generate_file(context)
+            generated.digest = digest
+            return generated
 
         # Generate all files
         files = []
 
         # Main server file
-        files.append(self._generate_server_file(context))
+        files.append(render("server.py", self._generate_server_file))
+
+        # ABI sidecars
+        files.extend(abi_files)
 
         # Configuration file
-        files.append(self._generate_config_file(context))
+        files.append(render("config.py", self._generate_config_file))
 
         # README
-        files.append(self._generate_readme(context))
+        files.append(render("README.md", self._generate_readme))
 
         # pyproject.toml
-        files.append(self._generate_pyproject(context))
+        files.append(render("pyproject.toml", self._generate_pyproject))
 
         # requirements.txt
         files.append(self._generate_requirements())
@@ -151,43 +343,67 @@ class ServerGenerator:
         return GeneratedServer(
             files=files,
             tool_count=len(tools),
-            resource_count=len(resources),
-            read_tools=[t.name for t in read_tools],
-            write_tools=[t.name for t in write_tools] if not self.config.read_only else [],
-            events=[r.name for r in resources],
-            server_name=server_name,
+            resource_count=len(context["resources"]),
+            read_tools=[t.name for t in context["read_tools"]],
+            write_tools=[t.name for t in context["write_tools"]],
+            events=[r.name for r in context["resources"]],
+            server_name=context["server_name"],
             contract_address=contract_address,
-            network=network,
+            network=context["network"],
+            contracts=contracts or {},
+            tool_digests=tool_digests,
+            changed_tools=changed_tools,
+            removed_tools=removed_tools,
+            reused_files=reused,
         )
 
+    def _get_templates_digest(self) -> str:
+        """Digest of every template source and the generator version."""
+        if self._templates_digest is None:
+            loader = self.jinja_env.loader
+            if loader is None:
+                raise GeneratorError("Template environment has no loader")
+            sources = {
+                name: loader.get_source(self.jinja_env, name)[0]
+                for name in sorted(self.jinja_env.list_templates())
+                if "__pycache__" not in name
+            }
+            self._templates_digest = fingerprint(__version__, sources)
+        return self._templates_digest
+
     def _build_context(
         self,
-        parsed: ParsedABI,
-        tools: list[MappedTool],
-        resources: list[MappedResource],
-        read_tools: list[MappedTool],
-        write_tools: list[MappedTool],
-        contract_address: str,
+        contracts: list[dict[str, Any]],
+        contract_address: str | None,
+        detected_standard: str | None,
         network: str,
-        network_config: dict[str, Any],
         server_name: str,
+        protocol: bool = False,
     ) -> dict[str, Any]:
         """Build the template rendering context."""
-        # Serialize ABI to JSON for embedding
-        abi_json = json.dumps(parsed.raw_abi, indent=2)
+        # Get network configuration
+        network_config = NETWORKS.get(network, NETWORKS["mainnet"])
 
         # Create package name from server name
         package_name = self._to_package_name(server_name)
 
+        tools = [t for c in contracts for t in c["tools"]]
+        read_tools = [t for c in contracts for t in c["read_tools"]]
+        write_tools = [t for c in contracts for t in c["write_tools"]]
+        resources = [r for c in contracts for r in c["resources"]]
+        # The event index stores one contract's events; protocol servers scan logs
+        event_index = self.config.event_index and bool(resources) and not protocol
+
         return {
             # Server identification
             "server_name": server_name,
             "server_version": self.config.server_version,
             "package_name": package_name,
             # Contract info
+            "protocol": protocol,
+            "contracts": contracts,
             "contract_address": contract_address,
-            "detected_standard": parsed.detected_standard,
-            "abi_json": abi_json,
+            "detected_standard": detected_standard,
             # Network info
             "network": network,
             "chain_id": network_config.get("chain_id", 1),
@@ -195,14 +411,27 @@ class ServerGenerator:
             "currency": network_config.get("currency", "ETH"),
             # Tools and resources
             "tools": tools,
-            "resources": resources if self.config.include_events else [],
+            "resources": resources,
             "read_tools": read_tools,
-            "write_tools": write_tools if not self.config.read_only else [],
+            "write_tools": write_tools,
             # Settings
             "simulation_default": self.config.simulation_default,
             "read_only": self.config.read_only,
             "include_utilities": self.config.include_utilities,
             "include_events": self.config.include_events,
+            "async_runtime": self.config.async_runtime,
+            "multicall": self.config.multicall,
+            "multicall_window_ms": self.config.multicall_window_ms,
+            "read_cache": self.config.read_cache,
+            "read_cache_ttl": self.config.read_cache_ttl,
+            "read_cache_max_size": self.config.read_cache_max_size,
+            "event_index": event_index,
+            "event_index_start_block": self.config.event_index_start_block,
+            "index_tables": (
+                {r.original_name: self.resource_gen.index_table(r) for r in resources}
+                if event_index
+                else {}
+            ),
             # Output path for documentation
             "output_path": str(self.config.output_dir),
         }
@@ -218,6 +447,13 @@ class ServerGenerator:
             is_executable=True,
         )
 
+    def _generate_abi_file(self, context: dict[str, Any]) -> GeneratedFile:
+        """Generate the abi.json sidecar loaded lazily by server.py."""
+        return GeneratedFile(
+            path="abi.json",
+            content=context["abi_json"] + "\n",
+        )
+
     def _generate_config_file(self, context: dict[str, Any]) -> GeneratedFile:
         """Generate the config.py file."""
         template = self.jinja_env.get_template("config.py.jinja2")
@@ -252,10 +488,12 @@ class ServerGenerator:
         """Generate the requirements.txt file."""
         requirements = [
             "mcp>=1.0.0",
-            "web3>=6.0.0",
+            "web3>=7.0.0",
             "pydantic>=2.0.0",
             "python-dotenv>=1.0.0",
         ]
+        if self.config.async_runtime:
+            requirements.append("aiohttp>=3.8.0")
 
         return GeneratedFile(
             path="requirements.txt",
@@ -268,8 +506,10 @@ class ServerGenerator:
             "# RPC endpoint for blockchain connection",
             f"RPC_URL={context['default_rpc']}",
             "",
-            "# Contract address (optional, can override default)",
-            f"# CONTRACT_ADDRESS={context['contract_address']}",
+            "# Contract address (optional, can override default)"
+            if len(context["contracts"]) == 1
+            else "# Contract addresses (optional, can override defaults)",
+            *(f"# {c['address_env']}={c['address']}" for c in context["contracts"]),
             "",
             "# Private key for write operations (NEVER commit this!)",
             "# Only needed if you want to execute transactions",
@@ -283,6 +523,66 @@ class ServerGenerator:
             "",
         ]
 
+        if context["write_tools"]:
+            lines += [
+                "# Seconds between checks for a new block before refreshing the gas price",
+                "# FEE_CACHE_BLOCK_INTERVAL=1.0",
+                "",
+                "# Seconds between receipt checks for sent transactions",
+                "# TX_POLL_INTERVAL=2.0",
+                "",
+                "# Seconds a sent transaction may stay pending before it counts as dropped",
+                "# TX_MAX_PENDING_AGE=1800",
+                "",
+            ]
+
+        if self.config.async_runtime:
+            lines += [
+                "# RPC connection pool",
+                "# RPC_MAX_CONNECTIONS=20",
+                "# RPC_TIMEOUT=30",
+                "",
+            ]
+
+        if context["resources"]:
+            lines += [
+                "# Event scanning",
+                "# EVENT_CHUNK_SIZE=2000",
+                "# EVENT_SCAN_CONCURRENCY=4",
+                "# EVENT_CONFIRMATIONS=12",
+                "# EVENT_CHECKPOINT_DIR=./.event_checkpoints",
+                "# EVENT_CHECKPOINT_MAX_EVENTS=100000",
+                "",
+            ]
+
+        if context["event_index"]:
+            lines += [
+                "# Local event index (SQLite)",
+                "# EVENT_INDEX_PATH=./.event_index/<contract>.sqlite3",
+                f"# EVENT_INDEX_START_BLOCK={self.config.event_index_start_block}",
+                "# EVENT_INDEX_POLL_INTERVAL=12",
+                "# EVENT_INDEX_REORG_DEPTH=64",
+                "",
+            ]
+
+        if self.config.read_cache:
+            lines += [
+                "# Read result cache",
+                f"# READ_CACHE_TTL={self.config.read_cache_ttl:g}",
+                f"# READ_CACHE_MAX_SIZE={self.config.read_cache_max_size}",
+                "# READ_CACHE_BLOCK_INTERVAL=1.0",
+                "",
+            ]
+
+        if self.config.multicall:
+            lines += [
+                "# Multicall3 read batching",
+                "# MULTICALL3_ADDRESS=0xcA11bde05977b3631167028862bE2a173976CA11",
+                f"# MULTICALL_WINDOW_MS={self.config.multicall_window_ms:g}",
+                "# MULTICALL_MAX_BATCH=100",
+                "",
+            ]
+
         return GeneratedFile(
             path=".env.example",
             content="\n".join(lines),
@@ -335,6 +635,14 @@ class ServerGenerator:
     def write_to_disk(self, server: GeneratedServer, output_dir: Path | None = None) -> Path:
         """Write all generated files to disk.
 
+        Files whose content is already on disk are left untouched, and the
+        build manifest is updated for the next incremental generation. The
+        paths actually written are recorded in server.written_files.
+
+        Files the manifest recorded from the previous generation that are no
+        longer generated (e.g. ABI sidecars of removed contracts) are deleted,
+        unless they were edited since; they are listed in server.removed_files.
+
         Args:
             server: The generated server package
             output_dir: Output directory (uses config if not provided)
@@ -348,16 +656,56 @@ class ServerGenerator:
         # Create output directory
         output.mkdir(parents=True, exist_ok=True)
 
+        previous = BuildManifest.load(output)
+        manifest = BuildManifest(tools=dict(server.tool_digests))
+        server.written_files = []
+
         # Write each file
         for file in server.files:
             file_path = output / file.path
+            sha256 = content_hash(file.content)
+            manifest.files[file.path] = {
+                "inputs": file.digest,
+                "sha256": sha256,
+                "executable": file.is_executable,
+            }
+
+            # Skip files already on disk with the same content
+            entry = previous.files.get(file.path, {})
+            if entry.get("sha256") == sha256 and previous.unchanged_on_disk(output, file.path):
+                continue
+
             file_path.parent.mkdir(parents=True, exist_ok=True)
             file_path.write_text(file.content)
+            server.written_files.append(file.path)
 
             # Make executable if needed
             if file.is_executable:
-                import os
-
                 os.chmod(file_path, os.stat(file_path).st_mode | 0o111)
 
+        server.removed_files = self._remove_stale_files(output, previous, manifest)
+        manifest.save(output)
         return output
+
+    @staticmethod
+    def _remove_stale_files(
+        output: Path, previous: BuildManifest, manifest: BuildManifest
+    ) -> list[str]:
+        """Delete previously generated files that were not generated again."""
+        removed = []
+        for path in sorted(previous.files):
+            if path in manifest.files or ".." in Path(path).parts:
+                continue
+            # Files edited by hand are kept
+            if not previous.unchanged_on_disk(output, path):
+                continue
+            file_path = output / path
+            file_path.unlink()
+            removed.append(path)
+
+            # Drop directories left empty (e.g. abis/)
+            parent = file_path.parent
+            while parent != output and not any(parent.iterdir()):
+                parent.rmdir()
+                parent = parent.parent
+        return removed
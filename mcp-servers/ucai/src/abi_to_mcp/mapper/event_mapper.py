@@ -4,8 +4,10 @@ AGENT 1: This file needs full implementation. See AGENTS.md for requirements.
 """
 
 import re
+from typing import Any, Sequence
 
-from abi_to_mcp.core.models import ABIEvent, MappedResource, ResourceField
+from abi_to_mcp.core.models import ABIEvent, ABIParameter, MappedResource, ResourceField
+from abi_to_mcp.mapper.schema_builder import SchemaBuilder
 from abi_to_mcp.mapper.type_mapper import TypeMapper
 
 
@@ -20,17 +22,27 @@ class EventMapper:
         name = self._to_snake_case(event.name)
 
         fields = []
+        # Structs shared by the fields, referenced from event_schema
+        defs: dict[str, Any] = {}
+        builder = SchemaBuilder().title(event.name)
         for param in event.inputs:
             # Convert ABIParameter components to dicts for type_mapper
             components_as_dicts = (
                 self._components_to_dicts(param.components) if param.components else None
             )
-            solidity_type = self.type_mapper.parse_type(param.type, components_as_dicts)
+            solidity_type = self.type_mapper.parse_type(
+                param.type, components_as_dicts, param.internal_type
+            )
             json_schema = self.type_mapper.to_json_schema(solidity_type, param.name)
+            field_name = self._to_snake_case(param.name) if param.name else "value"
+            builder.add_property(
+                field_name,
+                self.type_mapper.to_json_schema(solidity_type, param.name, defs=defs),
+            )
 
             fields.append(
                 ResourceField(
-                    name=self._to_snake_case(param.name) if param.name else "value",
+                    name=field_name,
                     original_name=param.name,
                     solidity_type=param.type,
                     json_schema=json_schema,
@@ -46,6 +58,7 @@ class EventMapper:
             uri_template=f"events://{name}",
             fields=fields,
             function_name=f"get_{name}_events",
+            event_schema=builder.add_defs(defs).build(),
         )
 
     def _to_snake_case(self, name: str) -> str:
@@ -53,7 +66,7 @@ class EventMapper:
         s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
         return re.sub("([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
 
-    def _components_to_dicts(self, components: list) -> list[dict]:
+    def _components_to_dicts(self, components: Sequence[ABIParameter | dict]) -> list[dict]:
         """Convert ABIParameter components to dicts for type_mapper."""
         result = []
         for c in components:
@@ -62,10 +75,12 @@ class EventMapper:
                 result.append(c)
             else:
                 # ABIParameter object
-                comp_dict = {
+                comp_dict: dict[str, Any] = {
                     "name": c.name,
                     "type": c.type,
                 }
+                if c.internal_type:
+                    comp_dict["internalType"] = c.internal_type
                 if c.components:
                     comp_dict["components"] = self._components_to_dicts(c.components)
                 result.append(comp_dict)
@@ -5,12 +5,15 @@ AGENT 1: This file needs full implementation. See AGENTS.md for requirements.
 
 import re
 import keyword
+from typing import Any, Sequence
 
 from abi_to_mcp.core.models import (
     ABIFunction,
+    ABIParameter,
     MappedTool,
     ToolParameter,
 )
+from abi_to_mcp.mapper.schema_builder import build_tool_schema
 from abi_to_mcp.mapper.type_mapper import TypeMapper
 
 
@@ -30,13 +33,18 @@ class FunctionMapper:
         tool_type = self._get_tool_type(func)
 
         parameters = []
+        # Structs shared by the parameters, referenced from input_schema
+        defs: dict[str, Any] = {}
+        input_properties = []
         for i, param in enumerate(func.inputs):
             param_name = param.name or f"arg{i}"
             # Convert ABIParameter components to dicts for type_mapper
             components_as_dicts = (
                 self._components_to_dicts(param.components) if param.components else None
             )
-            solidity_type = self.type_mapper.parse_type(param.type, components_as_dicts)
+            solidity_type = self.type_mapper.parse_type(
+                param.type, components_as_dicts, param.internal_type
+            )
             json_schema = self.type_mapper.to_json_schema(solidity_type, param_name)
 
             # Convert to snake_case and escape Python keywords
@@ -53,12 +61,33 @@ class FunctionMapper:
                     description=json_schema.get("description", param_name),
                 )
             )
+            input_properties.append(
+                {
+                    "name": safe_name,
+                    "schema": self.type_mapper.to_json_schema(
+                        solidity_type, param_name, defs=defs
+                    ),
+                }
+            )
 
         return_schema = self.type_mapper.map_function_outputs(
-            [{"name": o.name, "type": o.type, "components": o.components} for o in func.outputs]
+            [
+                {
+                    "name": o.name,
+                    "type": o.type,
+                    "components": (
+                        self._components_to_dicts(o.components) if o.components else None
+                    ),
+                    "internalType": o.internal_type,
+                }
+                for o in func.outputs
+            ]
         )
 
         description = self.generate_description(func)
+        input_schema = build_tool_schema(
+            name, description, input_properties, [p.name for p in parameters], defs
+        )["inputSchema"]
 
         return MappedTool(
             name=name,
@@ -69,6 +98,7 @@ class FunctionMapper:
             return_schema=return_schema,
             return_description=self._describe_return(func),
             python_signature=self._build_signature(name, parameters, tool_type),
+            input_schema=input_schema,
         )
 
     def generate_description(self, func: ABIFunction) -> str:
@@ -140,7 +170,7 @@ class FunctionMapper:
             parts.append("simulate: bool = True")
         return f"def {name}({', '.join(parts)}):"
 
-    def _components_to_dicts(self, components: list) -> list[dict]:
+    def _components_to_dicts(self, components: Sequence[ABIParameter | dict]) -> list[dict]:
         """Convert ABIParameter components to dicts for type_mapper."""
         result = []
         for c in components:
@@ -149,10 +179,12 @@ class FunctionMapper:
                 result.append(c)
             else:
                 # ABIParameter object
-                comp_dict = {
+                comp_dict: dict[str, Any] = {
                     "name": c.name,
                     "type": c.type,
                 }
+                if c.internal_type:
+                    comp_dict["internalType"] = c.internal_type
                 if c.components:
                     comp_dict["components"] = self._components_to_dicts(c.components)
                 result.append(comp_dict)
@@ -9,11 +9,12 @@ from typing import Any
 class SchemaBuilder:
     """Builder for JSON Schema objects."""
 
-    def __init__(self):
+    def __init__(self) -> None:
         self._properties: dict[str, dict[str, Any]] = {}
         self._required: list[str] = []
         self._title: str | None = None
         self._description: str | None = None
+        self._defs: dict[str, dict[str, Any]] = {}
 
     def title(self, title: str) -> "SchemaBuilder":
         """Set schema title."""
@@ -37,6 +38,11 @@ class SchemaBuilder:
             self._required.append(name)
         return self
 
+    def add_defs(self, defs: dict[str, dict[str, Any]]) -> "SchemaBuilder":
+        """Add shared definitions referenced by the properties ("$defs")."""
+        self._defs.update(defs)
+        return self
+
     def build(self) -> dict[str, Any]:
         """Build the final JSON Schema."""
         schema: dict[str, Any] = {"type": "object"}
@@ -51,6 +57,8 @@ class SchemaBuilder:
             schema["required"] = self._required
 
         schema["additionalProperties"] = False
+        if self._defs:
+            schema["$defs"] = self._defs
         return schema
 
 
@@ -59,15 +67,23 @@ def build_tool_schema(
     description: str,
     parameters: list[dict[str, Any]],
     required: list[str],
+    defs: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
-    """Build a complete MCP tool schema."""
+    """Build a complete MCP tool schema.
+
+    defs holds struct schemas referenced by the parameters, as collected by
+    TypeMapper.to_json_schema(..., defs=...).
+    """
+    input_schema: dict[str, Any] = {
+        "type": "object",
+        "properties": {p["name"]: p["schema"] for p in parameters},
+        "required": required,
+        "additionalProperties": False,
+    }
+    if defs:
+        input_schema["$defs"] = defs
     return {
         "name": name,
         "description": description,
-        "inputSchema": {
-            "type": "object",
-            "properties": {p["name"]: p["schema"] for p in parameters},
-            "required": required,
-            "additionalProperties": False,
-        },
+        "inputSchema": input_schema,
     }
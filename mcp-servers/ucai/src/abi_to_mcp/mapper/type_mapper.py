@@ -4,32 +4,283 @@ This module provides the TypeMapper class which converts Solidity types
 to JSON Schema definitions for use in MCP tool parameter validation.
 """
 
+import copy
 import re
-from dataclasses import dataclass
-from typing import Any
+import sys
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Any, NoReturn
 
 from ..core.constants import SOLIDITY_TO_JSON_SCHEMA, SOLIDITY_TO_PYTHON_TYPE
 
+# Parsed types and schema fragments kept per process (LRU)
+TYPE_CACHE_SIZE = 4096
 
-@dataclass
+# Hashable form of ABI tuple components: ((name, type, struct name, components), ...)
+ComponentsKey = tuple[tuple[str | None, str, str | None, Any], ...]
+
+ARRAY_PATTERN = re.compile(r"^(.+?)(\[(\d*)\])+$")
+DIMENSION_PATTERN = re.compile(r"\[(\d*)\]")
+UINT_PATTERN = re.compile(r"^uint(\d+)?$")
+INT_PATTERN = re.compile(r"^int(\d+)?$")
+BYTES_PATTERN = re.compile(r"^bytes(\d+)?$")
+STRUCT_PATTERN = re.compile(r"^struct\s+([\w$.]+)")
+
+
+@dataclass(frozen=True)
 class SolidityType:
     """Parsed Solidity type representation.
 
+    Instances are immutable and shared between everything that parses the
+    same type, so they can be used as cache keys.
+
     Attributes:
         base_type: The base Solidity type (e.g., "address", "uint256")
         is_array: Whether this is an array type
         array_length: Fixed array length (None for dynamic arrays)
         is_tuple: Whether this is a tuple/struct type
-        tuple_components: List of component types for tuples
-        tuple_names: List of component names for tuples
+        tuple_components: Component types for tuples
+        tuple_names: Component names for tuples
+        struct_name: Struct name from the ABI's internalType (e.g. "IPool.Key")
     """
 
     base_type: str
     is_array: bool = False
     array_length: int | None = None
     is_tuple: bool = False
-    tuple_components: list["SolidityType"] | None = None
-    tuple_names: list[str] | None = None
+    tuple_components: tuple["SolidityType", ...] | None = None
+    tuple_names: tuple[str, ...] | None = None
+    struct_name: str | None = None
+
+    def __post_init__(self) -> None:
+        # Accept lists, but store tuples so instances stay hashable
+        for name in ("tuple_components", "tuple_names"):
+            value = getattr(self, name)
+            if value is not None and not isinstance(value, tuple):
+                object.__setattr__(self, name, tuple(value))
+
+    def element_type(self) -> "SolidityType":
+        """Type of the elements of an array type."""
+        if ARRAY_PATTERN.match(self.base_type):
+            inner = _parse(self.base_type, None, None)
+            if not self.is_tuple:
+                return inner
+            return replace(
+                inner,
+                is_tuple=True,
+                tuple_components=self.tuple_components,
+                tuple_names=self.tuple_names,
+                struct_name=self.struct_name,
+            )
+        return replace(self, is_array=False, array_length=None)
+
+
+def _read_only(*args: Any, **kwargs: Any) -> NoReturn:
+    raise TypeError("schema fragments are shared between results and read-only")
+
+
+class _FrozenDict(dict):
+    """Read-only dict for memoized schema fragments.
+
+    Copying (copy.copy, copy.deepcopy, dict()) gives a plain, mutable dict.
+    """
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self) -> dict[str, Any]:
+        return dict(self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> dict[str, Any]:
+        return {key: copy.deepcopy(value, memo) for key, value in self.items()}
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (_FrozenDict, (dict(self),))
+
+
+class _FrozenList(list):
+    """Read-only list for memoized schema fragments (see _FrozenDict)."""
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = remove = pop = clear = sort = reverse = _read_only
+
+    def __copy__(self) -> list[Any]:
+        return list(self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> list[Any]:
+        return [copy.deepcopy(value, memo) for value in self]
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (_FrozenList, (list(self),))
+
+
+def _components_key(components: list[dict] | None) -> ComponentsKey | None:
+    """Canonical, hashable form of ABI tuple components.
+
+    Only the keys that affect the parsed type (name, type, internalType
+    struct name and nested components) are kept.
+    """
+    if not components:
+        return None
+    return tuple(
+        (
+            c.get("name"),
+            c.get("type", ""),
+            _struct_name(c.get("internalType")),
+            _components_key(c.get("components")),
+        )
+        for c in components
+    )
+
+
+def _struct_name(internal_type: str | None) -> str | None:
+    """Struct name from an internalType such as "struct IPool.Key[]"."""
+    if not internal_type:
+        return None
+    match = STRUCT_PATTERN.match(internal_type)
+    return match.group(1) if match else None
+
+
+@lru_cache(maxsize=TYPE_CACHE_SIZE)
+def _parse(type_str: str, components: ComponentsKey | None, struct_name: str | None) -> SolidityType:
+    """Parse a Solidity type string (memoized, see TypeMapper.parse_type)."""
+    # Handle arrays first
+    array_match = ARRAY_PATTERN.match(type_str)
+    if array_match:
+        base = array_match.group(1)
+        # Extract all array dimensions
+        dimensions = DIMENSION_PATTERN.findall(type_str)
+        inner_type = _parse(base, components, struct_name)
+        array_length = int(dimensions[-1]) if dimensions[-1] else None
+
+        # For multi-dimensional arrays, we need to build from inside out
+        # For address[][], the base_type of outer array should be "address[]"
+        if len(dimensions) > 1:
+            base_type = base + "".join(f"[{d}]" for d in dimensions[:-1])
+        else:
+            base_type = inner_type.base_type
+        return SolidityType(
+            base_type=sys.intern(base_type),
+            is_array=True,
+            array_length=array_length,
+            is_tuple=inner_type.is_tuple,
+            tuple_components=inner_type.tuple_components,
+            tuple_names=inner_type.tuple_names,
+            struct_name=inner_type.struct_name,
+        )
+
+    # Handle tuple types (structs)
+    if type_str == "tuple" and components:
+        return SolidityType(
+            base_type="tuple",
+            is_tuple=True,
+            tuple_components=tuple(
+                _parse(c_type, c_components, c_struct)
+                for _, c_type, c_struct, c_components in components
+            ),
+            tuple_names=tuple(
+                name if name is not None else f"field_{i}"
+                for i, (name, _, _, _) in enumerate(components)
+            ),
+            struct_name=struct_name,
+        )
+
+    # Handle integers and bytes with size normalization
+    uint_match = UINT_PATTERN.match(type_str)
+    if uint_match:
+        return SolidityType(base_type=sys.intern(f"uint{uint_match.group(1) or '256'}"))
+
+    int_match = INT_PATTERN.match(type_str)
+    if int_match:
+        return SolidityType(base_type=sys.intern(f"int{int_match.group(1) or '256'}"))
+
+    bytes_match = BYTES_PATTERN.match(type_str)
+    if bytes_match:
+        return SolidityType(base_type=sys.intern(f"bytes{bytes_match.group(1) or ''}"))
+
+    # Default: return as-is
+    return SolidityType(base_type=sys.intern(type_str))
+
+
+@lru_cache(maxsize=TYPE_CACHE_SIZE)
+def _schema(
+    solidity_type: SolidityType,
+    param_name: str | None,
+    param_description: str | None,
+) -> dict[str, Any]:
+    """Build the JSON Schema of a type.
+
+    The result and its fragments are read-only, so they can be shared
+    between cached schemas instead of being copied.
+    """
+    # Handle arrays
+    if solidity_type.is_array:
+        schema: dict[str, Any] = {
+            "type": "array",
+            "items": _schema(solidity_type.element_type(), None, None),
+        }
+        # Add length constraints for fixed arrays
+        if solidity_type.array_length is not None:
+            schema["minItems"] = solidity_type.array_length
+            schema["maxItems"] = solidity_type.array_length
+        return _FrozenDict(schema)
+
+    # Handle tuples (structs)
+    if solidity_type.is_tuple:
+        properties = {}
+        for i, (comp, name) in enumerate(_fields(solidity_type)):
+            prop_name = name or f"field_{i}"
+            properties[prop_name] = _schema(comp, prop_name, None)
+
+        return _FrozenDict(
+            {
+                "type": "object",
+                "properties": _FrozenDict(properties),
+                "required": _FrozenList(properties),
+                "additionalProperties": False,
+            }
+        )
+
+    # Handle basic types
+    base_type = solidity_type.base_type
+
+    if base_type in SOLIDITY_TO_JSON_SCHEMA:
+        schema = SOLIDITY_TO_JSON_SCHEMA[base_type].copy()
+    else:
+        # Unknown type - default to string with warning
+        schema = {
+            "type": "string",
+            "description": f"Unknown Solidity type: {base_type}",
+        }
+
+    # Add custom description if provided
+    if param_description:
+        schema["description"] = param_description
+    elif param_name:
+        # Generate description from parameter name
+        if "description" not in schema:
+            schema["description"] = _camel_to_readable(param_name)
+
+    return _FrozenDict(schema)
+
+
+def _fields(solidity_type: SolidityType) -> list[tuple[SolidityType, str]]:
+    """(component type, name) pairs of a tuple type."""
+    return list(
+        zip(
+            solidity_type.tuple_components or (),
+            solidity_type.tuple_names or (),
+            strict=False,
+        )
+    )
+
+
+def _camel_to_readable(name: str) -> str:
+    """Convert camelCase to a readable string with spaces."""
+    # Insert spaces before capitals
+    result = re.sub(r"([A-Z])", r" \1", name)
+    # Clean up and capitalize first letter
+    return result.strip().capitalize()
 
 
 class TypeMapper:
@@ -39,6 +290,10 @@ class TypeMapper:
     JSON Schema definitions, including complex types like arrays
     and tuples (structs).
 
+    Parsed types and schemas are memoized per process in bounded LRU caches
+    (TYPE_CACHE_SIZE entries), so mapping many functions or contracts that
+    use the same types parses and builds each type only once.
+
     Example:
         >>> mapper = TypeMapper()
         >>> schema = mapper.to_json_schema(mapper.parse_type("address"))
@@ -47,171 +302,105 @@ class TypeMapper:
     """
 
     # Regex patterns for type parsing
-    ARRAY_PATTERN = re.compile(r"^(.+?)(\[(\d*)\])+$")
-    UINT_PATTERN = re.compile(r"^uint(\d+)?$")
-    INT_PATTERN = re.compile(r"^int(\d+)?$")
-    BYTES_PATTERN = re.compile(r"^bytes(\d+)?$")
+    ARRAY_PATTERN = ARRAY_PATTERN
+    UINT_PATTERN = UINT_PATTERN
+    INT_PATTERN = INT_PATTERN
+    BYTES_PATTERN = BYTES_PATTERN
 
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize the TypeMapper."""
         self.custom_types: dict[str, dict[str, Any]] = {}
 
-    def parse_type(self, type_str: str, components: list[dict] | None = None) -> SolidityType:
+    def parse_type(
+        self,
+        type_str: str,
+        components: list[dict] | None = None,
+        internal_type: str | None = None,
+    ) -> SolidityType:
         """Parse a Solidity type string into structured form.
 
         Args:
             type_str: Solidity type string (e.g., "uint256", "address[]")
             components: Tuple components for struct types
+            internal_type: Compiler internalType, used to name structs
 
         Returns:
-            SolidityType representing the parsed type
+            SolidityType representing the parsed type (shared, immutable)
         """
-        # Handle arrays first
-        array_match = self.ARRAY_PATTERN.match(type_str)
-        if array_match:
-            base = array_match.group(1)
-            # Extract all array dimensions
-            dimensions = re.findall(r"\[(\d*)\]", type_str)
-
-            # For multi-dimensional arrays, we need to build from inside out
-            # For address[][], the base_type of outer array should be "address[]"
-            if len(dimensions) > 1:
-                # Build the inner array type string
-                inner_array_str = base + "".join(f"[{d}]" for d in dimensions[:-1])
-                return SolidityType(
-                    base_type=inner_array_str,  # This will be recursively parsed by to_json_schema
-                    is_array=True,
-                    array_length=int(dimensions[-1]) if dimensions[-1] else None,
-                )
-            else:
-                # Single-dimensional array
-                inner_type = self.parse_type(base, components)
-                return SolidityType(
-                    base_type=inner_type.base_type,
-                    is_array=True,
-                    array_length=int(dimensions[0]) if dimensions[0] else None,
-                    is_tuple=inner_type.is_tuple,
-                    tuple_components=inner_type.tuple_components,
-                    tuple_names=inner_type.tuple_names,
-                )
-
-        # Handle tuple types (structs)
-        if type_str == "tuple" and components:
-            return SolidityType(
-                base_type="tuple",
-                is_tuple=True,
-                tuple_components=[
-                    self.parse_type(c["type"], c.get("components")) for c in components
-                ],
-                tuple_names=[c.get("name", f"field_{i}") for i, c in enumerate(components)],
-            )
-
-        # Handle unsigned integers with size normalization
-        uint_match = self.UINT_PATTERN.match(type_str)
-        if uint_match:
-            size = uint_match.group(1)
-            return SolidityType(base_type=f"uint{size or '256'}")
-
-        # Handle signed integers with size normalization
-        int_match = self.INT_PATTERN.match(type_str)
-        if int_match:
-            size = int_match.group(1)
-            return SolidityType(base_type=f"int{size or '256'}")
-
-        # Handle bytes with size normalization
-        bytes_match = self.BYTES_PATTERN.match(type_str)
-        if bytes_match:
-            size = bytes_match.group(1)
-            return SolidityType(base_type=f"bytes{size or ''}")
-
-        # Default: return as-is
-        return SolidityType(base_type=type_str)
+        return _parse(type_str, _components_key(components), _struct_name(internal_type))
 
     def to_json_schema(
         self,
         solidity_type: SolidityType,
         param_name: str | None = None,
         param_description: str | None = None,
+        defs: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """Convert a SolidityType to JSON Schema.
 
+        The returned dict is a shallow copy of the memoized schema: its
+        top-level keys may be changed, but nested fragments are shared
+        between results and raise TypeError when modified. Use
+        copy.deepcopy() to get a fully mutable schema.
+
         Args:
             solidity_type: Parsed Solidity type
             param_name: Optional parameter name for description generation
             param_description: Optional explicit description
+            defs: If given, struct schemas are added to it and referenced
+                with "$ref": "#/$defs/<name>", so a struct used several
+                times is defined once. Place it under "$defs" in the root
+                schema.
 
         Returns:
             JSON Schema dictionary
         """
-        # Handle arrays
+        if defs is not None:
+            return self._to_json_schema_with_defs(solidity_type, param_name, param_description, defs)
+        return dict(_schema(solidity_type, param_name, param_description))
+
+    def _to_json_schema_with_defs(
+        self,
+        solidity_type: SolidityType,
+        param_name: str | None,
+        param_description: str | None,
+        defs: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Build a schema whose structs are references into defs."""
         if solidity_type.is_array:
-            # Check if base_type itself is an array (nested arrays)
-            if self.ARRAY_PATTERN.match(solidity_type.base_type):
-                # Recursively parse the inner array type
-                inner_type = self.parse_type(solidity_type.base_type)
-            else:
-                # Create inner type without the array flag
-                inner_type = SolidityType(
-                    base_type=solidity_type.base_type,
-                    is_tuple=solidity_type.is_tuple,
-                    tuple_components=solidity_type.tuple_components,
-                    tuple_names=solidity_type.tuple_names,
-                )
             schema: dict[str, Any] = {
                 "type": "array",
-                "items": self.to_json_schema(inner_type),
+                "items": self._to_json_schema_with_defs(
+                    solidity_type.element_type(), None, None, defs
+                ),
             }
-            # Add length constraints for fixed arrays
             if solidity_type.array_length is not None:
                 schema["minItems"] = solidity_type.array_length
                 schema["maxItems"] = solidity_type.array_length
             return schema
 
-        # Handle tuples (structs)
-        if solidity_type.is_tuple:
-            properties = {}
-            required = []
-
-            for i, (comp, name) in enumerate(
-                zip(
-                    solidity_type.tuple_components or [],
-                    solidity_type.tuple_names or [],
-                    strict=False,
-                )
-            ):
-                prop_name = name or f"field_{i}"
-                properties[prop_name] = self.to_json_schema(comp, prop_name)
-                required.append(prop_name)
-
-            return {
-                "type": "object",
-                "properties": properties,
-                "required": required,
-                "additionalProperties": False,
-            }
-
-        # Handle basic types
-        base_type = solidity_type.base_type
+        if not solidity_type.is_tuple:
+            return dict(_schema(solidity_type, param_name, param_description))
 
-        if base_type in SOLIDITY_TO_JSON_SCHEMA:
-            schema = SOLIDITY_TO_JSON_SCHEMA[base_type].copy()
-        else:
-            # Unknown type - default to string with warning
-            schema = {
-                "type": "string",
-                "description": f"Unknown Solidity type: {base_type}",
-            }
-
-        # Add custom description if provided
-        if param_description:
-            schema["description"] = param_description
-        elif param_name:
-            # Generate description from parameter name
-            readable_name = self._camel_to_readable(param_name)
-            if "description" not in schema:
-                schema["description"] = readable_name
+        properties = {}
+        for i, (comp, name) in enumerate(_fields(solidity_type)):
+            prop_name = name or f"field_{i}"
+            properties[prop_name] = self._to_json_schema_with_defs(comp, prop_name, None, defs)
+        definition = {
+            "type": "object",
+            "properties": properties,
+            "required": list(properties),
+            "additionalProperties": False,
+        }
 
-        return schema
+        # Same struct: reuse its entry. Different struct, same name: suffix.
+        base = solidity_type.struct_name or "Tuple"
+        name, n = base, 1
+        while name in defs and defs[name] != definition:
+            n += 1
+            name = f"{base}_{n}"
+        defs[name] = definition
+        return {"$ref": f"#/$defs/{name}"}
 
     def to_python_type(self, solidity_type: SolidityType) -> str:
         """Convert SolidityType to Python type hint string.
@@ -223,13 +412,7 @@ class TypeMapper:
             Python type hint string (e.g., "str", "int", "List[str]")
         """
         if solidity_type.is_array:
-            inner_type = SolidityType(
-                base_type=solidity_type.base_type,
-                is_tuple=solidity_type.is_tuple,
-                tuple_components=solidity_type.tuple_components,
-                tuple_names=solidity_type.tuple_names,
-            )
-            inner_python = self.to_python_type(inner_type)
+            inner_python = self.to_python_type(solidity_type.element_type())
             return f"List[{inner_python}]"
 
         if solidity_type.is_tuple:
@@ -247,16 +430,18 @@ class TypeMapper:
         Returns:
             Human-readable string with spaces
         """
-        # Insert spaces before capitals
-        result = re.sub(r"([A-Z])", r" \1", name)
-        # Clean up and capitalize first letter
-        return result.strip().capitalize()
+        return _camel_to_readable(name)
 
-    def map_function_params(self, params: list[dict[str, Any]]) -> tuple[dict[str, Any], list[str]]:
+    def map_function_params(
+        self,
+        params: list[dict[str, Any]],
+        defs: dict[str, Any] | None = None,
+    ) -> tuple[dict[str, Any], list[str]]:
         """Map function parameters to JSON Schema properties.
 
         Args:
             params: List of ABI parameter dictionaries
+            defs: If given, collects struct schemas (see to_json_schema)
 
         Returns:
             Tuple of (properties dict, required list)
@@ -266,20 +451,24 @@ class TypeMapper:
 
         for i, param in enumerate(params):
             param_name = param.get("name") or f"arg{i}"
-            param_type = param.get("type", "uint256")
-            components = param.get("components")
-
-            solidity_type = self.parse_type(param_type, components)
-            properties[param_name] = self.to_json_schema(solidity_type, param_name=param_name)
+            solidity_type = self._parse_param(param)
+            properties[param_name] = self.to_json_schema(
+                solidity_type, param_name=param_name, defs=defs
+            )
             required.append(param_name)
 
         return properties, required
 
-    def map_function_outputs(self, outputs: list[dict[str, Any]]) -> dict[str, Any]:
+    def map_function_outputs(
+        self,
+        outputs: list[dict[str, Any]],
+        defs: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
         """Map function outputs to JSON Schema.
 
         Args:
             outputs: List of ABI output dictionaries
+            defs: If given, collects struct schemas (see to_json_schema)
 
         Returns:
             JSON Schema for the return value
@@ -289,17 +478,21 @@ class TypeMapper:
 
         if len(outputs) == 1:
             output = outputs[0]
-            solidity_type = self.parse_type(output.get("type", "uint256"), output.get("components"))
-            return self.to_json_schema(solidity_type, output.get("name"))
+            return self.to_json_schema(self._parse_param(output), output.get("name"), defs=defs)
 
         # Multiple outputs → object
         properties = {}
         for i, output in enumerate(outputs):
             name = output.get("name") or f"output{i}"
-            solidity_type = self.parse_type(output.get("type", "uint256"), output.get("components"))
-            properties[name] = self.to_json_schema(solidity_type, name)
+            properties[name] = self.to_json_schema(self._parse_param(output), name, defs=defs)
 
         return {
             "type": "object",
             "properties": properties,
         }
+
+    def _parse_param(self, param: dict[str, Any]) -> SolidityType:
+        """Parse the type of an ABI parameter dictionary."""
+        return self.parse_type(
+            param.get("type", "uint256"), param.get("components"), param.get("internalType")
+        )
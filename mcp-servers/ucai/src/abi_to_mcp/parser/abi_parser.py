@@ -39,8 +39,17 @@ class ABIParser:
         print(f"Detected: {parsed.detected_standard}")
     """
 
-    def __init__(self):
-        """Initialize parser with sub-parsers."""
+    def __init__(self, keep_raw_abi: bool = True):
+        """
+        Initialize parser with sub-parsers.
+
+        Args:
+            keep_raw_abi: Keep the ABI JSON in ParsedABI.raw_abi. Turn off to
+                save memory when only the parsed entries are needed (e.g.
+                analysing many ABIs); servers cannot be generated from the
+                result.
+        """
+        self.keep_raw_abi = keep_raw_abi
         self.function_parser = FunctionParser()
         self.event_parser = EventParser()
         self.error_parser = ErrorParser()
@@ -131,7 +140,7 @@ class ABIParser:
             functions=functions,
             events=events,
             errors=errors,
-            raw_abi=abi,
+            raw_abi=abi if self.keep_raw_abi else [],
             detected_standard=detected_standard,
             has_constructor=has_constructor,
             has_fallback=has_fallback,
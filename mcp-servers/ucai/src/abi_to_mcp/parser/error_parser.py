@@ -17,11 +17,11 @@ class ErrorParser:
         try:
             name = entry.get("name", "")
             inputs = [
-                ABIParameter(
+                ABIParameter.interned(
                     name=p.get("name", ""),
                     type=p.get("type", "uint256"),
                     components=[
-                        ABIParameter(name=c.get("name", ""), type=c.get("type", ""))
+                        ABIParameter.interned(name=c.get("name", ""), type=c.get("type", ""))
                         for c in p.get("components", [])
                     ]
                     if "components" in p
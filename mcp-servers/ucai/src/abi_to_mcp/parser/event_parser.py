@@ -6,6 +6,7 @@ event entries from an ABI.
 AGENT 1: This file needs full implementation. See AGENTS.md for requirements.
 """
 
+import sys
 from typing import Any
 
 from abi_to_mcp.core.exceptions import ABIParseError
@@ -55,7 +56,7 @@ class EventParser:
             inputs = [self._parse_parameter(p) for p in entry.get("inputs", [])]
 
             return ABIEvent(
-                name=name,
+                name=sys.intern(name),
                 inputs=inputs,
                 anonymous=anonymous,
             )
@@ -74,7 +75,7 @@ class EventParser:
         if "components" in param:
             components = [self._parse_parameter(c) for c in param["components"]]
 
-        return ABIParameter(
+        return ABIParameter.interned(
             name=name,
             type=param_type,
             indexed=indexed,
@@ -6,6 +6,7 @@ function entries from an ABI.
 AGENT 1: This file needs full implementation. See AGENTS.md for requirements.
 """
 
+import sys
 from typing import Any
 
 from abi_to_mcp.core.exceptions import ABIParseError
@@ -73,7 +74,7 @@ class FunctionParser:
             state_mutability = StateMutability(state_mutability_str)
 
             return ABIFunction(
-                name=name,
+                name=sys.intern(name),
                 inputs=inputs,
                 outputs=outputs,
                 state_mutability=state_mutability,
@@ -108,7 +109,7 @@ class FunctionParser:
         if "components" in param:
             components = [self.parse_parameter(c) for c in param["components"]]
 
-        return ABIParameter(
+        return ABIParameter.interned(
             name=name,
             type=param_type,
             indexed=indexed,
@@ -1,6 +1,8 @@
 """Runtime utilities for Web3 and transaction handling."""
 
 from abi_to_mcp.runtime.web3_client import Web3Client
+from abi_to_mcp.runtime.batch import RPCBatch, BatchResult
+from abi_to_mcp.runtime.failover import FailoverHTTPProvider, EndpointStats
 from abi_to_mcp.runtime.transaction import TransactionBuilder
 from abi_to_mcp.runtime.simulator import TransactionSimulator
 from abi_to_mcp.runtime.signer import TransactionSigner
@@ -8,6 +10,10 @@ from abi_to_mcp.runtime.gas import GasEstimator, GasPrice
 
 __all__ = [
     "Web3Client",
+    "RPCBatch",
+    "BatchResult",
+    "FailoverHTTPProvider",
+    "EndpointStats",
     "TransactionBuilder",
     "TransactionSimulator",
     "TransactionSigner",
@@ -0,0 +1,270 @@
+"""JSON-RPC batch requests for Web3Client."""
+
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Type
+
+from hexbytes import HexBytes
+
+from abi_to_mcp.core.exceptions import NetworkError
+from abi_to_mcp.utils.logging import get_logger
+from abi_to_mcp.utils.validation import to_checksum_address
+
+if TYPE_CHECKING:
+    from abi_to_mcp.runtime.web3_client import Web3Client
+
+logger = get_logger(__name__)
+
+# Provider errors that mean "this batch is too large" mention the batch
+# together with one of these (e.g. "batch too large", "batch size limit
+# exceeded", "too many requests in batch")
+_BATCH_SIZE_ERROR_HINTS = (
+    "too many",
+    "too large",
+    "size",
+    "limit",
+    "exceed",
+)
+
+# Rate limit errors are not about the batch size, even when they mention it
+_RATE_LIMIT_ERROR_HINTS = ("rate limit", "throttl", "429")
+
+
+class _BatchTooLarge(Exception):
+    """The endpoint rejected a batch because of its size."""
+
+
+def _to_int(value: Any) -> int:
+    """Decode a hex quantity."""
+    return int(value, 16) if isinstance(value, str) else int(value)
+
+
+def _block_id(block_identifier: Any) -> Any:
+    """Encode a block number as a hex quantity, leaving tags ("latest") alone."""
+    if isinstance(block_identifier, int):
+        return hex(block_identifier)
+    return block_identifier
+
+
+class BatchResult:
+    """
+    Result of one call queued in an RPCBatch.
+
+    Like a future, it is resolved when the batch is sent: result() returns
+    the decoded value or raises the call's error.
+    """
+
+    def __init__(self, method: str):
+        self.method = method
+        self._done = False
+        self._value: Any = None
+        self._error: Optional[Exception] = None
+
+    def done(self) -> bool:
+        """Check whether the batch containing this call was sent."""
+        return self._done
+
+    def result(self) -> Any:
+        """
+        Get the decoded result.
+
+        Raises:
+            NetworkError: If the call failed or the batch was not sent yet
+        """
+        if not self._done:
+            raise NetworkError(f"{self.method} has not been sent yet; the batch is sent on exit")
+        if self._error is not None:
+            raise self._error
+        return self._value
+
+    def exception(self) -> Optional[Exception]:
+        """Get the call's error, or None if it succeeded."""
+        return self._error
+
+    def _set_result(self, value: Any) -> None:
+        self._value = value
+        self._done = True
+
+    def _set_exception(self, error: Exception) -> None:
+        self._error = error
+        self._done = True
+
+
+class RPCBatch:
+    """
+    Queue JSON-RPC calls and send them as batch requests.
+
+    Calls queued inside a `with client.batch() as batch:` block are sent when
+    the block exits, as JSON-RPC arrays of at most chunk_size calls. When an
+    endpoint rejects a batch as too large, it is split in half and the
+    smaller size is kept by the client for later batches. Providers without
+    batch support get one request per call.
+
+    A failing call only fails its own BatchResult.
+    """
+
+    def __init__(self, client: "Web3Client", chunk_size: Optional[int] = None):
+        """
+        Initialize batch.
+
+        Args:
+            client: Web3Client to send the batch with
+            chunk_size: Maximum calls per request (default: client.batch_size)
+        """
+        self.client = client
+        self.chunk_size = max(1, chunk_size or client.batch_size)
+        self._pending: List[Tuple[str, list, Optional[Callable], BatchResult]] = []
+
+    def __enter__(self) -> "RPCBatch":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if exc_type is None:
+            self.execute()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def add(
+        self,
+        method: str,
+        params: list,
+        formatter: Optional[Callable[[Any], Any]] = None,
+    ) -> BatchResult:
+        """
+        Queue a raw JSON-RPC call.
+
+        Args:
+            method: JSON-RPC method, e.g. "eth_getBalance"
+            params: Method parameters
+            formatter: Optional function decoding the raw result
+
+        Returns:
+            BatchResult resolved when the batch is sent
+        """
+        result = BatchResult(method)
+        self._pending.append((method, params, formatter, result))
+        return result
+
+    def get_balance(self, address: str, block_identifier: Any = "latest") -> BatchResult:
+        """Queue eth_getBalance (result: wei)."""
+        return self.add(
+            "eth_getBalance",
+            [to_checksum_address(address), _block_id(block_identifier)],
+            _to_int,
+        )
+
+    def get_code(self, address: str, block_identifier: Any = "latest") -> BatchResult:
+        """Queue eth_getCode (result: bytes)."""
+        return self.add(
+            "eth_getCode",
+            [to_checksum_address(address), _block_id(block_identifier)],
+            HexBytes,
+        )
+
+    def get_transaction_count(
+        self, address: str, block_identifier: Any = "latest"
+    ) -> BatchResult:
+        """Queue eth_getTransactionCount (result: nonce)."""
+        return self.add(
+            "eth_getTransactionCount",
+            [to_checksum_address(address), _block_id(block_identifier)],
+            _to_int,
+        )
+
+    def get_block_number(self) -> BatchResult:
+        """Queue eth_blockNumber."""
+        return self.add("eth_blockNumber", [], _to_int)
+
+    def get_chain_id(self) -> BatchResult:
+        """Queue eth_chainId."""
+        return self.add("eth_chainId", [], _to_int)
+
+    def call(self, transaction: Dict[str, Any], block_identifier: Any = "latest") -> BatchResult:
+        """Queue eth_call (result: raw return data)."""
+        return self.add("eth_call", [transaction, _block_id(block_identifier)], HexBytes)
+
+    def execute(self) -> List[BatchResult]:
+        """
+        Send every queued call.
+
+        Returns:
+            Results of the sent calls, in queue order
+        """
+        calls, self._pending = self._pending, []
+        start = 0
+        while start < len(calls):
+            chunk = calls[start:start + self.chunk_size]
+            try:
+                responses = self._request([(method, params) for method, params, _, _ in chunk])
+            except _BatchTooLarge:
+                self.chunk_size = max(1, len(chunk) // 2)
+                self.client.batch_size = min(self.client.batch_size, self.chunk_size)
+                logger.debug(f"Batch of {len(chunk)} rejected, retrying with {self.chunk_size}")
+                continue
+            except Exception as e:
+                for _, _, _, result in chunk:
+                    result._set_exception(
+                        NetworkError(f"Batch request failed for {self.client.network}: {e}")
+                    )
+            else:
+                for (method, _, formatter, result), response in zip(chunk, responses, strict=True):
+                    self._resolve(method, formatter, result, response)
+            start += len(chunk)
+
+        return [result for _, _, _, result in calls]
+
+    def _request(self, requests: List[Tuple[str, list]]) -> List[Dict[str, Any]]:
+        """Send one chunk and return its responses in request order."""
+        # make_batch_request is missing from older providers (handled below)
+        provider: Any = self.client.w3.provider
+        try:
+            responses: List[Dict[str, Any]] = provider.make_batch_request(requests)
+        except (AttributeError, NotImplementedError):
+            return [provider.make_request(method, params) for method, params in requests]
+        except Exception as e:
+            if len(requests) > 1 and self._is_size_error(str(e)):
+                raise _BatchTooLarge() from e
+            raise
+
+        if isinstance(responses, dict):
+            # The whole batch was rejected with a single error
+            error = responses.get("error", responses)
+            if len(requests) > 1 and self._is_size_error(str(error)):
+                raise _BatchTooLarge()
+            raise NetworkError(str(error))
+        if len(responses) != len(requests):
+            raise NetworkError(
+                f"Expected {len(requests)} batch responses, received {len(responses)}"
+            )
+        return responses
+
+    @staticmethod
+    def _is_size_error(message: str) -> bool:
+        message = message.lower()
+        if "batch" not in message or any(hint in message for hint in _RATE_LIMIT_ERROR_HINTS):
+            return False
+        return any(hint in message for hint in _BATCH_SIZE_ERROR_HINTS)
+
+    @staticmethod
+    def _resolve(
+        method: str,
+        formatter: Optional[Callable[[Any], Any]],
+        result: BatchResult,
+        response: Dict[str, Any],
+    ) -> None:
+        """Decode one response into its BatchResult."""
+        error = response.get("error")
+        if error:
+            message = error.get("message", error) if isinstance(error, dict) else error
+            result._set_exception(NetworkError(f"{method} failed: {message}"))
+            return
+        try:
+            value = response.get("result")
+            result._set_result(formatter(value) if formatter and value is not None else value)
+        except Exception as e:
+            result._set_exception(NetworkError(f"Invalid {method} result: {e}"))
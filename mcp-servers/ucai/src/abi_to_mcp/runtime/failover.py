@@ -0,0 +1,259 @@
+"""Multi-endpoint JSON-RPC provider with failover and latency-based routing."""
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from web3 import Web3
+from web3.providers.base import JSONBaseProvider
+from web3.types import RPCEndpoint
+
+from abi_to_mcp.core.exceptions import NetworkError
+from abi_to_mcp.runtime.sessions import get_session
+from abi_to_mcp.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Read-only methods that are safe to send to two endpoints at once
+HEDGED_METHODS = frozenset(
+    {
+        "eth_blockNumber",
+        "eth_call",
+        "eth_chainId",
+        "eth_estimateGas",
+        "eth_feeHistory",
+        "eth_gasPrice",
+        "eth_getBalance",
+        "eth_getBlockByHash",
+        "eth_getBlockByNumber",
+        "eth_getCode",
+        "eth_getLogs",
+        "eth_getStorageAt",
+        "eth_getTransactionByHash",
+        "eth_getTransactionCount",
+        "eth_getTransactionReceipt",
+        "eth_maxPriorityFeePerGas",
+        "net_version",
+        "web3_clientVersion",
+    }
+)
+
+
+@dataclass
+class EndpointStats:
+    """Health of one RPC endpoint."""
+
+    url: str
+    latency: Optional[float] = None  # EWMA seconds, None until the first success
+    error_rate: float = 0.0  # EWMA of failures (0-1)
+    requests: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    trips: int = 0  # Times the circuit opened in a row
+    open_until: float = 0.0  # Monotonic time the circuit stays open until
+
+    def is_open(self, now: float) -> bool:
+        """Check whether the endpoint is ejected (circuit open)."""
+        return now < self.open_until
+
+    def score(self) -> float:
+        """
+        Routing cost in seconds (lower is better).
+
+        Latency is inflated by the error rate, and errors add up to a second
+        so endpoints that never answered still rank below working ones.
+        """
+        return (self.latency or 0.0) * (1 + 4 * self.error_rate) + self.error_rate
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Snapshot for status reporting."""
+        return {
+            "url": self.url,
+            "latency_ms": round(self.latency * 1000, 1) if self.latency is not None else None,
+            "error_rate": round(self.error_rate, 3),
+            "requests": self.requests,
+            "failures": self.failures,
+            "ejected": self.is_open(time.monotonic()),
+        }
+
+
+class FailoverHTTPProvider(JSONBaseProvider):
+    """
+    Send JSON-RPC requests over several HTTP endpoints.
+
+    Each endpoint tracks an exponentially weighted moving average (EWMA) of
+    its latency and error rate. Requests go to the endpoint with the lowest
+    score. Ties go to the earlier URL, so the list is also a preference
+    order. A request that fails with a transport error (connection error,
+    timeout or HTTP error) is retried on the next endpoint. JSON-RPC error
+    responses such as reverts are returned as they are.
+
+    After failure_threshold consecutive failures an endpoint is ejected
+    (circuit breaker). It is ejected for backoff seconds, then twice as long
+    after each further failure, up to max_backoff. It is tried again once
+    that time has passed. When every endpoint is ejected, they are all tried
+    anyway.
+
+    Read-only requests still running after hedge_after seconds are also
+    sent to the next endpoint, and the first answer is used.
+    """
+
+    def __init__(
+        self,
+        endpoint_uris: List[str],
+        request_kwargs: Optional[Dict[str, Any]] = None,
+        hedge_after: Optional[float] = 1.0,
+        failure_threshold: int = 3,
+        backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        ewma_alpha: float = 0.3,
+    ):
+        """
+        Initialize provider.
+
+        Args:
+            endpoint_uris: RPC URLs, most preferred first
+            request_kwargs: Keyword arguments for every HTTP request (e.g. timeout)
+            hedge_after: Seconds before a read is hedged (None disables hedging)
+            failure_threshold: Consecutive failures that eject an endpoint
+            backoff: First ejection period in seconds
+            max_backoff: Longest ejection period in seconds
+            ewma_alpha: Weight of the newest sample in the moving averages
+        """
+        super().__init__()
+        if not endpoint_uris:
+            raise ValueError("At least one endpoint is required")
+
+        self.hedge_after = hedge_after
+        self.failure_threshold = max(1, failure_threshold)
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.ewma_alpha = ewma_alpha
+        self.stats = [EndpointStats(url) for url in endpoint_uris]
+        self._providers = [
+            Web3.HTTPProvider(url, request_kwargs=request_kwargs, session=get_session(url))
+            for url in endpoint_uris
+        ]
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def __str__(self) -> str:
+        return f"FailoverHTTPProvider({', '.join(s.url for s in self.stats)})"
+
+    @property
+    def endpoint_uri(self) -> str:
+        """URL of the endpoint currently preferred."""
+        return self.stats[self._ranked()[0]].url
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> Any:
+        """Send a request, hedging reads and failing over on transport errors."""
+        def send(provider: Any) -> Any:
+            return provider.make_request(method, params)
+
+        if method in HEDGED_METHODS and self.hedge_after is not None and len(self.stats) > 1:
+            return self._hedged(send)
+        return self._failover(send)
+
+    def make_batch_request(self, requests: List[Tuple[RPCEndpoint, Any]]) -> Any:
+        """Send a batch request, failing over on transport errors."""
+        return self._failover(lambda provider: provider.make_batch_request(requests))
+
+    def endpoint_status(self) -> List[Dict[str, Any]]:
+        """Health of every endpoint, in routing order."""
+        with self._lock:
+            return [self.stats[i].to_dict() for i in self._ranked()]
+
+    def _ranked(self) -> List[int]:
+        """Endpoint indexes in the order they should be tried."""
+        now = time.monotonic()
+        closed = [i for i, s in enumerate(self.stats) if not s.is_open(now)]
+        ejected = [i for i, s in enumerate(self.stats) if s.is_open(now)]
+        closed.sort(key=lambda i: self.stats[i].score())
+        ejected.sort(key=lambda i: self.stats[i].open_until)
+        return closed + ejected
+
+    def _send(self, index: int, send: Callable) -> Any:
+        """Send through one endpoint and record the outcome."""
+        start = time.monotonic()
+        try:
+            response = send(self._providers[index])
+        except Exception:
+            self._record(index, None)
+            raise
+        self._record(index, time.monotonic() - start)
+        return response
+
+    def _record(self, index: int, latency: Optional[float]) -> None:
+        """Update an endpoint's moving averages and circuit breaker."""
+        alpha = self.ewma_alpha
+        with self._lock:
+            stats = self.stats[index]
+            stats.requests += 1
+            if latency is not None:
+                stats.latency = (
+                    latency if stats.latency is None else alpha * latency + (1 - alpha) * stats.latency
+                )
+                stats.error_rate *= 1 - alpha
+                stats.consecutive_failures = 0
+                stats.trips = 0
+                stats.open_until = 0.0
+                return
+
+            stats.failures += 1
+            stats.error_rate = alpha + (1 - alpha) * stats.error_rate
+            stats.consecutive_failures += 1
+            if stats.consecutive_failures >= self.failure_threshold:
+                period = min(self.backoff * 2**stats.trips, self.max_backoff)
+                stats.trips += 1
+                stats.open_until = time.monotonic() + period
+                logger.warning(f"Ejecting RPC endpoint {stats.url} for {period:g}s")
+
+    def _failover(self, send: Callable, order: Optional[List[int]] = None) -> Any:
+        """Try endpoints in order until one answers, raising the last failure."""
+        error: Optional[Exception] = None
+        for index in order if order is not None else self._ranked():
+            try:
+                return self._send(index, send)
+            except Exception as e:
+                logger.debug(f"RPC endpoint {self.stats[index].url} failed: {e}")
+                error = e
+        if error is None:
+            raise NetworkError("No RPC endpoint to send the request to")
+        raise error
+
+    def _hedged(self, send: Callable) -> Any:
+        """Race the best endpoint against the next one once it is slow."""
+        order = self._ranked()
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=max(4, len(self.stats) * 4),
+                        thread_name_prefix="rpc-hedge",
+                    )
+
+        started = [order[0]]
+        pending = {self._executor.submit(self._send, order[0], send)}
+        done, _ = wait(pending, timeout=self.hedge_after)
+        if not done:
+            started.append(order[1])
+            pending.add(self._executor.submit(self._send, order[1], send))
+
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                exception = future.exception()
+                if exception is None:
+                    return future.result()
+                error = exception
+
+        # Every raced endpoint failed: fall back to the others in turn
+        remaining = [i for i in order if i not in started]
+        if remaining:
+            return self._failover(send, remaining)
+        if error is None:
+            raise NetworkError("No RPC endpoint to send the request to")
+        raise error
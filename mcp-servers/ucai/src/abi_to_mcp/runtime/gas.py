@@ -1,8 +1,11 @@
 """Gas estimation and pricing utilities."""
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from decimal import Decimal
 from dataclasses import dataclass
+from statistics import median
+
+from eth_typing import BlockNumber
 
 from abi_to_mcp.runtime.web3_client import Web3Client
 from abi_to_mcp.core.exceptions import GasEstimationError
@@ -10,6 +13,10 @@ from abi_to_mcp.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Reward percentiles requested from eth_feeHistory, one per price tier
+FEE_HISTORY_PERCENTILES = (10, 50, 75, 95)
+GAS_PRICE_TIERS = ("slow", "standard", "fast", "instant")
+
 
 @dataclass
 class GasPrice:
@@ -22,6 +29,7 @@ class GasPrice:
     base_fee: Optional[int] = None  # Wei (EIP-1559 only)
     priority_fee: Optional[int] = None  # Wei (EIP-1559 only)
     is_eip1559: bool = False
+    priority_fees: Optional[Dict[str, int]] = None  # Wei per tier (EIP-1559 only)
 
     def to_gwei(self, price: int) -> float:
         """Convert wei to gwei."""
@@ -49,16 +57,29 @@ class GasPrice:
 
 
 class GasEstimator:
-    """Estimate gas costs and provide price recommendations."""
+    """Estimate gas costs and provide price recommendations.
+
+    On EIP-1559 networks, priority fees come from ``eth_feeHistory``: the
+    10th/50th/75th/95th percentile rewards of the last ``history_blocks``
+    blocks give the slow/standard/fast/instant tiers. The window is kept in
+    memory and only blocks added since the previous call are fetched, and
+    the resulting prices are reused until a new block arrives.
+    """
 
-    def __init__(self, web3_client: Web3Client):
+    def __init__(self, web3_client: Web3Client, history_blocks: int = 20):
         """
         Initialize gas estimator.
 
         Args:
             web3_client: Web3Client instance
+            history_blocks: Number of recent blocks the percentiles cover
         """
         self.client = web3_client
+        self.history_blocks = max(1, history_blocks)
+        # Rolling window of (block number, percentile rewards), oldest first
+        self._rewards: List[Tuple[int, List[int]]] = []
+        self._next_base_fee: Optional[int] = None
+        self._cached: Optional[Tuple[int, GasPrice]] = None
 
     def get_gas_price(self) -> GasPrice:
         """
@@ -71,42 +92,16 @@ class GasEstimator:
             GasEstimationError: If price fetching fails
         """
         try:
-            # Check if network supports EIP-1559
-            latest_block = self.client.w3.eth.get_block("latest")
-            is_eip1559 = "baseFeePerGas" in latest_block
-
-            if is_eip1559:
-                base_fee = latest_block["baseFeePerGas"]
-
-                # Priority fee recommendations
-                slow_priority = int(1 * 10**9)  # 1 gwei
-                standard_priority = int(2 * 10**9)  # 2 gwei
-                fast_priority = int(3 * 10**9)  # 3 gwei
-                instant_priority = int(5 * 10**9)  # 5 gwei
-
-                # Max fee = base_fee * multiplier + priority_fee
-                return GasPrice(
-                    slow=base_fee * 2 + slow_priority,
-                    standard=base_fee * 2 + standard_priority,
-                    fast=base_fee * 2 + fast_priority,
-                    instant=base_fee * 2 + instant_priority,
-                    base_fee=base_fee,
-                    priority_fee=standard_priority,
-                    is_eip1559=True,
-                )
-
-            else:
-                # Legacy gas pricing
-                current_price = self.client.w3.eth.gas_price
-
-                # Create tiers based on current price
-                return GasPrice(
-                    slow=int(current_price * 0.8),
-                    standard=current_price,
-                    fast=int(current_price * 1.2),
-                    instant=int(current_price * 1.5),
-                    is_eip1559=False,
-                )
+            latest = self.client.w3.eth.block_number
+            if self._cached is not None and self._cached[0] == latest:
+                return self._cached[1]
+
+            price = self._fee_history_price(latest)
+            if price is None:
+                price = self._legacy_price()
+
+            self._cached = (latest, price)
+            return price
 
         except Exception as e:
             raise GasEstimationError(
@@ -114,6 +109,89 @@ class GasEstimator:
                 details={"error": str(e)},
             ) from e
 
+    def _fee_history_price(self, latest: int) -> Optional[GasPrice]:
+        """
+        EIP-1559 prices from the fee history window, updated up to latest.
+
+        Returns:
+            GasPrice, or None if the network has no base fee or does not
+            support eth_feeHistory
+        """
+        try:
+            self._update_fee_history(latest)
+        except Exception as e:
+            logger.debug(f"eth_feeHistory unavailable, using legacy gas price: {e}")
+            self._rewards = []
+            return None
+
+        if not self._next_base_fee or not self._rewards:
+            return None
+
+        # Median of each percentile across the window, kept non-decreasing by tier
+        priority_fees: Dict[str, int] = {}
+        floor = 0
+        for index, tier in enumerate(GAS_PRICE_TIERS):
+            floor = max(floor, int(median(rewards[index] for _, rewards in self._rewards)))
+            priority_fees[tier] = floor
+
+        # Max fee = base_fee * multiplier + priority_fee
+        base_fee = self._next_base_fee
+        return GasPrice(
+            slow=base_fee * 2 + priority_fees["slow"],
+            standard=base_fee * 2 + priority_fees["standard"],
+            fast=base_fee * 2 + priority_fees["fast"],
+            instant=base_fee * 2 + priority_fees["instant"],
+            base_fee=base_fee,
+            priority_fee=priority_fees["standard"],
+            is_eip1559=True,
+            priority_fees=priority_fees,
+        )
+
+    def _update_fee_history(self, latest: int) -> None:
+        """Fetch the blocks missing from the window and drop the oldest."""
+        newest = self._rewards[-1][0] if self._rewards else None
+        if newest is not None and newest > latest:
+            # The chain went back (a reorg, or a lagging node): the window's
+            # newest blocks may no longer exist, so it is fetched again
+            self._rewards = []
+            newest = None
+        if newest == latest:
+            return
+
+        # Only new blocks are requested once the window is filled
+        if newest is None or latest - newest >= self.history_blocks:
+            block_count = self.history_blocks
+            self._rewards = []
+        else:
+            block_count = latest - newest
+
+        history = self.client.w3.eth.fee_history(
+            block_count, BlockNumber(latest), list(FEE_HISTORY_PERCENTILES)
+        )
+        oldest = history["oldestBlock"]
+        if isinstance(oldest, str):
+            oldest = int(oldest, 16)
+        rewards = history.get("reward") or []
+        for offset, block_rewards in enumerate(rewards):
+            self._rewards.append((oldest + offset, [int(r) for r in block_rewards]))
+        self._rewards = self._rewards[-self.history_blocks :]
+
+        # The last base fee is the one of the next (pending) block
+        self._next_base_fee = int(history["baseFeePerGas"][-1])
+
+    def _legacy_price(self) -> GasPrice:
+        """Tiers around eth_gasPrice for networks without EIP-1559."""
+        current_price = self.client.w3.eth.gas_price
+
+        # Create tiers based on current price
+        return GasPrice(
+            slow=int(current_price * 0.8),
+            standard=current_price,
+            fast=int(current_price * 1.2),
+            instant=int(current_price * 1.5),
+            is_eip1559=False,
+        )
+
     def estimate_transaction_cost(
         self,
         gas_limit: int,
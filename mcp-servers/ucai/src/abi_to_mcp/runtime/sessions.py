@@ -0,0 +1,48 @@
+"""Process-wide HTTP session pool for RPC providers."""
+
+import threading
+from typing import Dict
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Connections kept open per RPC host
+POOL_SIZE = 20
+
+_sessions: Dict[str, requests.Session] = {}
+_lock = threading.Lock()
+
+
+def get_session(rpc_url: str) -> requests.Session:
+    """
+    Get the shared HTTP session for an RPC URL.
+
+    Every provider created for the same URL reuses one session, so
+    Web3Client instances share open (keep-alive) connections instead of
+    each opening their own.
+
+    Args:
+        rpc_url: RPC endpoint URL
+
+    Returns:
+        requests.Session with a pooled adapter
+    """
+    session = _sessions.get(rpc_url)
+    if session is None:
+        with _lock:
+            session = _sessions.get(rpc_url)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _sessions[rpc_url] = session
+    return session
+
+
+def close_sessions() -> None:
+    """Close every pooled session (they are recreated on next use)."""
+    with _lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
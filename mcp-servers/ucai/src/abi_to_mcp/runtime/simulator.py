@@ -1,10 +1,12 @@
 """Transaction simulator for testing before execution."""
 
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
 from decimal import Decimal
 
 from abi_to_mcp.runtime.web3_client import Web3Client
 from abi_to_mcp.runtime.transaction import TransactionBuilder
+from abi_to_mcp.runtime.gas import GasEstimator
 from abi_to_mcp.core.exceptions import SimulationError
 from abi_to_mcp.utils.logging import get_logger
 
@@ -23,13 +25,17 @@ class TransactionSimulator:
         """
         self.client = web3_client
         self.tx_builder = TransactionBuilder(web3_client)
+        self.gas_estimator = GasEstimator(web3_client)
 
     def simulate(
         self,
-        contract_function,
+        contract_function: Any,
         from_address: str,
         value: int = 0,
         gas_limit: Optional[int] = None,
+        state_overrides: Optional[Dict[str, Any]] = None,
+        nonce: Optional[int] = None,
+        fee_params: Optional[Dict[str, int]] = None,
     ) -> Dict[str, Any]:
         """
         Simulate a transaction.
@@ -48,17 +54,37 @@ class TransactionSimulator:
             from_address: Sender address
             value: ETH value in wei
             gas_limit: Optional gas limit
+            state_overrides: Optional eth_call state override set
+                (address -> balance/nonce/code/stateDiff) applied to both
+                the gas estimate and the call
+            nonce: Optional nonce (fetched if not provided)
+            fee_params: Optional gas pricing passed to the transaction
+                builder (gas_price or max_fee_per_gas/max_priority_fee_per_gas)
 
         Returns:
             Simulation result dictionary
         """
         try:
+            if state_overrides and gas_limit is None:
+                # web3 would estimate against the chain state, not the overridden one
+                gas_limit = self.tx_builder.estimate_gas(
+                    {
+                        "from": from_address,
+                        "to": contract_function.address,
+                        "value": value,
+                        "data": self._encode_call_data(contract_function),
+                    },
+                    state_overrides,
+                )
+
             # Build transaction
             tx = self.tx_builder.build_transaction(
                 contract_function=contract_function,
                 from_address=from_address,
                 value=value,
                 gas_limit=gas_limit,
+                nonce=nonce,
+                **(fee_params or {}),
             )
 
             # Get gas estimate
@@ -79,12 +105,16 @@ class TransactionSimulator:
             # Try to call the function to check if it reverts
             try:
                 # Use eth_call to simulate
-                result = contract_function.call(
-                    {
-                        "from": from_address,
-                        "value": value,
-                    }
-                )
+                call_tx = {
+                    "from": from_address,
+                    "value": value,
+                }
+                if state_overrides:
+                    result = contract_function.call(
+                        call_tx, block_identifier="latest", state_override=state_overrides
+                    )
+                else:
+                    result = contract_function.call(call_tx)
 
                 return {
                     "success": True,
@@ -124,25 +154,70 @@ class TransactionSimulator:
         self,
         transactions: list,
         from_address: str,
+        parallel: bool = False,
+        state_overrides: Optional[Dict[str, Any]] = None,
+        max_workers: int = 8,
     ) -> list:
         """
-        Simulate multiple transactions in sequence.
+        Simulate multiple transactions.
+
+        Fee data and the sender's nonce are fetched once for the whole batch;
+        transaction i gets nonce + i. By default transactions are simulated
+        in sequence and the batch stops at the first failure.
+
+        With parallel=True the transactions are treated as independent: they
+        are all simulated against the same state, concurrently, and a
+        failure (including a build error) becomes a failed result instead of
+        stopping the batch.
+
+        Every transaction is simulated against the current chain state:
+        eth_call never changes state, and the effects of earlier
+        transactions are not carried into later ones. A dependent sequence
+        (e.g. approve then transferFrom) is only simulated faithfully if the
+        caller supplies, for each later transaction, overrides describing
+        the state the earlier ones leave behind.
 
         Args:
-            transactions: List of (contract_function, value) tuples
+            transactions: List of (contract_function, value) or
+                (contract_function, value, state_overrides) tuples; a
+                transaction's own overrides are applied on top of the batch
+                ones, per address
             from_address: Sender address
+            parallel: Simulate independent transactions concurrently
+            state_overrides: Optional state override set applied to every
+                transaction (address -> balance/nonce/code/stateDiff)
+            max_workers: Maximum concurrent simulations in parallel mode
 
         Returns:
-            List of simulation results
+            List of simulation results, in the order of transactions
         """
-        results = []
+        if not transactions:
+            return []
+
+        fee_params = self._batch_fee_params()
+        base_nonce = self.client.get_transaction_count(from_address)
 
-        for contract_function, value in transactions:
-            result = self.simulate(
+        def run(position: int) -> Dict[str, Any]:
+            contract_function, value, *own = transactions[position]
+            overrides = dict(state_overrides or {})
+            if own and own[0]:
+                overrides.update(own[0])
+            return self.simulate(
                 contract_function=contract_function,
                 from_address=from_address,
                 value=value,
+                state_overrides=overrides or None,
+                nonce=base_nonce + position,
+                fee_params=fee_params,
             )
+
+        if parallel:
+            return self._simulate_concurrently(run, len(transactions), max_workers)
+
+        results = []
+
+        for position in range(len(transactions)):
+            result = run(position)
             results.append(result)
 
             # Stop if any transaction fails
@@ -150,3 +225,65 @@ class TransactionSimulator:
                 break
 
         return results
+
+    def _batch_fee_params(self) -> Dict[str, int]:
+        """
+        Gas pricing shared by every transaction of a batch.
+
+        Returns:
+            Transaction builder fee arguments, or an empty dict (builder
+            looks prices up itself) if they cannot be fetched
+        """
+        try:
+            price = self.gas_estimator.get_gas_price()
+        except Exception as e:
+            logger.debug(f"Batch gas price unavailable: {e}")
+            return {}
+
+        if price.is_eip1559:
+            params = {"max_fee_per_gas": price.standard}
+            if price.priority_fee is not None:
+                params["max_priority_fee_per_gas"] = price.priority_fee
+            return params
+        return {"gas_price": price.standard}
+
+    def _encode_call_data(self, contract_function: Any) -> str:
+        """Calldata of a bound contract function, through the public Contract API."""
+        # Any: encode_abi (web3 v7) and encodeABI (web3 v6) are not both typed
+        contract: Any = self.client.w3.eth.contract(abi=[contract_function.abi])
+        if hasattr(contract, "encode_abi"):
+            return str(
+                contract.encode_abi(
+                    contract_function.signature,
+                    args=contract_function.args,
+                    kwargs=contract_function.kwargs,
+                )
+            )
+        # web3 v6
+        return str(
+            contract.encodeABI(
+                fn_name=contract_function.fn_name,
+                args=contract_function.args,
+                kwargs=contract_function.kwargs,
+            )
+        )
+
+    def _simulate_concurrently(
+        self, run: Callable[[int], Dict[str, Any]], count: int, max_workers: int
+    ) -> list:
+        """Run simulations in a thread pool, turning errors into failed results."""
+
+        def run_safely(position: int) -> Dict[str, Any]:
+            try:
+                return run(position)
+            except SimulationError as e:
+                return {
+                    "success": False,
+                    "result": None,
+                    "error": str(e),
+                    "gas_estimate": 0,
+                    "transaction": None,
+                }
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, count))) as pool:
+            return list(pool.map(run_safely, range(count)))
@@ -1,6 +1,8 @@
 """Transaction builder for contract interactions."""
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, cast
+
+from web3.types import TxParams
 
 # Handle different web3.py versions
 try:
@@ -114,6 +116,10 @@ class TransactionBuilder:
                     # Fallback to legacy
                     tx["gasPrice"] = self.client.w3.eth.gas_price
 
+            # A known gas limit saves the eth_estimateGas web3 would otherwise send
+            if gas_limit is not None:
+                tx["gas"] = gas_limit
+
             # Build transaction with contract function
             tx = contract_function.build_transaction(tx)
 
@@ -130,12 +136,18 @@ class TransactionBuilder:
         except Exception as e:
             raise TransactionError(f"Failed to build transaction: {e}") from e
 
-    def estimate_gas(self, tx: Dict[str, Any]) -> int:
+    def estimate_gas(
+        self,
+        tx: Dict[str, Any],
+        state_overrides: Optional[Dict[str, Any]] = None,
+    ) -> int:
         """
         Estimate gas for transaction.
 
         Args:
             tx: Transaction dictionary
+            state_overrides: Optional eth_estimateGas state override set
+                (address -> balance/nonce/code/stateDiff)
 
         Returns:
             Estimated gas limit
@@ -145,11 +157,14 @@ class TransactionBuilder:
         """
         try:
             # Remove fields that shouldn't be in estimation
-            tx_copy = tx.copy()
-            tx_copy.pop("gas", None)
-            tx_copy.pop("nonce", None)
+            tx_copy = cast(TxParams, {k: v for k, v in tx.items() if k not in ("gas", "nonce")})
 
-            estimate = self.client.w3.eth.estimate_gas(tx_copy)
+            if state_overrides:
+                # Any: the override set's type is named differently across web3 versions
+                overrides = cast(Any, state_overrides)
+                estimate = self.client.w3.eth.estimate_gas(tx_copy, "latest", overrides)
+            else:
+                estimate = self.client.w3.eth.estimate_gas(tx_copy)
 
             # Add 20% buffer for safety
             buffered = int(estimate * 1.2)
@@ -1,9 +1,10 @@
 """Web3 client for connecting to Ethereum networks."""
 
 import os
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Union
 from web3 import Web3
 from web3.contract import Contract
+from web3.providers.base import JSONBaseProvider
 
 # Handle different web3.py versions
 try:
@@ -13,6 +14,9 @@ except ImportError:
 
 from abi_to_mcp.core.constants import NETWORKS
 from abi_to_mcp.core.exceptions import NetworkError
+from abi_to_mcp.runtime.batch import RPCBatch
+from abi_to_mcp.runtime.failover import FailoverHTTPProvider
+from abi_to_mcp.runtime.sessions import get_session
 from abi_to_mcp.utils.logging import get_logger
 from abi_to_mcp.utils.validation import to_checksum_address
 
@@ -22,10 +26,15 @@ logger = get_logger(__name__)
 class Web3Client:
     """Managed Web3 connection to Ethereum networks."""
 
+    # Calls per JSON-RPC batch request (lowered when an endpoint rejects a batch)
+    DEFAULT_BATCH_SIZE = 100
+
     def __init__(
         self,
-        rpc_url: Optional[str] = None,
+        rpc_url: Optional[Union[str, List[str]]] = None,
         network: str = "mainnet",
+        hedge_after: Optional[float] = 1.0,
+        validate_connection: bool = False,
     ):
         """
         Initialize Web3 connection.
@@ -35,9 +44,21 @@ class Web3Client:
         2. RPC_URL environment variable
         3. Default from NETWORKS[network]
 
+        Several endpoints can be given as a list or a comma-separated string.
+        Requests are then routed to the fastest healthy one, and failing
+        endpoints are skipped (see FailoverHTTPProvider).
+
+        No request is made until the first call that needs the node.
+        Providers for the same URL share one HTTP session, and the chain ID
+        of a default NETWORKS endpoint is taken from the config.
+
         Args:
-            rpc_url: Optional explicit RPC URL
+            rpc_url: Optional explicit RPC URL(s)
             network: Network name (mainnet, polygon, etc.)
+            hedge_after: Seconds before a slow read is also sent to a second
+                endpoint (None disables hedging; only used with several URLs)
+            validate_connection: Check the connection when w3 is first
+                accessed instead of failing on the first request
 
         Raises:
             NetworkError: If network is invalid or connection fails
@@ -53,46 +74,68 @@ class Web3Client:
 
         self.network_config = NETWORKS[self.network]
 
-        # Determine RPC URL
+        # Determine RPC URL(s)
+        self._chain_id: Optional[int] = None
         if rpc_url:
-            self._rpc_url = rpc_url
+            urls = rpc_url
         elif "RPC_URL" in os.environ:
-            self._rpc_url = os.environ["RPC_URL"]
+            urls = os.environ["RPC_URL"]
         else:
-            self._rpc_url = self.network_config["rpc"]
+            urls = self.network_config["rpc"]
+            # Known endpoint: no need to ask it for its chain ID
+            self._chain_id = self.network_config.get("chain_id")
+        if isinstance(urls, str):
+            urls = urls.split(",")
+        self._rpc_urls = [url.strip() for url in urls if url.strip()]
+        if not self._rpc_urls:
+            raise NetworkError(f"No RPC URL configured for {self.network}")
+        self._rpc_url = self._rpc_urls[0]
+        self.hedge_after = hedge_after
+        self.validate_connection = validate_connection
 
         self._w3: Optional[Web3] = None
         self._connected = False
+        self.batch_size = self.DEFAULT_BATCH_SIZE
 
-        logger.info(f"Initialized Web3Client for {self.network}")
+        logger.debug(f"Initialized Web3Client for {self.network}")
 
     @property
     def w3(self) -> Web3:
         """
         Get Web3 instance (lazy initialization).
 
+        Creating it makes no request unless validate_connection is set.
+
         Returns:
-            Connected Web3 instance
+            Web3 instance
 
         Raises:
-            NetworkError: If connection fails
+            NetworkError: If initialization (or connection validation) fails
         """
         if self._w3 is None:
             try:
-                self._w3 = Web3(Web3.HTTPProvider(self._rpc_url))
+                provider: JSONBaseProvider
+                if len(self._rpc_urls) > 1:
+                    provider = FailoverHTTPProvider(self._rpc_urls, hedge_after=self.hedge_after)
+                else:
+                    provider = Web3.HTTPProvider(
+                        self._rpc_url, session=get_session(self._rpc_url)
+                    )
+                w3 = Web3(provider)
 
                 # Add PoA middleware for networks that need it
                 if self.network in ("polygon", "bsc"):
-                    self._w3.middleware_onion.inject(POAMiddleware, layer=0)
+                    w3.middleware_onion.inject(POAMiddleware, layer=0)
 
                 # Test connection
-                if not self._w3.is_connected():
+                if self.validate_connection and not w3.is_connected():
                     raise NetworkError(
-                        f"Failed to connect to {self.network} at {self._rpc_url}",
+                        f"Failed to connect to {self.network} at {', '.join(self._rpc_urls)}",
                     )
 
+                self._w3 = w3
                 self._connected = True
-                logger.info(f"Connected to {self.network} (Chain ID: {self.get_chain_id()})")
+                logger.debug(f"Using {self.network} RPC at {', '.join(self._rpc_urls)}")
 
             except Exception as e:
                 raise NetworkError(
@@ -101,6 +144,18 @@ class Web3Client:
 
         return self._w3
 
+    def endpoint_status(self) -> List[Dict[str, Any]]:
+        """
+        Get health of the configured RPC endpoints.
+
+        Returns:
+            Per-endpoint latency, error rate and ejection state, in routing
+            order (empty until connected with several endpoints)
+        """
+        if self._w3 is None or not isinstance(self._w3.provider, FailoverHTTPProvider):
+            return []
+        return self._w3.provider.endpoint_status()
+
     def get_contract(self, address: str, abi: list) -> Contract:
         """
         Create contract instance with checksum address.
@@ -136,14 +191,20 @@ class Web3Client:
         """
         Get current chain ID.
 
+        Taken from NETWORKS for default endpoints; otherwise fetched once
+        and cached.
+
         Returns:
             Chain ID
 
         Raises:
             NetworkError: If not connected
         """
+        if self._chain_id is not None:
+            return self._chain_id
         try:
-            return self.w3.eth.chain_id
+            self._chain_id = self.w3.eth.chain_id
+            return self._chain_id
         except Exception as e:
             raise NetworkError(
                 f"Failed to get chain ID for {self.network}: {e}",
@@ -229,6 +290,43 @@ class Web3Client:
                 f"Failed to get code for {address}: {e}",
             ) from e
 
+    def batch(self, chunk_size: Optional[int] = None) -> RPCBatch:
+        """
+        Start a JSON-RPC batch.
+
+        Calls queued in the batch are sent together when the with block
+        exits, as few HTTP requests as the endpoint accepts::
+
+            with client.batch() as batch:
+                balance = batch.get_balance(address)
+                code = batch.get_code(address)
+            print(balance.result(), len(code.result()))
+
+        Args:
+            chunk_size: Maximum calls per request (default: self.batch_size)
+
+        Returns:
+            RPCBatch context manager
+        """
+        return RPCBatch(self, chunk_size)
+
+    def get_balances(self, addresses: List[str]) -> Dict[str, int]:
+        """
+        Get ETH balances of several addresses in one batch.
+
+        Args:
+            addresses: Ethereum addresses
+
+        Returns:
+            Address -> balance in wei
+
+        Raises:
+            NetworkError: If any query fails
+        """
+        with self.batch() as batch:
+            results = {address: batch.get_balance(address) for address in addresses}
+        return {address: result.result() for address, result in results.items()}
+
     def is_contract(self, address: str) -> bool:
         """
         Check if address is a contract.
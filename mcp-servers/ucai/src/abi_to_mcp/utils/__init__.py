@@ -8,6 +8,7 @@ from abi_to_mcp.utils.validation import (
     to_checksum_address,
     validate_network,
 )
+from abi_to_mcp.utils.json_stream import iter_json_items, aiter_json_items, iter_json_paths
 from abi_to_mcp.utils.formatting import (
     format_address,
     format_wei,
@@ -27,6 +28,10 @@ __all__ = [
     "is_checksum_address",
     "to_checksum_address",
     "validate_network",
+    # Streaming JSON
+    "iter_json_items",
+    "aiter_json_items",
+    "iter_json_paths",
     # Formatting
     "format_address",
     "format_wei",
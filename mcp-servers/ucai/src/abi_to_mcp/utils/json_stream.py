@@ -0,0 +1,498 @@
+"""Streaming JSON utilities for abi-to-mcp.
+
+Large JSON documents (Sourcify file listings, Hardhat build-info files) are
+split into their top-level items as data arrives, so only one item has to be
+held in memory at a time instead of the whole document. JSONPathScanner goes
+further and keeps only the values at selected paths.
+"""
+
+import codecs
+import json
+import re
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+# Characters that matter outside of strings
+_STRUCTURAL = re.compile(r'["\[\]{},]')
+# Characters that matter inside strings
+_STRING_SPECIAL = re.compile(r'["\\]')
+_WHITESPACE = " \t\r\n"
+# One token: a complete string, a structural character, a lone quote (string
+# not complete yet) or a scalar (number, true, false, null)
+_TOKEN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{},:"]|[^\s\[\]{},:"]+')
+# Everything up to the next bracket or incomplete string, in a skipped value
+_SKIP_RUN = re.compile(r'(?:[^"\[\]{}]+|"[^"\\]*(?:\\.[^"\\]*)*")*')
+# The rest of a string, up to its closing quote or a trailing backslash
+_STRING_REST = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*')
+_SCALAR = re.compile(r"-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?|true|false|null")
+_CLOSE = {"{": "}", "[": "]"}
+
+_decoder = json.JSONDecoder()
+
+
+class JSONStreamDecoder:
+    """
+    Incrementally split a top-level JSON array or object into raw items.
+
+    Feed text chunks with feed(); each call returns the items completed so
+    far as raw JSON text. Array items are returned as strings, object
+    members as ``(key, raw_value)`` tuples, so callers can skip decoding
+    values they do not need.
+
+    Example:
+        >>> decoder = JSONStreamDecoder()
+        >>> decoder.feed('[{"a": 1}, {"b"')
+        ['{"a": 1}']
+        >>> decoder.feed(': 2}]')
+        ['{"b": 2}']
+    """
+
+    def __init__(self) -> None:
+        self._buf = ""
+        self._pos = 0
+        self._container: Optional[str] = None
+        self._item_start: Optional[int] = None
+        self._depth = 0
+        self._in_string = False
+        self.done = False
+
+    @property
+    def is_object(self) -> bool:
+        """Whether the top-level value is an object (vs an array)."""
+        return self._container == "{"
+
+    def feed(self, text: str) -> List[Any]:
+        """
+        Add text and return the items completed by it.
+
+        Args:
+            text: Next chunk of the document
+
+        Returns:
+            Raw items (see class docstring)
+
+        Raises:
+            ValueError: If the document is not a JSON array or object
+        """
+        if self.done:
+            return []
+
+        self._buf += text
+        items: List[Any] = []
+        buf = self._buf
+        pos = self._pos
+
+        if self._container is None:
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            if pos == len(buf):
+                self._pos = pos
+                return items
+            if buf[pos] not in "[{":
+                raise ValueError("Streaming JSON requires a top-level array or object")
+            self._container = buf[pos]
+            pos += 1
+
+        close = "]" if self._container == "[" else "}"
+
+        while pos < len(buf):
+            if self._in_string:
+                match = _STRING_SPECIAL.search(buf, pos)
+                if match is None:
+                    pos = len(buf)
+                    break
+                if match.group() == "\\":
+                    if match.end() >= len(buf):
+                        # Escape split across chunks: wait for more data
+                        pos = match.start()
+                        break
+                    pos = match.end() + 1
+                    continue
+                self._in_string = False
+                pos = match.end()
+                continue
+
+            if self._item_start is None:
+                while pos < len(buf) and buf[pos] in _WHITESPACE + ",":
+                    pos += 1
+                if pos == len(buf):
+                    break
+                if buf[pos] == close:
+                    self.done = True
+                    pos += 1
+                    break
+                self._item_start = pos
+
+            match = _STRUCTURAL.search(buf, pos)
+            if match is None:
+                pos = len(buf)
+                break
+
+            char = match.group()
+            pos = match.end()
+            if char == '"':
+                self._in_string = True
+            elif char in "[{":
+                self._depth += 1
+            elif self._depth > 0 and char in "]}":
+                self._depth -= 1
+            elif self._depth == 0 and char in ",]}":
+                items.append(self._finish_item(buf[self._item_start : match.start()]))
+                self._item_start = None
+                if char == close:
+                    self.done = True
+                    break
+
+        # Drop consumed text so memory stays bounded by the current item
+        keep_from = self._item_start if self._item_start is not None else pos
+        self._buf = buf[keep_from:]
+        self._pos = pos - keep_from
+        if self._item_start is not None:
+            self._item_start = 0
+
+        return items
+
+    def _finish_item(self, raw: str) -> Any:
+        """Turn an item's raw text into the value returned by feed()."""
+        raw = raw.strip()
+        if not self.is_object:
+            return raw
+        key, end = _decoder.raw_decode(raw)
+        value = raw[end:].lstrip(_WHITESPACE)
+        if not value.startswith(":"):
+            raise ValueError(f"Expected ':' after object key {key!r}")
+        return key, value[1:].strip()
+
+
+def _decode_item(item: Any) -> Any:
+    """Decode a raw item returned by JSONStreamDecoder.feed()."""
+    if isinstance(item, tuple):
+        return item[0], json.loads(item[1])
+    return json.loads(item)
+
+
+def iter_json_items(chunks: Iterable[Union[str, bytes]], decode: bool = True) -> Iterator[Any]:
+    """
+    Iterate over the top-level items of a streamed JSON array or object.
+
+    Args:
+        chunks: Text or UTF-8 bytes chunks of the document
+        decode: Decode items (False returns raw JSON text, see JSONStreamDecoder)
+
+    Yields:
+        Array elements, or ``(key, value)`` pairs for objects
+    """
+    decoder = JSONStreamDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    for chunk in chunks:
+        text = utf8.decode(chunk) if isinstance(chunk, bytes) else chunk
+        for item in decoder.feed(text):
+            yield _decode_item(item) if decode else item
+        if decoder.done:
+            return
+
+
+async def aiter_json_items(
+    chunks: AsyncIterable[Union[str, bytes]], decode: bool = True
+) -> AsyncIterator[Any]:
+    """
+    Async version of iter_json_items (e.g. for ``response.aiter_bytes()``).
+
+    Args:
+        chunks: Text or UTF-8 bytes chunks of the document
+        decode: Decode items (False returns raw JSON text)
+
+    Yields:
+        Array elements, or ``(key, value)`` pairs for objects
+    """
+    decoder = JSONStreamDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    async for chunk in chunks:
+        text = utf8.decode(chunk) if isinstance(chunk, bytes) else chunk
+        for item in decoder.feed(text):
+            yield _decode_item(item) if decode else item
+        if decoder.done:
+            return
+
+
+class JSONPathScanner:
+    """
+    Incrementally extract the values at selected paths of a JSON document.
+
+    A path is a tuple of object keys and array indexes, and "*" matches any
+    key or index. Feed text chunks with feed(); each call returns the
+    ``(path, raw_value)`` pairs completed so far, with the actual keys in
+    the path. Values outside the selected paths are skipped without being
+    kept in memory, so the ASTs and bytecode of a build-info file only cost
+    the time to scan them. Values nested in a selected value are not
+    matched again. Skipped values are only checked for balanced brackets.
+
+    Example:
+        >>> scanner = JSONPathScanner([("contracts", "*", "abi")])
+        >>> scanner.feed('{"ast": {"nodes": []}, "contracts": {"A": {"abi": [')
+        []
+        >>> scanner.feed('], "bin": "0x"}}}')
+        [(('contracts', 'A', 'abi'), '[]')]
+    """
+
+    def __init__(self, paths: Iterable[Sequence[Any]]):
+        """
+        Initialize scanner.
+
+        Args:
+            paths: Paths of the values to extract
+        """
+        self._paths = [tuple(p) for p in paths]
+        self._buf = ""
+        self._pos = 0
+        # One [container, expected token, key or index] per open container
+        self._stack: List[List[Any]] = []
+        self._skip = 0  # Bracket depth of the value being skipped or captured
+        self._capture: Optional[int] = None  # Buffer offset of the captured value
+        self._capture_path: Tuple[Any, ...] = ()
+        # A string continuing in the next chunk is scanned from where the
+        # last chunk ended; its text is only kept (from _string_start) when
+        # it is an object key or a selected value
+        self._in_string = False
+        self._string_start: Optional[int] = None
+        self.done = False
+
+    def feed(self, text: str) -> List[Tuple[Tuple[Any, ...], str]]:
+        """
+        Add text and return the selected values completed by it.
+
+        Args:
+            text: Next chunk of the document
+
+        Returns:
+            (path, raw JSON text) pairs
+
+        Raises:
+            ValueError: If the document is not valid JSON
+        """
+        if self.done:
+            return []
+
+        self._buf += text
+        buf = self._buf
+        pos = self._pos
+        found: List[Tuple[Tuple[Any, ...], str]] = []
+
+        while not self.done:
+            if self._in_string:
+                end = pos
+                rest = _STRING_REST.match(buf, pos)
+                if rest is not None:
+                    end = rest.end()
+                if end == len(buf) or buf[end] != '"':
+                    # Wait for more data, resuming at the trailing backslash
+                    pos = end
+                    break
+                pos = end + 1
+                self._in_string = False
+                if self._string_start is not None:
+                    start, self._string_start = self._string_start, None
+                    self._token(buf[start:pos], start, found)
+                elif not self._skip:
+                    self._value_done()  # An unselected string value
+                continue
+
+            if self._skip:
+                run = _SKIP_RUN.match(buf, pos)
+                if run is not None:
+                    pos = run.end()
+                if pos == len(buf):
+                    break
+                char = buf[pos]
+                pos += 1
+                if char == '"':
+                    # A string that continues in the next chunk
+                    self._in_string = True
+                    continue
+                if char in "[{":
+                    self._skip += 1
+                    continue
+                self._skip -= 1
+                if not self._skip:
+                    if self._capture is not None:
+                        found.append((self._capture_path, buf[self._capture : pos]))
+                        self._capture = None
+                    self._value_done()
+                continue
+
+            match = _TOKEN.search(buf, pos)
+            if match is None:
+                pos = len(buf)
+                break
+            token = match.group()
+            if token == '"':
+                # A string that continues in the next chunk
+                self._in_string = True
+                if self._string_needed():
+                    self._string_start = match.start()
+                pos = match.end()
+                continue
+            if match.end() == len(buf) and token[0] not in '[]{},:"':
+                # A scalar that may continue in the next chunk
+                pos = match.start()
+                break
+            pos = match.end()
+            self._token(token, match.start(), found)
+
+        # Keep only the value being captured, the string being read, or the
+        # unconsumed text
+        keep_from = min(
+            offset for offset in (self._capture, self._string_start, pos) if offset is not None
+        )
+        self._buf = buf[keep_from:]
+        self._pos = pos - keep_from
+        if self._capture is not None:
+            self._capture -= keep_from
+        if self._string_start is not None:
+            self._string_start -= keep_from
+
+        return found
+
+    def close(self) -> None:
+        """
+        Check that the document is complete.
+
+        Raises:
+            ValueError: If the document ended early
+        """
+        if not self.done:
+            raise ValueError("Unexpected end of JSON document")
+
+    def _string_needed(self) -> bool:
+        """Whether the text of a string starting here is needed (vs skipped)."""
+        if not self._stack or self._stack[-1][1] != "value":
+            return True  # An object key, or misplaced (reported by _token)
+        return self._match(tuple(frame[2] for frame in self._stack)) == "value"
+
+    def _token(self, token: str, start: int, found: list) -> None:
+        """Handle one token outside skipped values."""
+        if not self._stack:
+            self._value(token, start, found)
+            return
+        frame = self._stack[-1]
+        expect = frame[1]
+
+        if expect == "key":
+            if token == "}":
+                self._close(token)
+            elif token[0] == '"':
+                frame[2] = token[1:-1] if "\\" not in token else json.loads(token)
+                frame[1] = "colon"
+            else:
+                raise ValueError(f"Expected an object key, got {token[:20]!r}")
+        elif expect == "colon":
+            if token != ":":
+                raise ValueError(f"Expected ':', got {token[:20]!r}")
+            frame[1] = "value"
+        elif expect == "next":
+            if token == ",":
+                if frame[0] == "{":
+                    frame[1] = "key"
+                else:
+                    frame[1] = "value"
+                    frame[2] += 1
+            elif token in "]}":
+                self._close(token)
+            else:
+                raise ValueError(f"Expected ',' or a closing bracket, got {token[:20]!r}")
+        elif token == "]" and frame[0] == "[":
+            self._close(token)
+        else:
+            self._value(token, start, found)
+
+    def _value(self, token: str, start: int, found: list) -> None:
+        """Handle the first token of a value."""
+        path = tuple(frame[2] for frame in self._stack)
+        if not self._stack and token not in "[{":
+            raise ValueError("Streaming JSON requires a top-level array or object")
+        if token in ",:]}":
+            raise ValueError(f"Expected a value, got {token!r}")
+        if token[0] != '"' and token not in "[{" and not _SCALAR.fullmatch(token):
+            raise ValueError(f"Invalid JSON value {token[:20]!r}")
+
+        match = self._match(path)
+        if match == "value":
+            if token in "[{":
+                self._capture = start
+                self._capture_path = path
+                self._skip = 1
+                return
+            found.append((path, token))
+        elif token in "[{":
+            if match == "prefix":
+                self._stack.append([token, "key" if token == "{" else "value", 0])
+            else:
+                self._skip = 1
+            return
+        self._value_done()
+
+    def _close(self, token: str) -> None:
+        """Close the innermost open container."""
+        frame = self._stack.pop()
+        if _CLOSE[frame[0]] != token:
+            raise ValueError(f"Mismatched {token!r}")
+        self._value_done()
+
+    def _value_done(self) -> None:
+        """Move past a completed value."""
+        if self._stack:
+            self._stack[-1][1] = "next"
+        else:
+            self.done = True
+
+    def _match(self, path: Tuple[Any, ...]) -> Optional[str]:
+        """Whether a path is selected ("value"), leads to one ("prefix") or neither."""
+        result = None
+        for selected in self._paths:
+            if len(path) > len(selected):
+                continue
+            if all(s == "*" or s == p for s, p in zip(selected, path, strict=False)):
+                if len(path) == len(selected):
+                    return "value"
+                result = "prefix"
+        return result
+
+
+def iter_json_paths(
+    chunks: Iterable[Union[str, bytes]],
+    paths: Iterable[Sequence[Any]],
+    decode: bool = True,
+) -> Iterator[Tuple[Tuple[Any, ...], Any]]:
+    """
+    Iterate over the values at selected paths of a streamed JSON document.
+
+    Args:
+        chunks: Text or UTF-8 bytes chunks of the document
+        paths: Paths of the values to extract (see JSONPathScanner)
+        decode: Decode values (False returns raw JSON text)
+
+    Yields:
+        ``(path, value)`` pairs in document order
+
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    scanner = JSONPathScanner(paths)
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    for chunk in chunks:
+        text = utf8.decode(chunk) if isinstance(chunk, bytes) else chunk
+        for path, value in scanner.feed(text):
+            yield path, json.loads(value) if decode else value
+        if scanner.done:
+            return
+    scanner.close()
@@ -1,5 +1,10 @@
 """Tests for generated MCP servers."""
 
+import json
+import os
+import subprocess
+import sys
+
 import pytest
 from pathlib import Path
 
@@ -252,3 +257,96 @@ class TestGeneratedServerStructure:
         assert len(content) > 100, "server.py should have substantial content"
         assert "def " in content or "async def " in content, \
             "server.py should contain function definitions"
+
+
+# Imports a generated server and reports how long startup and first use take
+STARTUP_SCRIPT = """
+import json, sys, time
+sys.path.insert(0, sys.argv[1])
+start = time.perf_counter()
+import server
+import_seconds = time.perf_counter() - start
+lazy = server.w3._value is None and server.contract._value is None
+start = time.perf_counter()
+server.contract.functions
+print(json.dumps({
+    "import_seconds": import_seconds,
+    "first_use_seconds": time.perf_counter() - start,
+    "lazy": lazy,
+    "functions": len(server.contract.abi),
+}))
+"""
+
+
+@pytest.fixture
+def large_server(tmp_path):
+    """Generate a server for a large synthetic ABI (300 functions, 50 events)."""
+    abi = [
+        {
+            "type": "function",
+            "name": f"function{i}",
+            "stateMutability": "view" if i % 2 else "nonpayable",
+            "inputs": [
+                {"name": "account", "type": "address"},
+                {"name": "amount", "type": "uint256"},
+            ],
+            "outputs": [{"name": "", "type": "uint256"}],
+        }
+        for i in range(300)
+    ] + [
+        {
+            "type": "event",
+            "name": f"Event{i}",
+            "anonymous": False,
+            "inputs": [
+                {"name": "account", "type": "address", "indexed": True},
+                {"name": "value", "type": "uint256", "indexed": False},
+            ],
+        }
+        for i in range(50)
+    ]
+
+    parsed = ABIParser().parse(abi)
+    type_mapper = TypeMapper()
+    tools = [FunctionMapper(type_mapper).map_function(f) for f in parsed.functions]
+    resources = [EventMapper(type_mapper).map_event(e) for e in parsed.events]
+
+    output_dir = tmp_path / "large-server"
+    generator = ServerGenerator(GeneratorConfig(output_dir=output_dir))
+    server = generator.generate(
+        parsed=parsed,
+        tools=tools,
+        resources=resources,
+        contract_address="0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
+        network="mainnet",
+    )
+    generator.write_to_disk(server, output_dir)
+    return output_dir
+
+
+@pytest.mark.integration
+@pytest.mark.slow
+class TestGeneratedServerStartup:
+    """Startup-time benchmark for generated servers."""
+
+    def test_startup_defers_contract(self, large_server, record_property):
+        """Importing a large server builds neither the provider nor the contract."""
+        pytest.importorskip("mcp")
+
+        proc = subprocess.run(
+            [sys.executable, "-c", STARTUP_SCRIPT, str(large_server)],
+            capture_output=True,
+            text=True,
+            timeout=120,
+            env={**os.environ, "RPC_URL": "http://localhost:8545"},
+        )
+        assert proc.returncode == 0, proc.stderr
+        timings = json.loads(proc.stdout.strip().splitlines()[-1])
+        # Reported in the JUnit XML (--junitxml) rather than printed
+        record_property("import_seconds", timings["import_seconds"])
+        record_property("first_use_seconds", timings["first_use_seconds"])
+
+        assert timings["lazy"] is True
+        assert timings["functions"] == 350
+        assert timings["import_seconds"] < 10
+        assert timings["first_use_seconds"] < 10
@@ -0,0 +1,128 @@
+"""Tests for the fetch-batch command."""
+
+import json
+import pytest
+from unittest.mock import patch
+from typer.testing import CliRunner
+
+from abi_to_mcp.cli.main import app
+from abi_to_mcp.cli.commands.fetch_batch import read_targets
+from abi_to_mcp.core.exceptions import ContractNotVerifiedError, InvalidInputError
+from abi_to_mcp.core.models import BatchFetchResult, FetchResult
+
+runner = CliRunner()
+
+USDC = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
+WETH = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+
+
+class FakeRegistry:
+    """Registry stand-in that succeeds for USDC and fails otherwise."""
+
+    def __init__(self):
+        self.targets = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    async def fetch_many(self, targets, **kwargs):
+        self.targets = list(targets)
+        for network, address in self.targets:
+            if address == USDC.lower():
+                result = FetchResult(abi=[{"type": "function", "name": "f"}], source="mock",
+                                     source_location=address)
+                yield BatchFetchResult(network=network, address=address, result=result)
+            else:
+                yield BatchFetchResult(network=network, address=address,
+                                       error=ContractNotVerifiedError(address, network))
+
+
+class TestReadTargets:
+    """Tests for input file parsing."""
+
+    def test_csv_with_header(self, tmp_path):
+        """CSV rows with a header line."""
+        path = tmp_path / "in.csv"
+        path.write_text(f"network,address\nmainnet,{USDC}\npolygon,{WETH}\n")
+
+        assert read_targets(path, "mainnet") == [
+            ("mainnet", USDC.lower()),
+            ("polygon", WETH.lower()),
+        ]
+
+    def test_plain_list_uses_default_network(self, tmp_path):
+        """Bare addresses use the default network; comments and duplicates are skipped."""
+        path = tmp_path / "in.txt"
+        path.write_text(f"# tokens\n{USDC}\n\n{USDC.lower()}\n")
+
+        assert read_targets(path, "base") == [("base", USDC.lower())]
+
+    def test_invalid_address_raises(self, tmp_path):
+        """Invalid addresses after the first line are errors."""
+        path = tmp_path / "in.txt"
+        path.write_text(f"{USDC}\nnot-an-address\n")
+
+        with pytest.raises(InvalidInputError, match="Line 2"):
+            read_targets(path, "mainnet")
+
+    def test_unknown_network_raises(self, tmp_path):
+        """Unknown networks are errors."""
+        path = tmp_path / "in.csv"
+        path.write_text(f"nowhere,{USDC}\n")
+
+        with pytest.raises(InvalidInputError, match="unknown network"):
+            read_targets(path, "mainnet")
+
+
+class TestFetchBatchCommand:
+    """Tests for abi-to-mcp fetch-batch command."""
+
+    def test_writes_results_and_reports_failures(self, tmp_path):
+        """Successful ABIs are written; failures give a non-zero exit code."""
+        path = tmp_path / "in.csv"
+        path.write_text(f"mainnet,{USDC}\nmainnet,{WETH}\n")
+        output = tmp_path / "abis"
+
+        with patch("abi_to_mcp.fetchers.create_default_registry", return_value=FakeRegistry()):
+            result = runner.invoke(app, ["fetch-batch", str(path), "-o", str(output)])
+
+        assert result.exit_code == 1
+        abi = json.loads((output / "mainnet" / f"{USDC.lower()}.json").read_text())
+        assert abi[0]["name"] == "f"
+        assert not (output / "mainnet" / f"{WETH.lower()}.json").exists()
+        assert "1/2" in result.output
+
+    def test_skips_existing_outputs(self, tmp_path):
+        """Already-fetched contracts are not fetched again without --force."""
+        path = tmp_path / "in.csv"
+        path.write_text(f"mainnet,{USDC}\n")
+        existing = tmp_path / "abis" / "mainnet" / f"{USDC.lower()}.json"
+        existing.parent.mkdir(parents=True)
+        existing.write_text("[]")
+        registry = FakeRegistry()
+
+        with patch("abi_to_mcp.fetchers.create_default_registry", return_value=registry):
+            result = runner.invoke(app, ["fetch-batch", str(path), "-o", str(tmp_path / "abis")])
+
+        assert result.exit_code == 0
+        assert "Nothing to fetch" in result.output
+        assert registry.targets is None
+
+    def test_force_refetches(self, tmp_path):
+        """--force re-fetches existing outputs."""
+        path = tmp_path / "in.csv"
+        path.write_text(f"mainnet,{USDC}\n")
+        existing = tmp_path / "abis" / "mainnet" / f"{USDC.lower()}.json"
+        existing.parent.mkdir(parents=True)
+        existing.write_text("[]")
+
+        with patch("abi_to_mcp.fetchers.create_default_registry", return_value=FakeRegistry()):
+            result = runner.invoke(
+                app, ["fetch-batch", str(path), "-o", str(tmp_path / "abis"), "--force"]
+            )
+
+        assert result.exit_code == 0, result.output
+        assert json.loads(existing.read_text())[0]["name"] == "f"
@@ -140,6 +140,28 @@ class TestGenerateCommand:
         ])
         assert result.exit_code == 0, f"Command failed: {result.output}"
         assert (output / "requirements.txt").exists(), "requirements.txt should be generated"
+
+    def test_regenerate_unchanged_writes_nothing(self, erc20_abi_path, tmp_path):
+        """Regenerating an unchanged ABI rewrites no files unless forced."""
+        output = tmp_path / "output"
+        args = [
+            "generate",
+            str(erc20_abi_path),
+            "-o", str(output),
+            "-a", "0x1234567890123456789012345678901234567890"
+        ]
+        assert runner.invoke(app, args).exit_code == 0
+        mtime = (output / "server.py").stat().st_mtime_ns
+
+        result = runner.invoke(app, args)
+        assert result.exit_code == 0, f"Command failed: {result.output}"
+        assert "Wrote 0 of" in result.output
+        assert (output / "server.py").stat().st_mtime_ns == mtime
+
+        result = runner.invoke(app, args + ["--force"])
+        assert result.exit_code == 0, f"Command failed: {result.output}"
+        assert "Wrote 0 of" in result.output
+        assert "files unchanged" not in result.output
 """Tests for CLI commands edge cases."""
 
 import pytest
@@ -0,0 +1,211 @@
+"""Tests for manifest-driven generation."""
+
+import json
+import pytest
+from pathlib import Path
+from typer.testing import CliRunner
+
+from abi_to_mcp.cli.main import app
+from abi_to_mcp.cli.commands.generate_manifest import read_manifest, run_generation_job, GenerationJob
+from abi_to_mcp.core.exceptions import InvalidInputError
+
+runner = CliRunner()
+
+FIXTURES = Path(__file__).parent.parent.parent / "fixtures" / "abis"
+USDC = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
+
+
+class TestReadManifest:
+    """Tests for manifest parsing."""
+
+    def test_json_manifest(self, tmp_path):
+        """Entries get defaults, resolved sources and output directories."""
+        path = tmp_path / "contracts.json"
+        path.write_text(json.dumps({
+            "defaults": {"read_only": True, "network": "polygon"},
+            "contracts": [
+                {"source": "abis/token.json", "address": USDC, "name": "USD Coin"},
+                {"source": USDC, "network": "base", "read_only": False},
+            ],
+        }))
+
+        entries = read_manifest(path, tmp_path / "out", defaults={"multicall": False})
+
+        assert entries[0].source == str(tmp_path / "abis" / "token.json")
+        assert entries[0].output == tmp_path / "out" / "usd_coin"
+        assert entries[0].network == "polygon"
+        assert entries[0].options == {"multicall": False, "read_only": True}
+        assert entries[1].output == tmp_path / "out" / f"base_{USDC.lower()}"
+        assert entries[1].options["read_only"] is False
+
+    def test_toml_manifest(self, tmp_path):
+        """TOML manifests use [[contracts]] tables; output is relative to the manifest."""
+        path = tmp_path / "contracts.toml"
+        path.write_text(
+            'output = "servers"\n\n'
+            '[[contracts]]\nsource = "erc20.json"\noutput = "token"\nasync_runtime = true\n'
+        )
+
+        (entry,) = read_manifest(path, Path("ignored"))
+
+        assert entry.output == tmp_path / "servers" / "token"
+        assert entry.options == {"async_runtime": True}
+
+    def test_yaml_manifest(self, tmp_path):
+        """YAML manifests may list bare sources."""
+        pytest.importorskip("yaml")
+        path = tmp_path / "contracts.yaml"
+        path.write_text(f"contracts:\n  - {FIXTURES / 'erc20.json'}\n  - source: {USDC}\n")
+
+        entries = read_manifest(path, tmp_path)
+
+        assert [e.output.name for e in entries] == ["erc20", f"mainnet_{USDC.lower()}"]
+
+    @pytest.mark.parametrize(
+        "contracts, match",
+        [
+            ([{"address": USDC}], "'source' is required"),
+            ([{"source": USDC, "colour": "red"}], "unknown keys colour"),
+            ([{"source": USDC, "network": "nowhere"}], "unknown network"),
+            ([{"source": "a.json", "address": "0x12"}], "invalid address"),
+            ([{"source": "a.json", "output": "x"}, {"source": "b.json", "output": "x"}], "used twice"),
+        ],
+    )
+    def test_invalid_entries(self, tmp_path, contracts, match):
+        """Malformed entries are rejected with their position."""
+        path = tmp_path / "contracts.json"
+        path.write_text(json.dumps({"contracts": contracts}))
+
+        with pytest.raises(InvalidInputError, match=match):
+            read_manifest(path, tmp_path)
+
+    def test_build_directory_source(self, tmp_path):
+        """A build directory expands to one entry per contract."""
+        out = tmp_path / "contracts" / "out"
+        for folder, name in [("Token.sol", "Token"), ("Vault.sol", "Vault"), ("v2", "Token")]:
+            (out / folder).mkdir(parents=True)
+            (out / folder / f"{name}.json").write_text(json.dumps(
+                {"abi": json.loads((FIXTURES / "erc20.json").read_text()), "contractName": name}
+            ))
+        path = tmp_path / "contracts.json"
+        path.write_text(json.dumps({"contracts": [
+            {"source": "contracts/out", "output": "protocol", "read_only": True},
+        ]}))
+
+        entries = read_manifest(path, tmp_path / "servers")
+
+        assert [e.output.relative_to(tmp_path) for e in entries] == [
+            Path("servers/protocol/token"),
+            Path("servers/protocol/vault"),
+            Path("servers/protocol/token_2"),
+        ]
+        assert [e.name for e in entries] == ["Token", "Vault", "Token"]
+        assert all(e.abi and e.options == {"read_only": True} for e in entries)
+
+    def test_build_directory_rejects_name(self, tmp_path):
+        """Directories cannot take a single name or address."""
+        (tmp_path / "out").mkdir()
+        path = tmp_path / "contracts.json"
+        path.write_text(json.dumps({"contracts": [{"source": "out", "name": "X"}]}))
+
+        with pytest.raises(InvalidInputError, match="cannot be set for a directory"):
+            read_manifest(path, tmp_path)
+
+    def test_unsupported_format(self, tmp_path):
+        """Unknown file extensions are rejected."""
+        path = tmp_path / "contracts.ini"
+        path.write_text("")
+
+        with pytest.raises(InvalidInputError, match="Unsupported manifest format"):
+            read_manifest(path, tmp_path)
+
+
+class TestGenerationJob:
+    """Tests for the worker-side pipeline."""
+
+    def test_run_generation_job(self, tmp_path):
+        """A job parses, maps, renders and writes a server with stage timings."""
+        job = GenerationJob(
+            abi=json.loads((FIXTURES / "erc20.json").read_text()),
+            output=tmp_path / "token",
+            network="mainnet",
+            contract_address=USDC,
+            name="Token",
+            options={"read_only": True},
+        )
+
+        result = run_generation_job(job)
+
+        assert result["error"] is None
+        assert set(result["timings"]) == {"parse", "map", "render", "write"}
+        assert (tmp_path / "token" / "server.py").exists()
+        assert "server.py" in result["written_files"]
+
+    def test_run_generation_job_error(self, tmp_path):
+        """Errors are returned as messages instead of raised."""
+        job = GenerationJob(abi=["not an entry"], output=tmp_path, network="mainnet",
+                            contract_address=USDC, name=None, options={})
+
+        assert "must be an object" in run_generation_job(job)["error"]
+
+
+class TestGenerateManifestCommand:
+    """Tests for abi-to-mcp generate --manifest."""
+
+    def test_generates_every_contract(self, tmp_path):
+        """Each listed contract gets its own server, with a timing summary."""
+        manifest = tmp_path / "contracts.json"
+        manifest.write_text(json.dumps({"contracts": [
+            {"source": str(FIXTURES / "erc20.json"), "address": USDC},
+            {"source": str(FIXTURES / "erc721.json"), "read_only": True},
+        ]}))
+
+        result = runner.invoke(app, ["generate", "--manifest", str(manifest),
+                                     "-o", str(tmp_path / "out"), "--jobs", "2"])
+
+        assert result.exit_code == 0, result.output
+        assert "Generated 2/2 servers" in result.output
+        assert "render" in result.output
+        assert (tmp_path / "out" / "erc20" / "server.py").exists()
+        assert (tmp_path / "out" / "erc721" / "server.py").exists()
+
+        result = runner.invoke(app, ["generate", "--manifest", str(manifest),
+                                     "-o", str(tmp_path / "out")])
+        assert "(2 unchanged)" in result.output
+
+    def test_build_directory(self, tmp_path):
+        """Contracts of a build directory are generated without refetching."""
+        (tmp_path / "out" / "Token.sol").mkdir(parents=True)
+        (tmp_path / "out" / "Token.sol" / "Token.json").write_text(json.dumps(
+            {"abi": json.loads((FIXTURES / "erc20.json").read_text()), "contractName": "Token"}
+        ))
+        manifest = tmp_path / "contracts.json"
+        manifest.write_text(json.dumps({"contracts": ["out"]}))
+
+        result = runner.invoke(app, ["generate", "-m", str(manifest), "-o", str(tmp_path / "servers")])
+
+        assert result.exit_code == 0, result.output
+        assert (tmp_path / "servers" / "token" / "server.py").exists()
+
+    def test_failed_entry_exits_nonzero(self, tmp_path):
+        """Failures are listed and the command exits with an error."""
+        manifest = tmp_path / "contracts.json"
+        manifest.write_text(json.dumps({"contracts": [
+            {"source": str(FIXTURES / "erc20.json")},
+            {"source": "missing.json"},
+        ]}))
+
+        result = runner.invoke(app, ["generate", "-m", str(manifest), "-o", str(tmp_path / "out")])
+
+        assert result.exit_code == 1
+        assert "Generated 1/2 servers" in result.output
+        assert "missing.json" in result.output
+
+    def test_source_and_manifest_conflict(self, tmp_path):
+        """SOURCE and --manifest cannot be combined."""
+        manifest = tmp_path / "contracts.json"
+        manifest.write_text('{"contracts": []}')
+
+        result = runner.invoke(app, ["generate", "x.json", "--manifest", str(manifest)])
+
+        assert result.exit_code == 2
@@ -0,0 +1,324 @@
+"""Tests for the on-disk ABI cache."""
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from abi_to_mcp.fetchers.base import ABIFetcher
+from abi_to_mcp.fetchers.cache import ABICache
+from abi_to_mcp.fetchers.registry import FetcherRegistry, create_default_registry
+from abi_to_mcp.core.config import FetcherConfig
+from abi_to_mcp.core.models import FetchResult
+from abi_to_mcp.core.exceptions import ABINotFoundError, ContractNotVerifiedError, NetworkError
+
+
+ADDRESS = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
+OTHER_ADDRESS = "0x1234567890123456789012345678901234567890"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a cache in a temporary directory."""
+    return ABICache(tmp_path / "cache")
+
+
+@pytest.fixture
+def fetch_result():
+    """A typical Etherscan fetch result."""
+    return FetchResult(
+        abi=[{"type": "function", "name": "balanceOf", "inputs": [], "outputs": []}],
+        source="etherscan",
+        source_location=ADDRESS.lower(),
+        contract_name="Token",
+    )
+
+
+class TestABICache:
+    """Tests for ABICache."""
+
+    def test_miss_on_empty_cache(self, cache):
+        """Empty cache returns None."""
+        assert cache.get("mainnet", ADDRESS) is None
+
+    def test_roundtrip(self, cache, fetch_result):
+        """Stored results come back unchanged."""
+        cache.put("mainnet", ADDRESS, fetch_result)
+
+        cached = cache.get("mainnet", ADDRESS)
+
+        assert cached == fetch_result
+
+    def test_key_is_case_insensitive(self, cache, fetch_result):
+        """Checksummed and lowercase addresses share an entry."""
+        cache.put("mainnet", ADDRESS, fetch_result)
+
+        assert cache.get("mainnet", ADDRESS.lower()) is not None
+
+    def test_networks_are_separate(self, cache, fetch_result):
+        """The same address on another network is a miss."""
+        cache.put("mainnet", ADDRESS, fetch_result)
+
+        assert cache.get("polygon", ADDRESS) is None
+
+    def test_blobs_are_content_addressed(self, cache, fetch_result, tmp_path):
+        """Identical ABIs are stored once."""
+        cache.put("mainnet", ADDRESS, fetch_result)
+        cache.put("mainnet", OTHER_ADDRESS, fetch_result)
+
+        blobs = list((tmp_path / "cache" / ABICache.BLOB_DIR).iterdir())
+        assert len(blobs) == 1
+        assert len(cache) == 2
+
+    def test_source_code_roundtrip(self, cache):
+        """Source code is cached alongside the ABI."""
+        result = FetchResult(
+            abi=[{"type": "function", "name": "f"}],
+            source="sourcify",
+            source_location=ADDRESS,
+            source_code="contract A {}",
+        )
+        cache.put("mainnet", ADDRESS, result)
+
+        assert cache.get("mainnet", ADDRESS).source_code == "contract A {}"
+
+    def test_negative_result_raises(self, cache):
+        """Cached not-found results are re-raised."""
+        cache.put_negative("mainnet", ADDRESS, ABINotFoundError(ADDRESS, "nope"))
+
+        with pytest.raises(ABINotFoundError, match="cached"):
+            cache.get("mainnet", ADDRESS)
+
+    def test_not_verified_result_raises(self, cache):
+        """Cached unverified results keep their exception type."""
+        cache.put_negative("mainnet", ADDRESS, ContractNotVerifiedError(ADDRESS, "mainnet"))
+
+        with pytest.raises(ContractNotVerifiedError):
+            cache.get("mainnet", ADDRESS)
+
+    def test_negative_result_expires(self, tmp_path):
+        """Negative results expire after their TTL."""
+        cache = ABICache(tmp_path, negative_ttl=0)
+        cache.put_negative("mainnet", ADDRESS, ABINotFoundError(ADDRESS, "nope"))
+
+        assert cache.get("mainnet", ADDRESS) is None
+
+    def test_proxy_entry_expires(self, tmp_path, fetch_result):
+        """Proxy entries expire so upgrades are picked up."""
+        cache = ABICache(tmp_path, proxy_ttl=0)
+        fetch_result.is_proxy = True
+        fetch_result.implementation_address = OTHER_ADDRESS
+        cache.put("mainnet", ADDRESS, fetch_result)
+
+        assert cache.get("mainnet", ADDRESS) is None
+
+    def test_plain_entry_ttl(self, tmp_path, fetch_result):
+        """Non-proxy entries have their own TTL, independent of the others."""
+        cache = ABICache(tmp_path, negative_ttl=0, proxy_ttl=0)
+        cache.put("mainnet", ADDRESS, fetch_result)
+
+        assert cache.get("mainnet", ADDRESS) is not None
+        assert ABICache(tmp_path, ttl=0).get("mainnet", ADDRESS) is None
+
+    def test_options_are_part_of_key(self, cache, fetch_result):
+        """A result fetched with other options is a miss."""
+        cache.put("mainnet", ADDRESS, fetch_result, {"include_source": False})
+
+        assert cache.get("mainnet", ADDRESS, {"include_source": True}) is None
+        assert cache.get("mainnet", ADDRESS, {"include_source": False}) is not None
+        assert cache.get("mainnet", ADDRESS) is None
+
+    def test_new_implementation_replaces_entry(self, cache, fetch_result, tmp_path):
+        """Entries are keyed by implementation; a new one replaces the old."""
+        fetch_result.is_proxy = True
+        fetch_result.implementation_address = OTHER_ADDRESS
+        cache.put("mainnet", ADDRESS, fetch_result)
+        fetch_result.implementation_address = "0x" + "b" * 40
+        cache.put("mainnet", ADDRESS, fetch_result)
+
+        (key,) = cache._load_index()
+        assert key == f"mainnet:{ADDRESS.lower()}:0x{'b' * 40}"
+        assert cache.get("mainnet", ADDRESS).implementation_address == "0x" + "b" * 40
+
+    def test_replaced_entry_blobs_are_removed(self, cache, fetch_result, tmp_path):
+        """Blobs of a replaced entry are deleted once nothing references them."""
+        fetch_result.is_proxy = True
+        fetch_result.implementation_address = OTHER_ADDRESS
+        cache.put("mainnet", ADDRESS, fetch_result)
+        fetch_result.implementation_address = "0x" + "b" * 40
+        fetch_result.abi = [{"type": "function", "name": "upgraded"}]
+        cache.put("mainnet", ADDRESS, fetch_result)
+
+        blobs = list((tmp_path / "cache" / ABICache.BLOB_DIR).iterdir())
+        assert [blob.read_text() for blob in blobs] == ['[{"type":"function","name":"upgraded"}]']
+
+    def test_index_is_reloaded_when_changed(self, cache, fetch_result, tmp_path):
+        """Another process writing the index is seen on the next lookup."""
+        other = ABICache(tmp_path / "cache")
+        assert cache.get("mainnet", ADDRESS) is None
+
+        other.put("mainnet", ADDRESS, fetch_result)
+
+        assert cache.get("mainnet", ADDRESS) == fetch_result
+
+    def test_reads_do_not_write_index(self, cache, fetch_result, tmp_path):
+        """Cache hits leave the index untouched."""
+        cache.put("mainnet", ADDRESS, fetch_result)
+        index = tmp_path / "cache" / ABICache.INDEX_FILE
+        before = index.read_bytes()
+
+        cache.get("mainnet", ADDRESS)
+
+        assert index.read_bytes() == before
+
+    def test_lru_eviction(self, tmp_path, fetch_result):
+        """Least recently used entries are evicted past max_entries."""
+        cache = ABICache(tmp_path, max_entries=2)
+        addresses = ["0x" + c * 40 for c in "abc"]
+
+        cache.put("mainnet", addresses[0], fetch_result)
+        cache.put("mainnet", addresses[1], fetch_result)
+        # Touch the first entry so the second becomes least recently used
+        cache.get("mainnet", addresses[0])
+        cache.put("mainnet", addresses[2], fetch_result)
+
+        assert len(cache) == 2
+        assert cache.get("mainnet", addresses[0]) is not None
+        assert cache.get("mainnet", addresses[1]) is None
+
+    def test_eviction_removes_orphan_blobs(self, tmp_path):
+        """Blobs only referenced by evicted entries are deleted."""
+        cache = ABICache(tmp_path, max_entries=1)
+        for i, address in enumerate([ADDRESS, OTHER_ADDRESS]):
+            cache.put(
+                "mainnet",
+                address,
+                FetchResult(abi=[{"type": "function", "name": f"f{i}"}], source="etherscan",
+                            source_location=address),
+            )
+
+        assert len(list((tmp_path / ABICache.BLOB_DIR).iterdir())) == 1
+
+    def test_invalidate(self, cache, fetch_result):
+        """Invalidated entries are gone."""
+        cache.put("mainnet", ADDRESS, fetch_result)
+
+        assert cache.invalidate("mainnet", ADDRESS) is True
+        assert cache.get("mainnet", ADDRESS) is None
+        assert cache.invalidate("mainnet", ADDRESS) is False
+
+    def test_clear(self, cache, fetch_result):
+        """Clearing removes everything."""
+        cache.put("mainnet", ADDRESS, fetch_result)
+        cache.clear()
+
+        assert len(cache) == 0
+
+    def test_corrupt_index_is_ignored(self, tmp_path, fetch_result):
+        """A corrupt index behaves like an empty cache."""
+        cache = ABICache(tmp_path)
+        (tmp_path / ABICache.INDEX_FILE).write_text("{not json")
+
+        assert cache.get("mainnet", ADDRESS) is None
+        cache.put("mainnet", ADDRESS, fetch_result)
+        assert cache.get("mainnet", ADDRESS) is not None
+
+
+class TestRegistryCache:
+    """Tests for the cache layer in FetcherRegistry."""
+
+    @pytest.fixture
+    def fetcher(self, fetch_result):
+        """Mock address fetcher."""
+        fetcher = Mock(spec=ABIFetcher)
+        fetcher.can_handle = Mock(return_value=True)
+        fetcher.fetch = AsyncMock(return_value=fetch_result)
+        return fetcher
+
+    @pytest.fixture
+    def registry(self, cache, fetcher):
+        """Registry backed by a cache."""
+        registry = FetcherRegistry(cache=cache)
+        registry.register(fetcher)
+        return registry
+
+    @pytest.mark.asyncio
+    async def test_second_fetch_hits_cache(self, registry, fetcher):
+        """Repeated fetches do not call the fetcher again."""
+        first = await registry.fetch(ADDRESS, network="mainnet")
+        second = await registry.fetch(ADDRESS, network="mainnet")
+
+        assert first == second
+        fetcher.fetch.assert_called_once_with(ADDRESS, network="mainnet")
+
+    @pytest.mark.asyncio
+    async def test_refresh_bypasses_cache(self, registry, fetcher):
+        """refresh=True always re-fetches."""
+        await registry.fetch(ADDRESS, network="mainnet")
+        await registry.fetch(ADDRESS, network="mainnet", refresh=True)
+
+        assert fetcher.fetch.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_negative_result_is_cached(self, registry, fetcher):
+        """Not-found results are cached too."""
+        fetcher.fetch = AsyncMock(side_effect=ABINotFoundError(ADDRESS, "missing"))
+
+        with pytest.raises(ABINotFoundError):
+            await registry.fetch(ADDRESS, network="mainnet")
+        with pytest.raises(ABINotFoundError):
+            await registry.fetch(ADDRESS, network="mainnet")
+
+        # Primary attempt + fallback pass on the first call only
+        assert fetcher.fetch.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_network_errors_are_not_cached(self, registry, fetcher, fetch_result):
+        """A transient failure raises NetworkError and is retried next time."""
+        fetcher.fetch = AsyncMock(side_effect=NetworkError("timeout"))
+
+        with pytest.raises(NetworkError):
+            await registry.fetch(ADDRESS, network="mainnet")
+
+        fetcher.fetch = AsyncMock(return_value=fetch_result)
+        assert await registry.fetch(ADDRESS, network="mainnet") == fetch_result
+
+    @pytest.mark.asyncio
+    async def test_options_are_cached_separately(self, registry, fetcher):
+        """Fetch options other than the network are part of the cache key."""
+        await registry.fetch(ADDRESS, network="mainnet")
+        await registry.fetch(ADDRESS, network="mainnet", include_source=True)
+
+        assert fetcher.fetch.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_files_are_not_cached(self, cache, tmp_path):
+        """Local files are always read fresh."""
+        from abi_to_mcp.fetchers.file import FileFetcher
+
+        registry = FetcherRegistry(cache=cache)
+        registry.register(FileFetcher())
+        abi_file = tmp_path / "abi.json"
+        abi_file.write_text('[{"type": "function", "name": "a"}]')
+
+        await registry.fetch(str(abi_file))
+        abi_file.write_text('[{"type": "function", "name": "b"}]')
+        result = await registry.fetch(str(abi_file))
+
+        assert result.abi[0]["name"] == "b"
+        assert len(cache) == 0
+
+    def test_default_registry_has_no_cache(self):
+        """The library default does not touch the filesystem."""
+        assert create_default_registry().cache is None
+
+    def test_default_registry_with_config(self, tmp_path):
+        """A FetcherConfig enables the cache in its cache_dir."""
+        registry = create_default_registry(config=FetcherConfig(cache_dir=tmp_path))
+
+        assert registry.cache is not None
+        assert registry.cache.cache_dir == tmp_path
+
+    def test_default_registry_cache_disabled(self, tmp_path):
+        """cache_enabled=False leaves the registry uncached."""
+        config = FetcherConfig(cache_dir=tmp_path, cache_enabled=False)
+
+        assert create_default_registry(config=config).cache is None
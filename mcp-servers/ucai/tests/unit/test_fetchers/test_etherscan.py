@@ -2,6 +2,8 @@
 
 import pytest
 from unittest.mock import AsyncMock, Mock, patch, MagicMock
+import asyncio
+import gc
 import json
 
 from abi_to_mcp.fetchers.etherscan import EtherscanFetcher
@@ -415,3 +417,303 @@ class TestEtherscanImportError:
         # Invalid addresses
         assert not fetcher.ADDRESS_PATTERN.match("invalid")
         assert not fetcher.ADDRESS_PATTERN.match("0x123")
+
+
+class TestEtherscanConnectionPool:
+    """Tests for the shared HTTP client."""
+
+    @pytest.fixture
+    def mock_client_class(self):
+        """Patch httpx.AsyncClient with a mock returning verified ABIs."""
+        response = MockResponse({"status": "1", "result": json.dumps([{"type": "function"}])})
+        with patch("httpx.AsyncClient") as client_class:
+            client = MagicMock()
+            client.get = AsyncMock(return_value=response)
+            client.aclose = AsyncMock()
+            client_class.return_value = client
+            yield client_class
+
+    @pytest.mark.asyncio
+    async def test_client_reused_across_fetches(self, mock_client_class):
+        """All requests share a single client."""
+        fetcher = EtherscanFetcher(api_key="test-key")
+
+        await fetcher.fetch("0x" + "a" * 40, detect_proxy=False)
+        await fetcher.fetch("0x" + "b" * 40, detect_proxy=False)
+
+        assert mock_client_class.call_count == 1
+        assert mock_client_class.return_value.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_client_uses_config_limits(self, mock_client_class):
+        """Pool limits and timeout come from FetcherConfig."""
+        from abi_to_mcp.core.config import FetcherConfig
+
+        config = FetcherConfig(timeout=5.0, max_connections=3, max_keepalive_connections=2)
+        fetcher = EtherscanFetcher(api_key="test-key", config=config)
+
+        await fetcher.fetch("0x" + "a" * 40, detect_proxy=False)
+
+        kwargs = mock_client_class.call_args.kwargs
+        assert kwargs["timeout"] == 5.0
+        assert kwargs["limits"].max_connections == 3
+        assert kwargs["limits"].max_keepalive_connections == 2
+
+    @pytest.mark.asyncio
+    async def test_context_manager_closes_client(self, mock_client_class):
+        """Leaving the context closes the shared client."""
+        async with EtherscanFetcher(api_key="test-key") as fetcher:
+            await fetcher.fetch("0x" + "a" * 40, detect_proxy=False)
+
+        mock_client_class.return_value.aclose.assert_called_once()
+        assert fetcher._client is None
+
+    @pytest.mark.asyncio
+    async def test_aclose_without_client(self):
+        """Closing an unused fetcher is a no-op."""
+        fetcher = EtherscanFetcher(api_key="test-key")
+
+        await fetcher.aclose()
+
+        assert fetcher._client is None
+
+
+class TestEtherscanProxyDetection:
+    """Tests for concurrent proxy detection probes."""
+
+    IMPL = "0x" + "b" * 40
+    BEACON = "0x" + "c" * 40
+    # PUSH1 0x80 PUSH1 0x40 DELEGATECALL
+    DELEGATING_CODE = "0x60806040f4"
+
+    def _rpc(self, storage=None, calls=None, code="0x6080"):
+        """Build a fake _get answering eth_getStorageAt/eth_call/eth_getCode."""
+        storage = storage or {}
+        calls = calls or {}
+        zero = "0x" + "0" * 64
+
+        async def fake_get(api_url, params, timeout=None):
+            action = params["action"]
+            if action == "eth_getStorageAt":
+                result = storage.get(params["position"], zero)
+            elif action == "eth_call":
+                result = calls.get(params["to"], "0x")
+            else:
+                result = code
+            return MockResponse({"jsonrpc": "2.0", "result": result})
+
+        return fake_get
+
+    @staticmethod
+    def _word(address):
+        return "0x" + "0" * 24 + address[2:]
+
+    @pytest.mark.asyncio
+    async def test_non_proxy_returns_none(self):
+        """No probe matches for a plain contract."""
+        fetcher = EtherscanFetcher(api_key="k")
+        with patch.object(fetcher, "_get", side_effect=self._rpc()) as mock_get:
+            impl = await fetcher._detect_proxy("0x" + "a" * 40, "mainnet", "https://x", "k")
+
+        assert impl is None
+        # EIP-1967 impl and bytecode; without DELEGATECALL nothing else is probed
+        assert mock_get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_delegating_contract_is_fully_probed(self):
+        """Contracts that may delegate are probed for every pattern."""
+        fetcher = EtherscanFetcher(api_key="k")
+        rpc = self._rpc(code=self.DELEGATING_CODE)
+        with patch.object(fetcher, "_get", side_effect=rpc) as mock_get:
+            impl = await fetcher._detect_proxy("0x" + "a" * 40, "mainnet", "https://x", "k")
+
+        assert impl is None
+        # EIP-1967 impl, bytecode, beacon, EIP-1822, implementation()
+        assert mock_get.call_count == 5
+
+    def test_push_data_is_not_delegatecall(self):
+        """An 0xf4 byte inside PUSH data is not a DELEGATECALL."""
+        fetcher = EtherscanFetcher(api_key="k")
+
+        assert fetcher._may_delegate("0x60f4") is False
+        assert fetcher._may_delegate("0x60f4f4") is True
+        assert fetcher._may_delegate("0x") is False
+
+    @pytest.mark.asyncio
+    async def test_eip1967_slot(self):
+        """EIP-1967 implementation slot is detected."""
+        fetcher = EtherscanFetcher(api_key="k")
+        rpc = self._rpc(storage={fetcher.IMPLEMENTATION_SLOT: self._word(self.IMPL)})
+        with patch.object(fetcher, "_get", side_effect=rpc):
+            impl = await fetcher._detect_proxy("0x" + "a" * 40, "mainnet", "https://x", "k")
+
+        assert impl == self.IMPL
+
+    @pytest.mark.asyncio
+    async def test_beacon_proxy(self):
+        """Beacon proxies resolve through the beacon's implementation()."""
+        fetcher = EtherscanFetcher(api_key="k")
+        rpc = self._rpc(
+            storage={fetcher.BEACON_SLOT: self._word(self.BEACON)},
+            calls={self.BEACON: self._word(self.IMPL)},
+            code=self.DELEGATING_CODE,
+        )
+        with patch.object(fetcher, "_get", side_effect=rpc):
+            impl = await fetcher._detect_proxy("0x" + "a" * 40, "mainnet", "https://x", "k")
+
+        assert impl == self.IMPL
+
+    @pytest.mark.asyncio
+    async def test_eip1822_slot(self):
+        """UUPS PROXIABLE slot is detected."""
+        fetcher = EtherscanFetcher(api_key="k")
+        rpc = self._rpc(
+            storage={fetcher.PROXIABLE_SLOT: self._word(self.IMPL)}, code=self.DELEGATING_CODE
+        )
+        with patch.object(fetcher, "_get", side_effect=rpc):
+            impl = await fetcher._detect_proxy("0x" + "a" * 40, "mainnet", "https://x", "k")
+
+        assert impl == self.IMPL
+
+    @pytest.mark.asyncio
+    async def test_minimal_proxy(self):
+        """EIP-1167 bytecode is detected."""
+        fetcher = EtherscanFetcher(api_key="k")
+        code = "0x363d3d373d3d3d363d73" + self.IMPL[2:] + "5af43d82803e903d91602b57fd5bf3"
+        with patch.object(fetcher, "_get", side_effect=self._rpc(code=code)):
+            impl = await fetcher._detect_proxy("0x" + "a" * 40, "mainnet", "https://x", "k")
+
+        assert impl == self.IMPL
+
+    @pytest.mark.asyncio
+    async def test_priority_order(self):
+        """The EIP-1967 slot wins over lower-priority probes."""
+        fetcher = EtherscanFetcher(api_key="k")
+        other = "0x" + "d" * 40
+        code = "0x363d3d373d3d3d363d73" + other[2:] + "5af43d82803e903d91602b57fd5bf3"
+        rpc = self._rpc(storage={fetcher.IMPLEMENTATION_SLOT: self._word(self.IMPL)}, code=code)
+        with patch.object(fetcher, "_get", side_effect=rpc):
+            impl = await fetcher._detect_proxy("0x" + "a" * 40, "mainnet", "https://x", "k")
+
+        assert impl == self.IMPL
+
+    @pytest.mark.asyncio
+    async def test_abandoned_probe_errors_are_retrieved(self):
+        """Probes failing after a positive answer leave no unretrieved errors."""
+        fetcher = EtherscanFetcher(api_key="k")
+        rpc = self._rpc(storage={fetcher.IMPLEMENTATION_SLOT: self._word(self.IMPL)})
+        errors = []
+        asyncio.get_running_loop().set_exception_handler(lambda loop, ctx: errors.append(ctx))
+
+        async def failing_code(api_url, params, timeout=None):
+            if params["action"] == "eth_getCode":
+                raise NetworkError("code probe failed")
+            return await rpc(api_url, params, timeout)
+
+        with patch.object(fetcher, "_get", side_effect=failing_code):
+            impl = await fetcher._detect_proxy("0x" + "a" * 40, "mainnet", "https://x", "k")
+        gc.collect()
+
+        assert impl == self.IMPL
+        assert errors == []
+
+    @pytest.mark.asyncio
+    async def test_throttled_probe_is_not_a_negative(self):
+        """A rate-limited probe raises instead of reporting "not a proxy"."""
+        fetcher = EtherscanFetcher(api_key="k")
+        rpc = self._rpc()
+
+        async def throttled(api_url, params, timeout=None):
+            if params.get("position") == fetcher.IMPLEMENTATION_SLOT:
+                return MockResponse(
+                    {"status": "0", "message": "NOTOK", "result": "Max rate limit reached"}
+                )
+            return await rpc(api_url, params, timeout)
+
+        with patch.object(fetcher, "_get", side_effect=throttled):
+            with pytest.raises(RateLimitError):
+                await fetcher._detect_proxy("0x" + "a" * 40, "mainnet", "https://x", "k")
+
+    @pytest.mark.asyncio
+    async def test_failed_probe_fails_fetch(self):
+        """A probe that times out fails the fetch, so nothing is cached."""
+        import httpx
+
+        fetcher = EtherscanFetcher(api_key="k")
+        rpc = self._rpc()
+
+        async def flaky(api_url, params, timeout=None):
+            if params["action"] == "getabi":
+                return MockResponse({"status": "1", "result": "[]"})
+            if params["action"] == "eth_getCode":
+                raise httpx.ReadTimeout("slow")
+            return await rpc(api_url, params, timeout)
+
+        with patch.object(fetcher, "_get", side_effect=flaky):
+            with pytest.raises(NetworkError):
+                await fetcher.fetch("0x" + "a" * 40)
+
+    @pytest.mark.asyncio
+    async def test_reverted_call_is_a_negative(self):
+        """A reverted implementation() call means "no implementation"."""
+        fetcher = EtherscanFetcher(api_key="k")
+        rpc = self._rpc()
+
+        async def reverting(api_url, params, timeout=None):
+            if params["action"] == "eth_call":
+                return MockResponse(
+                    {"jsonrpc": "2.0", "error": {"code": -32000, "message": "execution reverted"}}
+                )
+            return await rpc(api_url, params, timeout)
+
+        with patch.object(fetcher, "_get", side_effect=reverting):
+            impl = await fetcher._detect_proxy("0x" + "a" * 40, "mainnet", "https://x", "k")
+
+        assert impl is None
+
+    @pytest.mark.asyncio
+    async def test_unverified_cancels_detection(self):
+        """Proxy probes are abandoned when the ABI is not verified."""
+        fetcher = EtherscanFetcher(api_key="k")
+        never = asyncio.Event()
+
+        async def slow_detect(*args):
+            await never.wait()
+
+        with patch.object(fetcher, "_fetch_abi", new_callable=AsyncMock, return_value=None):
+            with patch.object(fetcher, "_detect_proxy", side_effect=slow_detect):
+                with pytest.raises(ContractNotVerifiedError):
+                    await fetcher.fetch("0x" + "a" * 40)
+
+
+class TestEtherscanRateLimiting:
+    """Tests for request pacing and rate limit detection."""
+
+    @pytest.mark.asyncio
+    async def test_soft_rate_limit_raises(self):
+        """HTTP 200 'Max rate limit reached' responses raise RateLimitError."""
+        fetcher = EtherscanFetcher(api_key="k")
+        response = MockResponse(
+            {"status": "0", "message": "NOTOK", "result": "Max rate limit reached"}
+        )
+        with patch.object(fetcher, "_get", new_callable=AsyncMock, return_value=response):
+            with pytest.raises(RateLimitError) as exc_info:
+                await fetcher._fetch_abi("https://api.etherscan.io/api", "0x" + "a" * 40, "k")
+
+        assert exc_info.value.retry_after == fetcher.SOFT_RATE_LIMIT_RETRY
+
+    @pytest.mark.asyncio
+    async def test_requests_are_paced(self):
+        """Every request waits for the per-host rate limiter."""
+        from abi_to_mcp.core.config import FetcherConfig
+
+        fetcher = EtherscanFetcher(api_key="k", config=FetcherConfig(requests_per_second=2.0))
+        response = MockResponse({"status": "1", "result": "[]"})
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client_class.return_value.get = AsyncMock(return_value=response)
+            with patch.object(
+                fetcher._rate_limiter, "acquire", new_callable=AsyncMock
+            ) as mock_acquire:
+                await fetcher.fetch("0x" + "a" * 40, detect_proxy=False)
+
+        mock_acquire.assert_called_once_with("https://api.etherscan.io/api")
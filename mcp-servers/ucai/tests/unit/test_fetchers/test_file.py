@@ -551,3 +551,118 @@ class TestFileFetcherURL:
                 assert len(result.abi) == 1
             finally:
                 os.unlink(f.name)
+
+
+def _build_info(contracts):
+    """Build-info document for {source file: {contract: abi}}."""
+    return {
+        "id": "f00d",
+        "solcVersion": "0.8.20",
+        "input": {"sources": {src: {"content": "x" * 1000} for src in contracts}},
+        "output": {
+            "sources": {src: {"ast": {"nodes": [{"abi": "not this one"}]}} for src in contracts},
+            "contracts": {
+                src: {
+                    name: {"abi": abi, "evm": {"bytecode": {"object": "60" * 500}}}
+                    for name, abi in names.items()
+                }
+                for src, names in contracts.items()
+            },
+        },
+    }
+
+
+class TestFileFetcherStreaming:
+    """Tests for streamed artifacts, build-info files and build directories."""
+
+    TRANSFER = [{"type": "function", "name": "transfer", "inputs": [], "outputs": []}]
+    MINT = [{"type": "function", "name": "mint", "inputs": [], "outputs": []}]
+
+    @pytest.mark.asyncio
+    async def test_large_artifact(self, file_fetcher, tmp_path):
+        """Only the ABI and metadata keys of a large artifact are decoded."""
+        artifact = {
+            "ast": {"nodes": [{"abi": [], "name": "x" * 100}] * 2000},
+            "abi": self.TRANSFER,
+            "contractName": "Token",
+            "bytecode": "0x" + "60" * 100_000,
+        }
+        path = tmp_path / "Token.json"
+        path.write_text(json.dumps(artifact))
+
+        result = await file_fetcher.fetch(str(path))
+
+        assert result.abi == self.TRANSFER
+        assert result.contract_name == "Token"
+
+    @pytest.mark.asyncio
+    async def test_build_info_single_contract(self, file_fetcher, tmp_path):
+        """A build-info file with one contract yields that contract."""
+        path = tmp_path / "f00d.json"
+        path.write_text(json.dumps(_build_info({"src/Token.sol": {"Token": self.TRANSFER}})))
+
+        result = await file_fetcher.fetch(str(path))
+
+        assert result.abi == self.TRANSFER
+        assert result.contract_name == "Token"
+        assert result.compiler_version == "0.8.20"
+        assert result.source_location == f"{path}:src/Token.sol:Token"
+
+    @pytest.mark.asyncio
+    async def test_build_info_select_contract(self, file_fetcher, tmp_path):
+        """Build-info files with several contracts need contract_name."""
+        path = tmp_path / "f00d.json"
+        path.write_text(json.dumps(_build_info({
+            "src/Token.sol": {"Token": self.TRANSFER, "IToken": []},
+            "src/Minter.sol": {"Minter": self.MINT},
+        })))
+
+        with pytest.raises(ABIParseError, match="has 2 contracts"):
+            await file_fetcher.fetch(str(path))
+        with pytest.raises(ABIParseError, match="no contract named Vault"):
+            await file_fetcher.fetch(str(path), contract_name="Vault")
+
+        by_name = await file_fetcher.fetch(str(path), contract_name="Minter")
+        by_path = await file_fetcher.fetch(str(path), contract_name="src/Token.sol:Token")
+        assert by_name.abi == self.MINT
+        assert by_path.abi == self.TRANSFER
+
+    def test_iter_contracts_artifacts(self, file_fetcher, tmp_path):
+        """Artifacts in a build directory are listed; build-info is ignored."""
+        (tmp_path / "Token.sol").mkdir()
+        (tmp_path / "Token.sol" / "Token.json").write_text(
+            json.dumps({"abi": self.TRANSFER, "contractName": "Token"})
+        )
+        (tmp_path / "Token.sol" / "Token.dbg.json").write_text('{"buildInfo": "x"}')
+        (tmp_path / "IERC165.sol").mkdir()
+        (tmp_path / "IERC165.sol" / "IERC165.json").write_text('{"abi": []}')
+        (tmp_path / "Mint.json").write_text(json.dumps(self.MINT))
+        (tmp_path / "build-info").mkdir()
+        (tmp_path / "build-info" / "f00d.json").write_text(
+            json.dumps(_build_info({"src/Token.sol": {"Token": self.TRANSFER}}))
+        )
+
+        results = list(file_fetcher.iter_contracts(str(tmp_path)))
+
+        assert [(r.contract_name, r.abi) for r in results] == [
+            ("Mint", self.MINT),
+            ("Token", self.TRANSFER),
+        ]
+
+    def test_iter_contracts_build_info(self, file_fetcher, tmp_path):
+        """A build-info directory yields every contract with an ABI."""
+        (tmp_path / "build-info").mkdir()
+        (tmp_path / "build-info" / "f00d.json").write_text(json.dumps(_build_info({
+            "src/Token.sol": {"Token": self.TRANSFER, "IToken": []},
+            "src/Minter.sol": {"Minter": self.MINT},
+        })))
+
+        results = list(file_fetcher.iter_contracts(str(tmp_path / "build-info")))
+
+        assert sorted(r.contract_name for r in results) == ["Minter", "Token"]
+        assert all(r.compiler_version == "0.8.20" for r in results)
+
+    def test_iter_contracts_missing_directory(self, file_fetcher, tmp_path):
+        """A missing directory is reported."""
+        with pytest.raises(ABINotFoundError):
+            list(file_fetcher.iter_contracts(str(tmp_path / "out")))
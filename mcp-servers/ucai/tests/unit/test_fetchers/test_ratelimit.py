@@ -0,0 +1,89 @@
+"""Tests for explorer rate limiting."""
+
+import asyncio
+import time
+
+import pytest
+
+from abi_to_mcp.fetchers.ratelimit import RateLimiter, TokenBucket
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    @pytest.mark.asyncio
+    async def test_first_acquire_is_immediate(self):
+        """A full bucket hands out a token without waiting."""
+        bucket = TokenBucket(rate=1.0)
+
+        start = time.monotonic()
+        await bucket.acquire()
+
+        assert time.monotonic() - start < 0.05
+
+    @pytest.mark.asyncio
+    async def test_acquire_is_paced(self):
+        """Tokens are spaced 1/rate seconds apart."""
+        bucket = TokenBucket(rate=20.0)
+
+        start = time.monotonic()
+        for _ in range(4):
+            await bucket.acquire()
+
+        # First token is free, the remaining three wait 50ms each
+        assert time.monotonic() - start >= 0.14
+
+    @pytest.mark.asyncio
+    async def test_concurrent_acquires_are_paced(self):
+        """Concurrent callers share the same budget."""
+        bucket = TokenBucket(rate=20.0)
+
+        start = time.monotonic()
+        await asyncio.gather(*(bucket.acquire() for _ in range(4)))
+
+        assert time.monotonic() - start >= 0.14
+
+    @pytest.mark.asyncio
+    async def test_zero_rate_disables_limiting(self):
+        """rate <= 0 never waits."""
+        bucket = TokenBucket(rate=0)
+
+        start = time.monotonic()
+        for _ in range(100):
+            await bucket.acquire()
+
+        assert time.monotonic() - start < 0.05
+
+    @pytest.mark.asyncio
+    async def test_pause_delays_next_token(self):
+        """pause() blocks acquires for the given time."""
+        bucket = TokenBucket(rate=100.0)
+        bucket.pause(0.1)
+
+        start = time.monotonic()
+        await bucket.acquire()
+
+        assert time.monotonic() - start >= 0.09
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter."""
+
+    def test_bucket_per_host(self):
+        """URLs on the same host share a bucket; other hosts do not."""
+        limiter = RateLimiter(rate=5.0)
+
+        etherscan = limiter.bucket("https://api.etherscan.io/api")
+        assert limiter.bucket("https://api.etherscan.io/api?module=proxy") is etherscan
+        assert limiter.bucket("https://api.polygonscan.com/api") is not etherscan
+
+    @pytest.mark.asyncio
+    async def test_hosts_do_not_block_each_other(self):
+        """A paused host does not slow down another host."""
+        limiter = RateLimiter(rate=5.0)
+        limiter.pause("https://api.etherscan.io/api", 10)
+
+        start = time.monotonic()
+        await limiter.acquire("https://api.polygonscan.com/api")
+
+        assert time.monotonic() - start < 0.05
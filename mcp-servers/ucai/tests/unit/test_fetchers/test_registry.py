@@ -295,6 +295,20 @@ class TestFetcherRegistryFullCoverage:
         # Should have multiple fetchers registered
         assert len(registry.fetchers) > 0
 
+    @pytest.mark.asyncio
+    async def test_context_manager_closes_fetchers(self, registry):
+        """Leaving the context closes fetchers that hold HTTP clients."""
+        closable = Mock(spec=ABIFetcher)
+        closable.aclose = AsyncMock()
+        plain = Mock(spec=ABIFetcher)
+        registry.register(closable)
+        registry.register(plain)
+
+        async with registry:
+            pass
+
+        closable.aclose.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_fetch_with_empty_registry(self):
         """Test fetch with no registered fetchers."""
@@ -336,3 +350,294 @@ class TestFetcherRegistryIntegration:
         # Will fail without API key, but should select correct fetcher
         with pytest.raises(Exception):  # Some error from the network fetcher
             await registry.fetch("0x1234567890123456789012345678901234567890")
+
+
+class TestFetchMany:
+    """Tests for FetcherRegistry.fetch_many."""
+
+    @pytest.fixture
+    def fetcher(self):
+        """Address fetcher returning a result per address."""
+        from abi_to_mcp.core.models import FetchResult
+
+        fetcher = Mock(spec=ABIFetcher)
+        fetcher.can_handle = Mock(return_value=True)
+
+        async def fetch(source, **kwargs):
+            return FetchResult(abi=[], source="mock", source_location=source)
+
+        fetcher.fetch = AsyncMock(side_effect=fetch)
+        return fetcher
+
+    @staticmethod
+    async def _collect(registry, targets, **kwargs):
+        return [item async for item in registry.fetch_many(targets, **kwargs)]
+
+    @pytest.mark.asyncio
+    async def test_yields_every_target(self, fetcher):
+        """Each target produces one result."""
+        registry = FetcherRegistry()
+        registry.register(fetcher)
+        targets = [("mainnet", "0x" + c * 40) for c in "abc"]
+
+        items = await self._collect(registry, targets)
+
+        assert sorted((i.network, i.address) for i in items) == targets
+        assert all(i.ok for i in items)
+        fetcher.fetch.assert_any_call("0x" + "a" * 40, network="mainnet")
+
+    @pytest.mark.asyncio
+    async def test_failures_are_reported_not_raised(self, fetcher):
+        """A failing address does not abort the batch."""
+        from abi_to_mcp.core.exceptions import ContractNotVerifiedError
+
+        bad = "0x" + "b" * 40
+        good_fetch = fetcher.fetch.side_effect
+
+        async def fetch(source, **kwargs):
+            if source == bad:
+                raise ContractNotVerifiedError(source, "mainnet")
+            return await good_fetch(source, **kwargs)
+
+        fetcher.fetch.side_effect = fetch
+        registry = FetcherRegistry()
+        registry.register(fetcher)
+
+        items = await self._collect(registry, [("mainnet", "0x" + "a" * 40), ("mainnet", bad)])
+
+        failed = [i for i in items if not i.ok]
+        assert len(failed) == 1
+        assert failed[0].address == bad
+        assert isinstance(failed[0].error, ContractNotVerifiedError)
+
+    @pytest.mark.asyncio
+    async def test_retries_after_rate_limit(self, fetcher, monkeypatch):
+        """RateLimitError is retried after retry_after seconds."""
+        from abi_to_mcp.core.exceptions import RateLimitError
+
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        monkeypatch.setattr("abi_to_mcp.fetchers.registry.asyncio.sleep", fake_sleep)
+        good_fetch = fetcher.fetch.side_effect
+        calls = {"n": 0}
+
+        async def fetch(source, **kwargs):
+            calls["n"] += 1
+            if calls["n"] == 1:
+                raise RateLimitError("Etherscan", retry_after=2)
+            return await good_fetch(source, **kwargs)
+
+        fetcher.fetch.side_effect = fetch
+        registry = FetcherRegistry()
+        registry.register(fetcher)
+
+        items = await self._collect(registry, [("mainnet", "0x" + "a" * 40)])
+
+        assert items[0].ok
+        assert sleeps == [2]
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self, fetcher, monkeypatch):
+        """Persistent rate limiting is reported as a failure."""
+        from abi_to_mcp.core.exceptions import RateLimitError
+
+        monkeypatch.setattr("abi_to_mcp.fetchers.registry.asyncio.sleep", AsyncMock())
+        fetcher.fetch.side_effect = RateLimitError("Etherscan", retry_after=1)
+        registry = FetcherRegistry()
+        registry.register(fetcher)
+
+        items = await self._collect(registry, [("mainnet", "0x" + "a" * 40)], max_retries=2)
+
+        assert isinstance(items[0].error, RateLimitError)
+        assert fetcher.fetch.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, fetcher):
+        """No more than `concurrency` fetches run at once."""
+        import asyncio
+        from abi_to_mcp.core.models import FetchResult
+
+        state = {"active": 0, "peak": 0}
+
+        async def fetch(source, **kwargs):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.01)
+            state["active"] -= 1
+            return FetchResult(abi=[], source="mock", source_location=source)
+
+        fetcher.fetch.side_effect = fetch
+        registry = FetcherRegistry()
+        registry.register(fetcher)
+        targets = [("mainnet", "0x" + f"{i:040x}") for i in range(10)]
+
+        items = await self._collect(registry, targets, concurrency=3)
+
+        assert len(items) == 10
+        assert state["peak"] == 3
+
+
+class _DelayedFetcher(ABIFetcher):
+    """Address fetcher that answers (or fails) after a delay."""
+
+    def __init__(self, delay, error=None):
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self.cancelled = False
+
+    def can_handle(self, source):
+        return source.startswith("0x")
+
+    async def fetch(self, source, **kwargs):
+        import asyncio
+        from abi_to_mcp.core.models import FetchResult
+
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error is not None:
+            raise self.error
+        return FetchResult(abi=[], source=self.__class__.__name__, source_location=source)
+
+
+class _SlowFetcher(_DelayedFetcher):
+    pass
+
+
+class _FastFetcher(_DelayedFetcher):
+    pass
+
+
+class TestHedgedFetch:
+    """Tests for hedged address lookups."""
+
+    ADDRESS = "0x" + "a" * 40
+
+    @pytest.mark.asyncio
+    async def test_fast_second_source_wins(self):
+        """A slow first fetcher does not delay a fast second one past the hedge delay."""
+        import asyncio
+
+        slow, fast = _SlowFetcher(1.0), _FastFetcher(0.0)
+        registry = FetcherRegistry(hedge_delay=0.05)
+        registry.register(slow)
+        registry.register(fast)
+
+        result = await registry.fetch(self.ADDRESS)
+        await asyncio.sleep(0)  # Let the cancellation be delivered
+
+        assert result.source == "_FastFetcher"
+        assert slow.cancelled is True
+
+    @pytest.mark.asyncio
+    async def test_fast_first_source_not_hedged(self):
+        """The next fetcher is not started when the first answers in time."""
+        first, second = _FastFetcher(0.0), _SlowFetcher(0.0)
+        registry = FetcherRegistry(hedge_delay=0.5)
+        registry.register(first)
+        registry.register(second)
+
+        result = await registry.fetch(self.ADDRESS)
+
+        assert result.source == "_FastFetcher"
+        assert second.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_failure_starts_next_immediately(self):
+        """A failing fetcher hands over without waiting for the hedge delay."""
+        import time
+
+        failing = _SlowFetcher(0.0, error=ABINotFoundError(self.ADDRESS, "missing"))
+        registry = FetcherRegistry(hedge_delay=5.0)
+        registry.register(failing)
+        registry.register(_FastFetcher(0.0))
+
+        start = time.monotonic()
+        result = await registry.fetch(self.ADDRESS)
+
+        assert result.source == "_FastFetcher"
+        assert time.monotonic() - start < 1.0
+
+    @pytest.mark.asyncio
+    async def test_all_fail(self):
+        """Errors from every fetcher are combined."""
+        registry = FetcherRegistry(hedge_delay=0)
+        registry.register(_SlowFetcher(0.0, error=ABINotFoundError(self.ADDRESS, "nope")))
+        registry.register(_FastFetcher(0.0, error=ABINotFoundError(self.ADDRESS, "gone")))
+
+        with pytest.raises(ABINotFoundError, match="All fetchers failed") as exc_info:
+            await registry.fetch(self.ADDRESS)
+
+        assert "nope" in str(exc_info.value.reason)
+        assert "gone" in str(exc_info.value.reason)
+
+    @pytest.mark.asyncio
+    async def test_transient_failure_is_not_not_found(self):
+        """A fetcher that failed for another reason makes the lookup a NetworkError."""
+        from abi_to_mcp.core.exceptions import NetworkError
+
+        registry = FetcherRegistry(hedge_delay=0)
+        registry.register(_SlowFetcher(0.0, error=ABINotFoundError(self.ADDRESS, "nope")))
+        registry.register(_FastFetcher(0.0, error=ValueError("boom")))
+
+        with pytest.raises(NetworkError, match="boom"):
+            await registry.fetch(self.ADDRESS)
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_is_propagated(self):
+        """A rate limit is re-raised so callers can back off and retry."""
+        from abi_to_mcp.core.exceptions import RateLimitError
+
+        registry = FetcherRegistry(hedge_delay=0)
+        registry.register(_SlowFetcher(0.0, error=RateLimitError("Etherscan", retry_after=1)))
+        registry.register(_FastFetcher(0.0, error=ABINotFoundError(self.ADDRESS, "nope")))
+
+        with pytest.raises(RateLimitError):
+            await registry.fetch(self.ADDRESS)
+
+    @pytest.mark.asyncio
+    async def test_ordering_adapts_to_latency(self):
+        """The historically faster fetcher is started first."""
+        slow, fast = _SlowFetcher(0.2), _FastFetcher(0.0)
+        registry = FetcherRegistry(hedge_delay=0.05)
+        registry.register(slow)
+        registry.register(fast)
+
+        await registry.fetch(self.ADDRESS)
+        assert registry.latency["_SlowFetcher"] > registry.latency["_FastFetcher"]
+
+        slow.calls = 0
+        result = await registry.fetch(self.ADDRESS)
+
+        assert result.source == "_FastFetcher"
+        assert slow.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_files_are_not_hedged(self, tmp_path):
+        """Non-address sources keep the normal path."""
+        registry = FetcherRegistry(hedge_delay=0)
+        registry.register(FileFetcher())
+        abi_file = tmp_path / "abi.json"
+        abi_file.write_text('[{"type": "function", "name": "a"}]')
+
+        result = await registry.fetch(str(abi_file))
+
+        assert result.source == "file"
+
+    def test_default_registry_hedging(self):
+        """Hedging is opt-in through FetcherConfig."""
+        from abi_to_mcp.core.config import FetcherConfig
+
+        assert create_default_registry().hedge_delay is None
+        assert create_default_registry(config=FetcherConfig(cache_enabled=False)).hedge_delay is None
+        registry = create_default_registry(
+            config=FetcherConfig(cache_enabled=False, hedge_delay=1.0)
+        )
+        assert registry.hedge_delay == 1.0
@@ -5,7 +5,7 @@ from unittest.mock import AsyncMock, Mock, patch, MagicMock, PropertyMock
 import json
 
 from abi_to_mcp.fetchers.sourcify import SourcifyFetcher
-from abi_to_mcp.core.exceptions import ABINotFoundError, InvalidAddressError
+from abi_to_mcp.core.exceptions import ABINotFoundError, InvalidAddressError, NetworkError
 
 
 @pytest.fixture
@@ -42,13 +42,24 @@ def mock_source_file():
 
 
 class MockResponse:
-    """Mock httpx response."""
+    """Mock httpx response (also usable as a streamed response)."""
     def __init__(self, json_data, status_code=200):
         self._json_data = json_data
         self.status_code = status_code
     
     def json(self):
         return self._json_data
+
+    async def aiter_bytes(self):
+        body = json.dumps(self._json_data).encode()
+        for i in range(0, len(body), 16):
+            yield body[i:i + 16]
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return None
     
     def raise_for_status(self):
         if self.status_code >= 400:
@@ -71,13 +82,14 @@ async def test_fetch_full_match(mock_metadata_file, mock_source_file):
         fetcher.ADDRESS_PATTERN = SourcifyFetcher.ADDRESS_PATTERN
         
         mock_client = MagicMock()
-        mock_client.get = AsyncMock(return_value=mock_response)
+        mock_client.stream = Mock(return_value=mock_response)
         mock_client.aclose = AsyncMock()
         fetcher.client = mock_client
         
         result = await fetcher.fetch(
             "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
-            chain_id=1
+            chain_id=1,
+            include_source=True
         )
         
         assert result.source == "sourcify"
@@ -102,13 +114,14 @@ async def test_fetch_partial_match(mock_metadata_file):
         fetcher.ADDRESS_PATTERN = SourcifyFetcher.ADDRESS_PATTERN
         
         mock_client = MagicMock()
-        mock_client.get = AsyncMock(side_effect=[mock_response_404, mock_response_200])
+        mock_client.stream = Mock(side_effect=[mock_response_404, mock_response_200])
         mock_client.aclose = AsyncMock()
         fetcher.client = mock_client
         
         result = await fetcher.fetch(
             "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
-            chain_id=1
+            chain_id=1,
+            include_source=True
         )
         
         assert result.source == "sourcify"
@@ -153,7 +166,7 @@ async def test_invalid_address():
 @pytest.mark.asyncio
 async def test_fetch_with_network_name(mock_metadata_file):
     """Test fetch using network name instead of chain_id."""
-    mock_response = MockResponse([mock_metadata_file])
+    mock_response = MockResponse({"abi": [{"type": "function", "name": "transfer"}]})
     
     with patch.object(SourcifyFetcher, '__init__', lambda x: None):
         fetcher = SourcifyFetcher()
@@ -241,6 +254,7 @@ class TestSourcifyFetcher:
 
         mock_client = AsyncMock()
         mock_client.get.return_value = mock_response
+        mock_client.stream = Mock(return_value=MockResponse(mock_response.json.return_value))
         mock_client.aclose = AsyncMock()
 
         with patch("abi_to_mcp.fetchers.sourcify.httpx") as mock_httpx:
@@ -320,6 +334,7 @@ class TestSourcifyFetcher:
 
         mock_client = AsyncMock()
         mock_client.get.return_value = mock_response
+        mock_client.stream = Mock(return_value=MockResponse(mock_response.json.return_value))
         mock_client.aclose = AsyncMock()
 
         with patch("abi_to_mcp.fetchers.sourcify.httpx") as mock_httpx:
@@ -351,6 +366,7 @@ class TestSourcifyFetcher:
 
         mock_client = AsyncMock()
         mock_client.get.return_value = mock_response
+        mock_client.stream = Mock(return_value=MockResponse(mock_response.json.return_value))
         mock_client.aclose = AsyncMock()
 
         with patch("abi_to_mcp.fetchers.sourcify.httpx") as mock_httpx:
@@ -363,7 +379,7 @@ class TestSourcifyFetcher:
             fetcher = SourcifyFetcher()
             fetcher.client = mock_client
             
-            result = await fetcher.fetch(valid_address)
+            result = await fetcher.fetch(valid_address, include_source=True)
 
             assert result.source_code is not None
             assert "Contract.sol" in result.source_code
@@ -436,6 +452,7 @@ class TestSourcifyFetcher:
 
         mock_client = AsyncMock()
         mock_client.get.return_value = mock_response
+        mock_client.stream = Mock(return_value=MockResponse(mock_response.json.return_value))
         mock_client.aclose = AsyncMock()
 
         with patch("abi_to_mcp.fetchers.sourcify.httpx") as mock_httpx:
@@ -477,3 +494,116 @@ class TestSourcifyImportError:
                         sourcify_module.SourcifyFetcher()
                 finally:
                     sourcify_module.httpx = orig_httpx
+
+
+class TestSourcifyV2:
+    """Tests for the metadata-only v2 lookup and parallel legacy probing."""
+
+    ADDRESS = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
+
+    @pytest.fixture
+    def fetcher(self):
+        """Fetcher with a mock client."""
+        with patch.object(SourcifyFetcher, "__init__", lambda x: None):
+            fetcher = SourcifyFetcher()
+        fetcher.client = MagicMock()
+        fetcher.client.aclose = AsyncMock()
+        return fetcher
+
+    @pytest.mark.asyncio
+    async def test_v2_metadata_only(self, fetcher):
+        """The default path asks v2 for the ABI and compilation info only."""
+        fetcher.client.get = AsyncMock(return_value=MockResponse({
+            "abi": [{"type": "function", "name": "transfer"}],
+            "compilation": {"name": "FiatTokenProxy", "compilerVersion": "0.4.24+commit.e67f0147"},
+            "match": "exact_match",
+        }))
+        fetcher.client.stream = Mock()
+
+        result = await fetcher.fetch(self.ADDRESS, chain_id=1)
+
+        assert result.contract_name == "FiatTokenProxy"
+        assert result.compiler_version == "0.4.24+commit.e67f0147"
+        assert result.source_code is None
+        url = fetcher.client.get.call_args.args[0]
+        assert url.endswith(f"/v2/contract/1/{self.ADDRESS.lower()}")
+        assert fetcher.client.get.call_args.kwargs["params"] == {"fields": "abi,compilation"}
+        fetcher.client.stream.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_v2_not_found_skips_legacy(self, fetcher):
+        """A v2 404 is final; the files endpoints are not tried."""
+        fetcher.client.get = AsyncMock(return_value=MockResponse({}, status_code=404))
+        fetcher.client.stream = Mock()
+
+        with pytest.raises(ABINotFoundError):
+            await fetcher.fetch(self.ADDRESS)
+
+        fetcher.client.stream.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_v2_error_falls_back_without_sources(
+        self, fetcher, mock_metadata_file, mock_source_file
+    ):
+        """A v2 server error falls back to the files endpoint, skipping source bodies."""
+        fetcher.client.get = AsyncMock(return_value=MockResponse({}, status_code=502))
+        fetcher.client.stream = Mock(
+            return_value=MockResponse([mock_source_file, mock_metadata_file])
+        )
+
+        result = await fetcher.fetch(self.ADDRESS)
+
+        assert result.contract_name == "MyToken"
+        assert result.source_code is None
+
+    @pytest.mark.asyncio
+    async def test_match_types_probed_concurrently(self, fetcher, mock_metadata_file):
+        """full_match and partial_match are requested together; full wins."""
+        full_metadata = dict(mock_metadata_file)
+        full_metadata["content"] = json.dumps({
+            "output": {"abi": [{"type": "function", "name": "full"}]},
+        })
+        responses = {
+            "full_match": MockResponse([full_metadata]),
+            "partial_match": MockResponse([mock_metadata_file]),
+        }
+        requested = []
+
+        def stream(method, url):
+            match_type = url.split("/files/")[1].split("/")[0]
+            requested.append(match_type)
+            return responses[match_type]
+
+        fetcher.client.stream = Mock(side_effect=stream)
+
+        result = await fetcher.fetch(self.ADDRESS, include_source=True)
+
+        assert sorted(requested) == ["full_match", "partial_match"]
+        assert result.abi[0]["name"] == "full"
+
+    @pytest.mark.asyncio
+    async def test_full_match_error_falls_back_to_partial(self, fetcher, mock_metadata_file):
+        """A failed full_match probe does not hide an available partial match."""
+        def stream(method, url):
+            if "/full_match/" in url:
+                return MockResponse({}, status_code=502)
+            return MockResponse([mock_metadata_file])
+
+        fetcher.client.stream = Mock(side_effect=stream)
+
+        result = await fetcher.fetch(self.ADDRESS, source_code=True)
+
+        assert result.contract_name == "MyToken"
+
+    @pytest.mark.asyncio
+    async def test_probe_error_raised_when_no_match(self, fetcher):
+        """A failed probe is reported as NetworkError, not as not found."""
+        def stream(method, url):
+            if "/full_match/" in url:
+                return MockResponse({}, status_code=502)
+            return MockResponse({}, status_code=404)
+
+        fetcher.client.stream = Mock(side_effect=stream)
+
+        with pytest.raises(NetworkError):
+            await fetcher.fetch(self.ADDRESS, include_source=True)
@@ -213,3 +213,37 @@ class TestResourceGeneratorEdgeCases:
         
         assert "TEST SECTION" in header
         assert "=" in header
+
+
+class TestIndexTable:
+    """Tests for event index table descriptions."""
+
+    def test_indexed_fields_become_filters(self, resource_generator, transfer_resource):
+        """Only indexed fields get filter columns."""
+        schema = resource_generator.index_table(transfer_resource)
+
+        assert schema["table"] == "event_transfer"
+        assert [f["name"] for f in schema["filters"]] == ["from_address", "to"]
+        assert schema["filters"][0]["original_name"] == "from"
+        assert schema["filters"][0]["python_type"] == "str"
+
+    def test_filter_names_are_valid_parameters(self, resource_generator):
+        """Keywords, query parameters and duplicates are renamed."""
+        resource = MappedResource(
+            name="moved",
+            original_name="Moved",
+            description="Query Moved events from the contract.",
+            uri_template="events://moved",
+            fields=[
+                ResourceField("from", "from", "address", {"type": "string"}, "Sender", True),
+                ResourceField("limit", "limit", "uint256", {"type": "string"}, "Limit", True),
+                ResourceField("value", "", "bool", {"type": "boolean"}, "Flag", True),
+                ResourceField("value", "", "bytes32", {"type": "string"}, "Tag", True),
+            ],
+            function_name="get_moved_events",
+        )
+
+        filters = resource_generator.index_table(resource)["filters"]
+
+        assert [f["name"] for f in filters] == ["from_", "limit_", "value", "value_3"]
+        assert [f["python_type"] for f in filters] == ["str", "int", "bool", "str"]
@@ -1,22 +1,30 @@
 """Unit tests for ServerGenerator."""
 
 import pytest
+import asyncio
 import json
+import os
+import sqlite3
 from pathlib import Path
+from typing import Any, Dict, List, Optional
 import tempfile
+from unittest.mock import MagicMock
 
 from abi_to_mcp.core.config import GeneratorConfig
 from abi_to_mcp.core.models import (
+    GeneratedFile,
     ParsedABI,
     ABIFunction,
     ABIEvent,
     ABIParameter,
     MappedTool,
     MappedResource,
+    ProtocolContract,
     ToolParameter,
     ResourceField,
     StateMutability,
 )
+from abi_to_mcp.core.exceptions import GeneratorError
 from abi_to_mcp.generator.server_generator import ServerGenerator
 
 
@@ -227,6 +235,25 @@ class TestServerGenerator:
         assert any(f.path == "requirements.txt" for f in result.files)
         assert any(f.path == ".env.example" for f in result.files)
 
+    def test_abi_without_json_rejected(
+        self,
+        server_generator,
+        sample_parsed_abi,
+        sample_tools,
+        sample_resources,
+    ):
+        """An ABI parsed with keep_raw_abi=False cannot be generated."""
+        sample_parsed_abi.raw_abi = []
+
+        with pytest.raises(GeneratorError, match="keep_raw_abi"):
+            server_generator.generate(
+                parsed=sample_parsed_abi,
+                tools=sample_tools,
+                resources=sample_resources,
+                contract_address="0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
+                network="mainnet",
+            )
+
     def test_server_py_is_valid_python(
         self,
         server_generator,
@@ -416,7 +443,8 @@ class TestGeneratedFiles:
         requirements = next(f for f in result.files if f.path == "requirements.txt")
         
         assert "mcp" in requirements.content
-        assert "web3" in requirements.content
+        # Multicall encoding uses Contract.encode_abi and ABI signatures (web3 v7)
+        assert "web3>=7.0.0" in requirements.content
         assert "python-dotenv" in requirements.content
 
     def test_env_example(self, server_generator, sample_parsed_abi, sample_tools, sample_resources):
@@ -451,3 +479,880 @@ class TestGeneratedFiles:
         assert "[project]" in pyproject.content
         assert "mcp" in pyproject.content
         assert "requires-python" in pyproject.content
+
+
+class TestMulticallBatching:
+    """Tests for Multicall3 read batching in the generated server."""
+
+    def _server_py(self, config, parsed, tools, resources):
+        result = ServerGenerator(config).generate(
+            parsed=parsed,
+            tools=tools,
+            resources=resources,
+            contract_address="0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
+            network="mainnet",
+        )
+        return next(f for f in result.files if f.path == "server.py").content
+
+    def test_enabled_by_default(self, generator_config, sample_parsed_abi, sample_tools, sample_resources):
+        """Read tools go through the Multicall3 batcher."""
+        content = self._server_py(generator_config, sample_parsed_abi, sample_tools, sample_resources)
+
+        compile(content, "server.py", "exec")
+        assert "aggregate3" in content
+        assert "0xcA11bde05977b3631167028862bE2a173976CA11" in content
+        assert "async def balance_of" in content
+        assert "await _read(contract.functions.balanceOf(" in content
+
+    def test_batch_read_tool(self, generator_config, sample_parsed_abi, sample_tools, sample_resources):
+        """batch_read accepts tool names and contract function names."""
+        content = self._server_py(generator_config, sample_parsed_abi, sample_tools, sample_resources)
+
+        assert "async def batch_read(calls: List[Dict[str, Any]])" in content
+        assert '"balance_of": "balanceOf"' in content
+        assert '"balanceOf": "balanceOf"' in content
+
+    def test_contract_info_reads_are_concurrent(
+        self, generator_config, sample_parsed_abi, sample_tools, sample_resources
+    ):
+        """Token info is read concurrently so the calls share one batch."""
+        content = self._server_py(generator_config, sample_parsed_abi, sample_tools, sample_resources)
+
+        assert "async def get_contract_info" in content
+        assert "contract.functions.name().call()" not in content
+
+    def test_public_web3_api(self, generator_config, sample_parsed_abi, sample_tools, sample_resources):
+        """Batched calls are encoded and decoded like direct contract calls."""
+        web3 = pytest.importorskip("web3")
+        from eth_utils.abi import collapse_if_tuple
+
+        content = self._server_py(generator_config, sample_parsed_abi, sample_tools, sample_resources)
+        assert "web3._utils" not in content
+        assert "_encode_transaction_data" not in content
+
+        # Run the encoding helpers against a real (offline) Web3
+        helpers = content[content.index("# Contract factories") : content.index("def _settle")]
+        w3 = web3.Web3()
+        namespace = {
+            "Any": Any, "Dict": Dict, "Web3": web3.Web3, "w3": w3,
+            "collapse_if_tuple": collapse_if_tuple,
+        }
+        exec(helpers, namespace)
+        abi = [{
+            "type": "function", "name": "pair", "stateMutability": "view",
+            "inputs": [{"name": "owner", "type": "address"}],
+            "outputs": [
+                {"name": "", "type": "address"},
+                {"name": "", "type": "tuple[]", "components": [
+                    {"name": "who", "type": "address"}, {"name": "amount", "type": "uint256"},
+                ]},
+            ],
+        }]
+        owner = "0x" + "ab" * 20
+        token = w3.eth.contract(address=web3.Web3.to_checksum_address(owner), abi=abi)
+        func = token.functions.pair(web3.Web3.to_checksum_address(owner))
+        data = w3.codec.encode(["address", "(address,uint256)[]"], [owner, [(owner, 5)]])
+
+        checksummed = web3.Web3.to_checksum_address(owner)
+        assert namespace["_encode_call"](func) == token.encode_abi("pair", args=[checksummed])
+        assert namespace["_decode_result"](func, data) == [checksummed, [(checksummed, 5)]]
+
+    def test_disabled(self, generator_config, sample_parsed_abi, sample_tools, sample_resources):
+        """--no-multicall emits direct reads and no batch_read tool."""
+        generator_config.multicall = False
+        content = self._server_py(generator_config, sample_parsed_abi, sample_tools, sample_resources)
+
+        compile(content, "server.py", "exec")
+        assert "aggregate3" not in content
+        assert "batch_read" not in content
+        assert "return await _rpc(func.call)" in content
+
+    def test_window_in_env_example(self, generator_config, sample_parsed_abi, sample_tools, sample_resources):
+        """The batching window is documented in .env.example."""
+        generator_config.multicall_window_ms = 20
+        result = ServerGenerator(generator_config).generate(
+            parsed=sample_parsed_abi,
+            tools=sample_tools,
+            resources=sample_resources,
+            contract_address="0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
+            network="mainnet",
+        )
+
+        env_example = next(f for f in result.files if f.path == ".env.example")
+        server_py = next(f for f in result.files if f.path == "server.py")
+        assert "# MULTICALL_WINDOW_MS=20" in env_example.content
+        assert '"MULTICALL_WINDOW_MS", "20"' in server_py.content
+
+
+class TestAsyncRuntime:
+    """Tests for the --async-runtime option."""
+
+    def _generate(self, config, parsed, tools, resources):
+        result = ServerGenerator(config).generate(
+            parsed=parsed,
+            tools=tools,
+            resources=resources,
+            contract_address="0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
+            network="mainnet",
+        )
+        return {f.path: f.content for f in result.files}
+
+    def test_default_runtime_offloads_blocking_calls(
+        self, generator_config, sample_parsed_abi, sample_tools, sample_resources
+    ):
+        """The sync runtime runs Web3 calls in worker threads."""
+        files = self._generate(generator_config, sample_parsed_abi, sample_tools, sample_resources)
+        server_py = files["server.py"]
+
+        assert "w3 = _Lazy(lambda: Web3(Web3.HTTPProvider(RPC_URL)))" in server_py
+        assert "asyncio.to_thread(fn, *args, **kwargs)" in server_py
+        assert "async def transfer" in server_py
+        assert "aiohttp" not in files["requirements.txt"]
+
+    def test_async_runtime(self, generator_config, sample_parsed_abi, sample_tools, sample_resources):
+        """AsyncWeb3 with a pooled provider and awaited calls."""
+        generator_config.async_runtime = True
+        files = self._generate(generator_config, sample_parsed_abi, sample_tools, sample_resources)
+        server_py = files["server.py"]
+
+        compile(server_py, "server.py", "exec")
+        assert "w3 = _Lazy(lambda: AsyncWeb3(PooledHTTPProvider(RPC_URL)))" in server_py
+        assert "aiohttp.TCPConnector(limit=RPC_MAX_CONNECTIONS" in server_py
+        assert "asyncio.to_thread" not in server_py
+        assert "async def get_transfer_events" in server_py
+        assert "await _rpc(w3.eth.send_raw_transaction" in server_py
+        assert "aiohttp" in files["requirements.txt"]
+        assert "aiohttp" in files["pyproject.toml"]
+        assert "RPC_MAX_CONNECTIONS" in files[".env.example"]
+
+    def test_async_runtime_without_multicall(
+        self, generator_config, sample_parsed_abi, sample_tools, sample_resources
+    ):
+        """Reads await the contract call directly."""
+        generator_config.async_runtime = True
+        generator_config.multicall = False
+        server_py = self._generate(
+            generator_config, sample_parsed_abi, sample_tools, sample_resources
+        )["server.py"]
+
+        compile(server_py, "server.py", "exec")
+        assert "return await _rpc(func.call)" in server_py
+
+
+class TestReadCache:
+    """Tests for the opt-in per-block read cache."""
+
+    def _generate(self, config, parsed, tools, resources):
+        result = ServerGenerator(config).generate(
+            parsed=parsed,
+            tools=tools,
+            resources=resources,
+            contract_address="0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
+            network="mainnet",
+        )
+        return {f.path: f.content for f in result.files}
+
+    def test_disabled_by_default(self, generator_config, sample_parsed_abi, sample_tools, sample_resources):
+        """No cache code unless requested."""
+        server_py = self._generate(
+            generator_config, sample_parsed_abi, sample_tools, sample_resources
+        )["server.py"]
+
+        assert "ReadCache" not in server_py
+        assert "get_cache_stats" not in server_py
+
+    def test_enabled(self, generator_config, sample_parsed_abi, sample_tools, sample_resources):
+        """Reads go through the cache, which wraps the uncached reader."""
+        generator_config.read_cache = True
+        files = self._generate(generator_config, sample_parsed_abi, sample_tools, sample_resources)
+        server_py = files["server.py"]
+
+        compile(server_py, "server.py", "exec")
+        assert "_read_cache = ReadCache(" in server_py
+        assert "return await _read_cache.get(func, _read_uncached)" in server_py
+        assert 'READ_CACHE_PERMANENT = {"decimals", "name", "symbol"}' in server_py
+        assert "def get_cache_stats()" in server_py
+        assert "get_cache_stats" in files["README.md"]
+
+    def test_settings(self, generator_config, sample_parsed_abi, sample_tools, sample_resources):
+        """TTL and size become overridable defaults."""
+        generator_config.read_cache = True
+        generator_config.read_cache_ttl = 3
+        generator_config.read_cache_max_size = 64
+        files = self._generate(generator_config, sample_parsed_abi, sample_tools, sample_resources)
+
+        assert '"READ_CACHE_TTL", "3"' in files["server.py"]
+        assert '"READ_CACHE_MAX_SIZE", "64"' in files["server.py"]
+        assert "# READ_CACHE_TTL=3" in files[".env.example"]
+
+    def test_without_multicall(self, generator_config, sample_parsed_abi, sample_tools, sample_resources):
+        """The cache also wraps direct reads."""
+        generator_config.read_cache = True
+        generator_config.multicall = False
+        server_py = self._generate(
+            generator_config, sample_parsed_abi, sample_tools, sample_resources
+        )["server.py"]
+
+        compile(server_py, "server.py", "exec")
+        assert "async def _read_uncached(func)" in server_py
+        assert "MulticallBatcher" not in server_py
+
+
+class TestEventScanning:
+    """Tests for chunked, checkpointed event queries."""
+
+    def _generate(self, config, parsed, tools, resources):
+        result = ServerGenerator(config).generate(
+            parsed=parsed,
+            tools=tools,
+            resources=resources,
+            contract_address="0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
+            network="mainnet",
+        )
+        return {f.path: f.content for f in result.files}
+
+    def test_event_tools_use_scanner(
+        self, generator_config, sample_parsed_abi, sample_tools, sample_resources
+    ):
+        """Event tools delegate to the chunked scanner."""
+        files = self._generate(generator_config, sample_parsed_abi, sample_tools, sample_resources)
+        server_py = files["server.py"]
+
+        compile(server_py, "server.py", "exec")
+        assert "class EventScanner" in server_py
+        assert 'await _event_scanner.query("Transfer", format_event, from_block, to_block)' in server_py
+        assert "asyncio.Semaphore(self.concurrency)" in server_py
+        assert "EVENT_CHUNK_SIZE" in files[".env.example"]
+
+    def _scanner_namespace(self, config, parsed, tools, resources):
+        """Run the generated EventScanner code with a synchronous stand-in for _rpc."""
+        server_py = self._generate(config, parsed, tools, resources)["server.py"]
+        code = server_py[server_py.index("# Substrings of provider errors") : server_py.index("_event_scanner = ")]
+
+        async def _rpc(fn, *args, **kwargs):
+            return fn(*args, **kwargs)
+
+        namespace = {
+            "asyncio": asyncio, "json": json, "os": os, "tempfile": tempfile,
+            "Any": Any, "Dict": Dict, "List": List, "Optional": Optional,
+            "WEB3_VERSION": "7.0.0", "_rpc": _rpc,
+        }
+        exec(code, namespace)
+        return namespace
+
+    def test_chunk_size_recovers(
+        self, generator_config, sample_parsed_abi, sample_tools, sample_resources
+    ):
+        """Range errors shrink chunks, which grow back; rate limits do not shrink them."""
+        namespace = self._scanner_namespace(
+            generator_config, sample_parsed_abi, sample_tools, sample_resources
+        )
+        scanner = namespace["EventScanner"](1000, 1, "", 0, 100)
+        state = {"max_range": 250, "rate_limited": False}
+
+        class Event:
+            def get_logs(self, from_block, to_block):
+                if state["rate_limited"]:
+                    raise RuntimeError("429 Client Error: Too Many Requests (rate limit)")
+                if to_block - from_block + 1 > state["max_range"]:
+                    raise RuntimeError("query exceeds max block range 250")
+                return [from_block]
+
+        async def scan(start, end):
+            return [log async for log in scanner.scan(Event(), start, end)]
+
+        assert len(asyncio.run(scan(0, 999))) == 4
+        assert scanner.chunk_size == 250
+
+        state["max_range"] = 1000
+        asyncio.run(scan(1000, 1000 + 250 * 8 * 3))
+        assert scanner.chunk_size == 1000
+
+        state["rate_limited"] = True
+        with pytest.raises(RuntimeError, match="429"):
+            asyncio.run(scan(0, 5000))
+        assert scanner.chunk_size == 1000
+
+    def test_checkpoint_written_atomically(
+        self, generator_config, sample_parsed_abi, sample_tools, sample_resources, tmp_path
+    ):
+        """Checkpoints go through a unique temporary file in the same directory."""
+        namespace = self._scanner_namespace(
+            generator_config, sample_parsed_abi, sample_tools, sample_resources
+        )
+        scanner = namespace["EventScanner"](1000, 1, str(tmp_path), 0, 100)
+        events = [{"block_number": 5, "log_index": 0}]
+
+        scanner._save_checkpoint("0xabc", "Transfer", 0, 10, events)
+        scanner._save_checkpoint("0xabc", "Transfer", 0, 12, events)
+
+        assert os.listdir(tmp_path) == ["0xabc_Transfer.json"]
+        assert scanner._load_checkpoint("0xabc", "Transfer")["to_block"] == 12
+
+    def test_no_scanner_without_events(
+        self, generator_config, sample_parsed_abi, sample_tools, sample_resources
+    ):
+        """Servers without event tools do not include the scanner."""
+        generator_config.include_events = False
+        files = self._generate(generator_config, sample_parsed_abi, sample_tools, sample_resources)
+
+        compile(files["server.py"], "server.py", "exec")
+        assert "EventScanner" not in files["server.py"]
+        assert "EVENT_CHUNK_SIZE" not in files[".env.example"]
+
+
+class TestEventIndex:
+    """Tests for the optional SQLite event index."""
+
+    def _generate(self, config, parsed, tools, resources):
+        result = ServerGenerator(config).generate(
+            parsed=parsed,
+            tools=tools,
+            resources=resources,
+            contract_address="0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
+            network="mainnet",
+        )
+        return {f.path: f.content for f in result.files}
+
+    def test_disabled_by_default(
+        self, generator_config, sample_parsed_abi, sample_tools, sample_resources
+    ):
+        """Without event_index, event tools scan the chain directly."""
+        files = self._generate(generator_config, sample_parsed_abi, sample_tools, sample_resources)
+
+        assert "EventIndex" not in files["server.py"]
+        assert "import sqlite3" not in files["server.py"]
+        assert "EVENT_INDEX_PATH" not in files[".env.example"]
+
+    def test_enabled(self, generator_config, sample_parsed_abi, sample_tools, sample_resources):
+        """Event tools query the index with filters on indexed fields."""
+        generator_config.event_index = True
+        generator_config.event_index_start_block = 6082465
+        files = self._generate(generator_config, sample_parsed_abi, sample_tools, sample_resources)
+        server_py = files["server.py"]
+
+        compile(server_py, "server.py", "exec")
+        assert "import sqlite3" in server_py
+        assert "class EventIndex" in server_py
+        assert 'os.environ.get("EVENT_INDEX_START_BLOCK", "6082465")' in server_py
+        assert "from_address: Optional[str] = None," in server_py
+        assert "to: Optional[str] = None," in server_py
+        assert "value: Optional" not in server_py
+        assert '"from_address": "from",' in server_py
+        assert "_event_index.query(" in server_py
+        assert "def get_index_status()" in server_py
+        assert "_event_scanner.query(" not in server_py
+        assert "await mcp.run_stdio_async()" in server_py
+        assert "EVENT_INDEX_REORG_DEPTH" in files[".env.example"]
+        assert "get_index_status" in files["README.md"]
+
+    def test_one_log_request_per_chunk(
+        self, generator_config, sample_parsed_abi, sample_tools, sample_resources, tmp_path
+    ):
+        """All events share one address-wide get_logs per chunk, dispatched by topic0."""
+        web3 = pytest.importorskip("web3")
+        from eth_utils import event_abi_to_log_topic
+        from hexbytes import HexBytes
+        from web3.datastructures import AttributeDict
+
+        generator_config.event_index = True
+        server_py = self._generate(
+            generator_config, sample_parsed_abi, sample_tools, sample_resources
+        )["server.py"]
+        code = server_py[server_py.index("# Substrings of provider errors") : server_py.index("_event_index = ")]
+
+        def event_abi(name, *arguments):
+            return {
+                "type": "event", "name": name, "anonymous": False,
+                "inputs": [
+                    {"name": arguments[0], "type": "address", "indexed": True},
+                    {"name": arguments[1], "type": "address", "indexed": True},
+                    {"name": "value", "type": "uint256", "indexed": False},
+                ],
+            }
+
+        transfer, approval = event_abi("Transfer", "from", "to"), event_abi("Approval", "owner", "spender")
+        address = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
+        calls = []
+
+        def get_logs(params):
+            calls.append(params)
+            logs = []
+            for block in range(-(-params["fromBlock"] // 10) * 10, params["toBlock"] + 1, 10):
+                for index, abi in enumerate((transfer, approval)):
+                    logs.append(AttributeDict({
+                        "address": address,
+                        "topics": [
+                            HexBytes(event_abi_to_log_topic(abi)),
+                            HexBytes(b"\0" * 12 + b"\x11" * 20),
+                            HexBytes(b"\0" * 12 + b"\x22" * 20),
+                        ],
+                        "data": HexBytes(block.to_bytes(32, "big")),
+                        "blockNumber": block, "logIndex": index, "transactionIndex": 0,
+                        "transactionHash": HexBytes(b"\x33" * 32),
+                        "blockHash": HexBytes(b"\x44" * 32), "removed": False,
+                    }))
+            return logs
+
+        w3 = MagicMock()
+        w3.eth.get_logs = get_logs
+        w3.eth.get_block = lambda block: {"number": 99, "hash": b"\x55" * 32}
+
+        async def _rpc(fn, *args, **kwargs):
+            return fn(*args, **kwargs)
+
+        namespace = {
+            "asyncio": asyncio, "json": json, "os": os, "tempfile": tempfile, "sqlite3": sqlite3,
+            "Any": Any, "Dict": Dict, "List": List, "Optional": Optional,
+            "Web3": web3.Web3, "WEB3_VERSION": "7.0.0", "w3": w3, "_rpc": _rpc,
+            "event_abi_to_log_topic": event_abi_to_log_topic,
+            "contract": web3.Web3().eth.contract(address=address, abi=[transfer, approval]),
+            "EVENT_CHUNK_SIZE": 25, "EVENT_SCAN_CONCURRENCY": 2, "EVENT_CHECKPOINT_DIR": "",
+            "EVENT_CONFIRMATIONS": 0, "EVENT_CHECKPOINT_MAX_EVENTS": 100,
+        }
+        exec(code, namespace)
+        index = namespace["EventIndex"](str(tmp_path / "events.db"), 0, 1, 4)
+
+        asyncio.run(index.sync())
+
+        assert [(c["fromBlock"], c["toBlock"]) for c in calls] == [(0, 24), (25, 49), (50, 74), (75, 99)]
+        assert calls[0]["topics"] == [[web3.Web3.to_hex(event_abi_to_log_topic(transfer))]]
+        result = index.query("Transfer", {"from_address": "0x" + "11" * 20}, ascending=True)
+        assert [e["value"] for e in result["events"]] == list(range(0, 100, 10))
+        assert result["indexed_to_block"] == 99
+
+    def test_ignored_without_events(
+        self, generator_config, sample_parsed_abi, sample_tools, sample_resources
+    ):
+        """No index is generated when event tools are excluded."""
+        generator_config.event_index = True
+        generator_config.include_events = False
+        files = self._generate(generator_config, sample_parsed_abi, sample_tools, sample_resources)
+
+        compile(files["server.py"], "server.py", "exec")
+        assert "EventIndex" not in files["server.py"]
+        assert "mcp.run()" in files["server.py"]
+
+
+class TestNoncesAndFees:
+    """Tests for the shared nonce allocator and per-block gas price."""
+
+    def _generate(self, config, parsed, tools, resources):
+        result = ServerGenerator(config).generate(
+            parsed=parsed,
+            tools=tools,
+            resources=resources,
+            contract_address="0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
+            network="mainnet",
+        )
+        return {f.path: f.content for f in result.files}
+
+    def test_write_tools_use_allocator(
+        self, generator_config, sample_parsed_abi, sample_tools, sample_resources
+    ):
+        """Write tools take nonces and fees from the shared helpers."""
+        files = self._generate(generator_config, sample_parsed_abi, sample_tools, sample_resources)
+        server_py = files["server.py"]
+
+        compile(server_py, "server.py", "exec")
+        assert "class NonceManager" in server_py
+        assert "class FeeCache" in server_py
+        assert 'get_transaction_count, address, "pending"' in server_py
+        assert 'tx_params["nonce"] = await _nonces.allocate(signer.address)' in server_py
+        assert 'tx_params["nonce"] = await _nonces.peek(signer.address)' in server_py
+        assert "_nonces.reset(signer.address)" in server_py
+        assert "await asyncio.gather(_fees.gas_price(), _get_chain_id())" in server_py
+        assert "get_transaction_count, signer.address" not in server_py
+        assert "FEE_CACHE_BLOCK_INTERVAL" in files[".env.example"]
+
+    def test_read_only_has_no_allocator(
+        self, generator_config, sample_parsed_abi, sample_tools, sample_resources
+    ):
+        """Read-only servers do not include the transaction helpers."""
+        generator_config.read_only = True
+        files = self._generate(generator_config, sample_parsed_abi, sample_tools, sample_resources)
+
+        compile(files["server.py"], "server.py", "exec")
+        assert "NonceManager" not in files["server.py"]
+        assert "FEE_CACHE_BLOCK_INTERVAL" not in files[".env.example"]
+
+
+class TestReceiptTracking:
+    """Tests for background receipt polling."""
+
+    def _generate(self, config, parsed, tools, resources):
+        result = ServerGenerator(config).generate(
+            parsed=parsed,
+            tools=tools,
+            resources=resources,
+            contract_address="0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
+            network="mainnet",
+        )
+        return {f.path: f.content for f in result.files}
+
+    def test_write_tools_track_receipts(
+        self, generator_config, sample_parsed_abi, sample_tools, sample_resources
+    ):
+        """Executed writes are tracked instead of blocking on the receipt."""
+        files = self._generate(generator_config, sample_parsed_abi, sample_tools, sample_resources)
+        server_py = files["server.py"]
+
+        compile(server_py, "server.py", "exec")
+        assert "class ReceiptTracker" in server_py
+        assert "wait_for_transaction_receipt" not in server_py
+        assert "wait: bool = True," in server_py
+        assert "confirmations: int = 1" in server_py
+        assert '_receipts.track(tx_hash, signer.address, tx["nonce"])' in server_py
+        assert "await _receipts.wait(tx_hash, confirmations, TX_TIMEOUT)" in server_py
+        assert "make_batch_request" in server_py
+        assert "async def get_transaction_status(tx_hash: str)" in server_py
+        assert "TX_POLL_INTERVAL" in files[".env.example"]
+        assert "TX_MAX_PENDING_AGE" in files[".env.example"]
+
+    def test_replaced_and_dropped_stop_polling(
+        self, generator_config, sample_parsed_abi, sample_tools, sample_resources
+    ):
+        """Unmined transactions are marked replaced or dropped and no longer polled."""
+        import time
+
+        server_py = self._generate(
+            generator_config, sample_parsed_abi, sample_tools, sample_resources
+        )["server.py"]
+        code = server_py[server_py.index("async def _fetch_receipts") : server_py.index("_receipts = ")]
+        sender = "0x" + "11" * 20
+        w3 = MagicMock()
+        w3.provider.make_batch_request = lambda requests: [{"result": None} for _ in requests]
+        w3.eth.block_number = 100
+        w3.eth.get_transaction_count = lambda address, block: 6
+
+        async def _rpc(fn, *args, **kwargs):
+            return fn(*args, **kwargs)
+
+        namespace = {
+            "asyncio": asyncio, "time": time, "w3": w3, "_rpc": _rpc,
+            "Any": Any, "Dict": Dict, "List": List, "Optional": Optional,
+        }
+        exec(code, namespace)
+
+        async def run():
+            tracker = namespace["ReceiptTracker"](0.01, max_pending_age=60)
+            tracker.track("0xreplaced", sender, 5)
+            tracker.track("0xold", sender, 6)
+            tracker.track("0xnew", sender, 7)
+            tracker._records["0xold"]["submitted_at"] -= 120
+            tracker._records["0xnew"]["submitted_at"] -= 120
+            waited = await tracker.wait("0xold", 1, timeout=1)
+            return tracker, waited
+
+        tracker, waited = asyncio.run(run())
+
+        assert tracker._records["0xreplaced"]["status"] == "replaced"
+        assert waited["status"] == "dropped"
+        assert tracker._records["0xnew"]["status"] == "dropped"
+        assert tracker._awaited() == []
+
+    def test_async_provider_batches_with_pool(
+        self, generator_config, sample_parsed_abi, sample_tools, sample_resources
+    ):
+        """The pooled async provider also opens its session for batches."""
+        generator_config.async_runtime = True
+        files = self._generate(generator_config, sample_parsed_abi, sample_tools, sample_resources)
+
+        compile(files["server.py"], "server.py", "exec")
+        assert "async def make_batch_request(self, requests):" in files["server.py"]
+
+    def test_read_only_has_no_tracker(
+        self, generator_config, sample_parsed_abi, sample_tools, sample_resources
+    ):
+        """Read-only servers do not include receipt tracking."""
+        generator_config.read_only = True
+        files = self._generate(generator_config, sample_parsed_abi, sample_tools, sample_resources)
+
+        assert "ReceiptTracker" not in files["server.py"]
+        assert "get_transaction_status" not in files["server.py"]
+
+
+class TestLazyStartup:
+    """Tests for fast server startup."""
+
+    def _generate(self, config, parsed, tools, resources):
+        result = ServerGenerator(config).generate(
+            parsed=parsed,
+            tools=tools,
+            resources=resources,
+            contract_address="0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
+            network="mainnet",
+        )
+        return {f.path: f.content for f in result.files}
+
+    def test_abi_sidecar(self, generator_config, sample_parsed_abi, sample_tools, sample_resources):
+        """The ABI is written minified to abi.json instead of embedded."""
+        files = self._generate(generator_config, sample_parsed_abi, sample_tools, sample_resources)
+
+        assert json.loads(files["abi.json"]) == sample_parsed_abi.raw_abi
+        assert "\n" not in files["abi.json"].strip()
+        assert ": " not in files["abi.json"]
+        assert "ABI = json.loads" not in files["server.py"]
+
+    def test_w3_and_contract_are_lazy(
+        self, generator_config, sample_parsed_abi, sample_tools, sample_resources
+    ):
+        """Provider, ABI and contract are built on first use."""
+        generator_config.multicall = True
+        for async_runtime in (False, True):
+            generator_config.async_runtime = async_runtime
+            server_py = self._generate(
+                generator_config, sample_parsed_abi, sample_tools, sample_resources
+            )["server.py"]
+
+            compile(server_py, "server.py", "exec")
+            assert "class _Lazy:" in server_py
+            assert "w3 = _Lazy(lambda: " in server_py
+            assert "contract = _Lazy(_load_contract)" in server_py
+            assert "self.multicall = _Lazy(" in server_py
+
+
+class TestIncrementalGeneration:
+    """Tests for manifest-based incremental regeneration."""
+
+    ADDRESS = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
+
+    def _build(self, generator, parsed, tools, resources):
+        server = generator.generate(
+            parsed=parsed,
+            tools=tools,
+            resources=resources,
+            contract_address=self.ADDRESS,
+            network="mainnet",
+        )
+        generator.write_to_disk(server)
+        return server
+
+    def test_first_generation_writes_everything(
+        self, server_generator, sample_parsed_abi, sample_tools, sample_resources
+    ):
+        """Without a manifest every file is rendered and written."""
+        server = self._build(server_generator, sample_parsed_abi, sample_tools, sample_resources)
+
+        assert server.reused_files == []
+        assert server.written_files == [f.path for f in server.files]
+        assert server.changed_tools == [t.name for t in sample_tools]
+        assert (server_generator.config.output_dir / ".abi-to-mcp-manifest.json").exists()
+
+    def test_unchanged_inputs_skip_render_and_write(
+        self, generator_config, sample_parsed_abi, sample_tools, sample_resources
+    ):
+        """Regenerating unchanged inputs renders and writes nothing."""
+        self._build(ServerGenerator(generator_config), sample_parsed_abi, sample_tools, sample_resources)
+
+        generator = ServerGenerator(generator_config)
+        generator.jinja_env.get_template = lambda name: pytest.fail(f"rendered {name}")
+        server = self._build(generator, sample_parsed_abi, sample_tools, sample_resources)
+
+        assert set(server.reused_files) == {"server.py", "config.py", "README.md", "pyproject.toml"}
+        assert server.written_files == []
+        assert server.changed_tools == []
+        assert "def balance_of" in server.get_file("server.py").content
+        assert server.get_file("server.py").is_executable
+
+    def test_changed_tool_is_reported(
+        self, server_generator, sample_parsed_abi, sample_tools, sample_resources
+    ):
+        """A changed tool re-renders the server and is reported."""
+        self._build(server_generator, sample_parsed_abi, sample_tools, sample_resources)
+        sample_tools[1].description = "Get the token balance of an account"
+
+        server = self._build(server_generator, sample_parsed_abi, sample_tools, sample_resources)
+
+        assert server.changed_tools == ["balance_of"]
+        assert "server.py" in server.written_files
+        assert "abi.json" not in server.written_files
+        content = (server_generator.config.output_dir / "server.py").read_text()
+        assert "Get the token balance of an account" in content
+
+    def test_removed_tool_is_reported(
+        self, server_generator, sample_parsed_abi, sample_tools, sample_resources
+    ):
+        """Tools missing from a regeneration are reported as removed."""
+        self._build(server_generator, sample_parsed_abi, sample_tools, sample_resources)
+
+        server = self._build(server_generator, sample_parsed_abi, sample_tools[:2], sample_resources)
+
+        assert server.removed_tools == ["transfer"]
+        assert server.changed_tools == []
+
+    def test_edited_file_is_regenerated(
+        self, server_generator, sample_parsed_abi, sample_tools, sample_resources
+    ):
+        """A file edited since generation is rendered and written again."""
+        server = self._build(server_generator, sample_parsed_abi, sample_tools, sample_resources)
+        path = server_generator.config.output_dir / "config.py"
+        path.write_text("# edited\n")
+
+        server = self._build(server_generator, sample_parsed_abi, sample_tools, sample_resources)
+
+        assert "config.py" not in server.reused_files
+        assert server.written_files == ["config.py"]
+        assert path.read_text() == server.get_file("config.py").content
+
+    def test_stale_files_are_removed(
+        self, server_generator, sample_parsed_abi, sample_tools, sample_resources
+    ):
+        """Files no longer generated are deleted, along with empty directories."""
+        output = server_generator.config.output_dir
+        server = server_generator.generate(
+            parsed=sample_parsed_abi,
+            tools=sample_tools,
+            resources=sample_resources,
+            contract_address=self.ADDRESS,
+            network="mainnet",
+        )
+        server.files += [
+            GeneratedFile(path="abis/old.json", content="[]"),
+            GeneratedFile(path="notes.txt", content="generated"),
+        ]
+        server_generator.write_to_disk(server)
+        (output / "notes.txt").write_text("edited by hand")
+
+        server = self._build(server_generator, sample_parsed_abi, sample_tools, sample_resources)
+
+        assert server.removed_files == ["abis/old.json"]
+        assert not (output / "abis").exists()
+        assert (output / "notes.txt").read_text() == "edited by hand"
+        assert (output / "abi.json").exists()
+
+    def test_template_change_invalidates(
+        self, server_generator, sample_parsed_abi, sample_tools, sample_resources
+    ):
+        """Files are rendered again when the templates change."""
+        self._build(server_generator, sample_parsed_abi, sample_tools, sample_resources)
+        server_generator._templates_digest = "changed"
+
+        server = self._build(server_generator, sample_parsed_abi, sample_tools, sample_resources)
+
+        assert server.reused_files == []
+        assert server.written_files == []
+
+    def test_incremental_disabled(
+        self, generator_config, sample_parsed_abi, sample_tools, sample_resources
+    ):
+        """With incremental off every file is rendered."""
+        self._build(ServerGenerator(generator_config), sample_parsed_abi, sample_tools, sample_resources)
+        generator_config.incremental = False
+
+        server = self._build(
+            ServerGenerator(generator_config), sample_parsed_abi, sample_tools, sample_resources
+        )
+
+        assert server.reused_files == []
+        assert server.changed_tools == [t.name for t in sample_tools]
+
+
+class TestProtocolServer:
+    """Tests for multi-contract protocol servers."""
+
+    def _contracts(self, parsed, tools, resources):
+        return [
+            ProtocolContract(
+                name="USDC",
+                address="0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
+                parsed=parsed,
+                tools=tools,
+                resources=resources,
+            ),
+            ProtocolContract(
+                name="DAI",
+                address="0x6B175474E89094C44Da98b954EedeAC495271d0F",
+                parsed=parsed,
+                tools=tools,
+                resources=resources,
+            ),
+        ]
+
+    def _generate(self, config, parsed, tools, resources):
+        return ServerGenerator(config).generate_protocol(
+            self._contracts(parsed, tools, resources), "mainnet", "Stablecoins"
+        )
+
+    def test_generate_protocol_server(
+        self, generator_config, sample_parsed_abi, sample_tools, sample_resources
+    ):
+        """Every contract gets its ABI file and namespaced tools."""
+        server = self._generate(generator_config, sample_parsed_abi, sample_tools, sample_resources)
+        files = {f.path: f.content for f in server.files}
+
+        assert server.server_name == "Stablecoins MCP Server"
+        assert server.contracts == {
+            "usdc": "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
+            "dai": "0x6B175474E89094C44Da98b954EedeAC495271d0F",
+        }
+        assert server.tool_count == 2 * len(sample_tools)
+        assert json.loads(files["abis/usdc.json"]) == sample_parsed_abi.raw_abi
+        assert "abis/dai.json" in files
+        assert "abi.json" not in files
+        assert "USDC_ADDRESS=" in files[".env.example"]
+        assert "DAI_ADDRESS=" in files[".env.example"]
+
+    def test_server_py(self, generator_config, sample_parsed_abi, sample_tools, sample_resources):
+        """Contracts are loaded lazily and share one batch_read."""
+        generator_config.multicall = True
+        server = self._generate(generator_config, sample_parsed_abi, sample_tools, sample_resources)
+        server_py = server.get_file("server.py").content
+
+        compile(server_py, "server.py", "exec")
+        assert 'usdc_contract = _Lazy(lambda: _load_contract("usdc", USDC_ADDRESS))' in server_py
+        assert 'dai_contract = _Lazy(lambda: _load_contract("dai", DAI_ADDRESS))' in server_py
+        assert "def usdc_balance_of(" in server_py
+        assert "def dai_transfer(" in server_py
+        assert "[USDC]" in server_py
+        assert '"dai_balance_of": (dai_contract, "balanceOf"),' in server_py
+        assert "def batch_read(" in server_py
+        assert server_py.count("w3 = _Lazy(") == 1
+
+    def test_event_tools_target_their_contract(
+        self, generator_config, sample_parsed_abi, sample_tools, sample_resources
+    ):
+        """Event tools scan their own contract; the event index is not used."""
+        generator_config.event_index = True
+        server = self._generate(generator_config, sample_parsed_abi, sample_tools, sample_resources)
+        server_py = server.get_file("server.py").content
+
+        assert "def usdc_get_transfer_events(" in server_py
+        assert "from_block, to_block, dai_contract" in server_py
+        assert "_event_index" not in server_py
+        assert "events://dai/transfer" in server.get_file("README.md").content
+
+    def test_read_only(self, generator_config, sample_parsed_abi, sample_tools, sample_resources):
+        """Read-only protocol servers have no write tools."""
+        generator_config.read_only = True
+        server = self._generate(generator_config, sample_parsed_abi, sample_tools, sample_resources)
+        server_py = server.get_file("server.py").content
+
+        compile(server_py, "server.py", "exec")
+        assert "def usdc_transfer(" not in server_py
+        assert "def dai_balance_of(" in server_py
+
+    def test_async_runtime(
+        self, generator_config, sample_parsed_abi, sample_tools, sample_resources
+    ):
+        """Protocol servers also render for the async runtime."""
+        generator_config.async_runtime = True
+        generator_config.multicall = True
+        server = self._generate(generator_config, sample_parsed_abi, sample_tools, sample_resources)
+
+        compile(server.get_file("server.py").content, "server.py", "exec")
+
+    def test_duplicate_names_rejected(
+        self, generator_config, sample_parsed_abi, sample_tools, sample_resources
+    ):
+        """Contracts whose names clash are rejected."""
+        contracts = self._contracts(sample_parsed_abi, sample_tools, sample_resources)
+        contracts[1].name = "usdc"
+
+        with pytest.raises(GeneratorError, match="unique"):
+            ServerGenerator(generator_config).generate_protocol(contracts, "mainnet")
+
+    def test_no_contracts_rejected(self, generator_config):
+        """A protocol server needs at least one contract."""
+        with pytest.raises(GeneratorError):
+            ServerGenerator(generator_config).generate_protocol([], "mainnet")
@@ -240,6 +240,26 @@ class TestEventMapperEdgeCases:
         assert result[0]["type"] == "tuple"
         assert result[0]["components"] == [{"name": "value", "type": "uint256"}]
 
+    def test_components_to_dicts_keeps_internal_type(self):
+        """Struct names in internalType are passed on to the type mapper."""
+        from abi_to_mcp.mapper.event_mapper import EventMapper
+        from abi_to_mcp.mapper.type_mapper import TypeMapper
+        from abi_to_mcp.core.models import ABIParameter
+
+        mapper = EventMapper(TypeMapper())
+        components = [
+            ABIParameter(
+                name="key",
+                type="tuple",
+                internal_type="struct Pool.Key",
+                components=[ABIParameter(name="id", type="uint256")],
+            ),
+        ]
+
+        result = mapper._components_to_dicts(components)
+        assert result[0]["internalType"] == "struct Pool.Key"
+        assert "internalType" not in result[0]["components"][0]
+
 
 class TestFunctionMapperEdgeCases:
     """Test edge cases in function mapper."""
@@ -401,6 +421,22 @@ class TestSchemaBuilderEdgeCases:
         assert "inputSchema" in schema
         assert "param1" in schema["inputSchema"]["properties"]
         assert "param2" in schema["inputSchema"]["properties"]
+
+    def test_build_tool_schema_with_defs(self):
+        """Struct definitions are placed under $defs of the input schema."""
+        from abi_to_mcp.mapper.schema_builder import build_tool_schema
+
+        defs = {"Order": {"type": "object"}}
+        schema = build_tool_schema(
+            name="fill",
+            description="Fill an order",
+            parameters=[{"name": "order", "schema": {"$ref": "#/$defs/Order"}}],
+            required=["order"],
+            defs=defs,
+        )
+
+        assert schema["inputSchema"]["$defs"] == defs
+        assert "$defs" not in build_tool_schema("t", "d", [], [])["inputSchema"]
 """Tests for edge cases in function and event mapping.
 
 This module contains tests for edge cases in the FunctionMapper and
@@ -609,6 +645,41 @@ class TestFunctionMapperEdgeCases:
         param_schema = tool.parameters[0].json_schema
         assert param_schema.get("type") == "object"
 
+    def test_repeated_struct_shared_in_input_schema(self, mapper):
+        """A struct used by several parameters is defined once in input_schema."""
+        order = [
+            ABIParameter(name="maker", type="address"),
+            ABIParameter(name="amount", type="uint256"),
+        ]
+        func = ABIFunction(
+            name="matchOrders",
+            inputs=[
+                ABIParameter(
+                    name="buy", type="tuple", components=order, internal_type="struct Order"
+                ),
+                ABIParameter(
+                    name="sells", type="tuple[]", components=order, internal_type="struct Order[]"
+                ),
+            ],
+            outputs=[
+                ABIParameter(
+                    name="filled", type="tuple", components=order, internal_type="struct Order"
+                )
+            ],
+            state_mutability=StateMutability.NONPAYABLE,
+        )
+
+        tool = mapper.map_function(func)
+
+        schema = tool.input_schema
+        assert list(schema["$defs"]) == ["Order"]
+        assert schema["properties"]["buy"] == {"$ref": "#/$defs/Order"}
+        assert schema["properties"]["sells"]["items"] == {"$ref": "#/$defs/Order"}
+        assert schema["required"] == ["buy", "sells"]
+        # Parameter and return schemas stay self-contained
+        assert tool.parameters[0].json_schema["type"] == "object"
+        assert tool.return_schema["properties"].keys() == {"maker", "amount"}
+
     def test_function_with_array_parameter(self, mapper):
         """Functions with array parameters should generate array schemas."""
         func = ABIFunction(
@@ -825,6 +896,29 @@ class TestEventMapperEdgeCases:
         config_field = next(f for f in resource.fields if f.original_name == "config")
         assert config_field.json_schema.get("type") == "object"
 
+    def test_event_schema_shares_structs(self, mapper):
+        """Structs repeated across event fields are defined once."""
+        config = [ABIParameter(name="fee", type="uint256")]
+        event = ABIEvent(
+            name="ConfigChanged",
+            inputs=[
+                ABIParameter(
+                    name="oldConfig", type="tuple", components=config, internal_type="struct Config"
+                ),
+                ABIParameter(
+                    name="newConfig", type="tuple", components=config, internal_type="struct Config"
+                ),
+            ],
+            anonymous=False,
+        )
+
+        schema = mapper.map_event(event).event_schema
+
+        assert schema["title"] == "ConfigChanged"
+        assert list(schema["$defs"]) == ["Config"]
+        assert schema["properties"]["old_config"] == {"$ref": "#/$defs/Config"}
+        assert schema["properties"]["new_config"] == {"$ref": "#/$defs/Config"}
+
 
 class TestSnakeCaseConversion:
     """Test snake_case conversion edge cases."""
@@ -1,8 +1,12 @@
 """Tests for type mapper module."""
 
+import copy
+import json
+import pickle
+
 import pytest
 
-from abi_to_mcp.mapper.type_mapper import TypeMapper
+from abi_to_mcp.mapper.type_mapper import SolidityType, TypeMapper
 
 
 def test_parse_basic_types():
@@ -146,9 +150,6 @@ def test_map_function_outputs_no_outputs():
     schema = mapper.map_function_outputs([])
     
     assert schema["type"] == "null"
-"""Full coverage tests for TypeMapper."""
-
-from abi_to_mcp.mapper.type_mapper import SolidityType
 
 
 class TestTypeMapperFullCoverage:
@@ -426,9 +427,6 @@ class TestTypeMapperEdgeCases:
         assert schema["type"] == "object"
         assert "items" in schema["properties"]
         assert "count" in schema["properties"]
-"""Additional type mapper tests for full coverage."""
-
-import pytest
 
 
 class TestTypeMapperMethodCoverage:
@@ -583,3 +581,141 @@ class TestTypeMapperMethodCoverage:
         )
         
         assert schema["description"] == "The recipient of the transfer"
+
+
+class TestTypeMapperCaching:
+    """Tests for memoized parsing and shared schemas."""
+
+    ORDER = [
+        {"name": "maker", "type": "address"},
+        {"name": "amount", "type": "uint256"},
+    ]
+
+    @pytest.fixture
+    def mapper(self):
+        return TypeMapper()
+
+    def test_parsed_types_are_shared(self, mapper):
+        """Parsing the same type again returns the same object."""
+        first = mapper.parse_type("tuple", components=self.ORDER)
+        other_mapper = TypeMapper()
+
+        assert mapper.parse_type("uint") is mapper.parse_type("uint")
+        assert other_mapper.parse_type("tuple", components=[dict(c) for c in self.ORDER]) is first
+
+    def test_irrelevant_component_keys_are_ignored(self, mapper):
+        """Components differing only in unused keys parse to the same type."""
+        indexed = [dict(c, indexed=False) for c in self.ORDER]
+
+        assert mapper.parse_type("tuple", indexed) is mapper.parse_type("tuple", self.ORDER)
+
+    def test_solidity_type_is_immutable(self, mapper):
+        """Shared types cannot be modified."""
+        import dataclasses
+
+        parsed = mapper.parse_type("tuple", components=self.ORDER)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            parsed.base_type = "address"
+        assert isinstance(parsed.tuple_components, tuple)
+        assert hash(SolidityType(base_type="tuple", tuple_names=["a"])) is not None
+
+    def test_struct_name_from_internal_type(self, mapper):
+        """The struct name is taken from the internalType."""
+        parsed = mapper.parse_type("tuple[]", self.ORDER, internal_type="struct Exchange.Order[]")
+
+        assert parsed.struct_name == "Exchange.Order"
+        assert mapper.parse_type("tuple", self.ORDER).struct_name is None
+
+    def test_returned_schema_can_be_modified(self, mapper):
+        """Changing a returned schema does not change later results."""
+        schema = mapper.to_json_schema(mapper.parse_type("address"), "owner")
+        original = dict(schema)
+        schema["description"] = "changed"
+
+        assert mapper.to_json_schema(mapper.parse_type("address"), "owner") == original
+
+    def test_nested_schema_fragments_are_read_only(self, mapper):
+        """Nested parts are shared, so changing them fails instead of leaking."""
+        array = mapper.to_json_schema(mapper.parse_type("uint256[]"))
+        struct = mapper.to_json_schema(mapper.parse_type("tuple", self.ORDER))
+
+        with pytest.raises(TypeError):
+            array["items"]["type"] = "integer"
+        with pytest.raises(TypeError):
+            struct["properties"]["maker"]["pattern"] = "changed"
+        with pytest.raises(TypeError):
+            struct["required"].append("extra")
+
+        fresh = mapper.to_json_schema(mapper.parse_type("tuple", self.ORDER))
+        assert fresh["required"] == ["maker", "amount"]
+        assert json.loads(json.dumps(fresh)) == fresh
+
+    def test_deep_copied_schema_can_be_modified(self, mapper):
+        """A deep copy is fully mutable and does not change later results."""
+        schema = copy.deepcopy(mapper.to_json_schema(mapper.parse_type("tuple", self.ORDER)))
+        schema["properties"]["maker"]["pattern"] = "changed"
+        schema["required"].append("extra")
+
+        fresh = mapper.to_json_schema(mapper.parse_type("tuple", self.ORDER))
+        assert fresh["properties"]["maker"]["pattern"] != "changed"
+        assert fresh["required"] == ["maker", "amount"]
+
+    def test_schema_can_be_pickled(self, mapper):
+        """Schemas survive pickling (e.g. to worker processes)."""
+        schema = mapper.to_json_schema(mapper.parse_type("tuple[2]", self.ORDER))
+
+        assert pickle.loads(pickle.dumps(schema)) == schema
+
+    def test_multi_dimensional_tuple_array(self, mapper):
+        """Arrays of arrays of structs keep their components."""
+        schema = mapper.to_json_schema(mapper.parse_type("tuple[][2]", self.ORDER))
+
+        assert schema["maxItems"] == 2
+        assert schema["items"]["type"] == "array"
+        assert schema["items"]["items"]["properties"].keys() == {"maker", "amount"}
+        assert mapper.to_python_type(mapper.parse_type("tuple[][]", self.ORDER)) == (
+            "List[List[Dict[str, Any]]]"
+        )
+
+    def test_repeated_struct_defined_once(self, mapper):
+        """With defs, a struct used several times is referenced."""
+        order = {"type": "tuple", "components": self.ORDER, "internalType": "struct Order"}
+        params = [
+            dict(order, name="buy"),
+            dict(order, name="sells", type="tuple[]", internalType="struct Order[]"),
+        ]
+        defs = {}
+
+        properties, _ = mapper.map_function_params(params, defs=defs)
+
+        assert list(defs) == ["Order"]
+        assert properties["buy"] == {"$ref": "#/$defs/Order"}
+        assert properties["sells"]["items"] == {"$ref": "#/$defs/Order"}
+        assert defs["Order"]["properties"]["amount"]["type"] == "string"
+
+    def test_different_structs_with_same_name(self, mapper):
+        """Distinct structs sharing a name get distinct definitions."""
+        defs = {}
+        first = mapper.to_json_schema(mapper.parse_type("tuple", self.ORDER), defs=defs)
+        second = mapper.to_json_schema(
+            mapper.parse_type("tuple", [{"name": "id", "type": "uint8"}]), defs=defs
+        )
+
+        assert first == {"$ref": "#/$defs/Tuple"}
+        assert second == {"$ref": "#/$defs/Tuple_2"}
+
+    def test_nested_struct_in_defs(self, mapper):
+        """Structs nested in structs are referenced too."""
+        outer = [
+            {"name": "order", "type": "tuple", "components": self.ORDER, "internalType": "struct Order"},
+            {"name": "fee", "type": "uint256"},
+        ]
+        defs = {}
+
+        schema = mapper.to_json_schema(
+            mapper.parse_type("tuple", outer, internal_type="struct Fill"), defs=defs
+        )
+
+        assert schema == {"$ref": "#/$defs/Fill"}
+        assert defs["Fill"]["properties"]["order"] == {"$ref": "#/$defs/Order"}
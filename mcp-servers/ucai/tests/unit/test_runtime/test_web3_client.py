@@ -212,10 +212,13 @@ class TestWeb3ClientW3Property:
             mock_web3_class.return_value = mock_w3
             mock_web3_class.HTTPProvider.return_value = Mock()
             
-            client = Web3Client(rpc_url="https://test.example.com", network="mainnet")
+            client = Web3Client(
+                rpc_url="https://test.example.com", network="mainnet", validate_connection=True
+            )
             
             with pytest.raises(NetworkError, match="Failed to connect"):
                 _ = client.w3
+            assert client._w3 is None
     
     def test_w3_property_exception_during_init(self):
         """Test w3 property when exception occurs during initialization."""
@@ -494,3 +497,76 @@ class TestWeb3ClientMethods:
         
         assert contract is mock_contract
         mock_w3.eth.contract.assert_called_once()
+
+
+class TestWeb3ClientLazyInit:
+    """Test that initialization makes no requests."""
+
+    def test_w3_makes_no_requests(self):
+        """Accessing w3 does not check the connection by default."""
+        from abi_to_mcp.runtime.web3_client import Web3Client
+
+        with patch("abi_to_mcp.runtime.web3_client.Web3") as mock_web3_class:
+            client = Web3Client(rpc_url="https://test.example.com", network="mainnet")
+            w3 = client.w3
+
+        assert w3 is mock_web3_class.return_value
+        w3.is_connected.assert_not_called()
+
+    def test_chain_id_from_network_config(self):
+        """Default endpoints take the chain ID from NETWORKS."""
+        from abi_to_mcp.runtime.web3_client import Web3Client
+
+        with patch.dict(os.environ, {}, clear=True):
+            client = Web3Client(network="polygon")
+        client._w3 = Mock()
+        type(client._w3.eth).chain_id = PropertyMock(side_effect=Exception("no RPC expected"))
+
+        assert client.get_chain_id() == 137
+
+    def test_chain_id_cached(self):
+        """Custom endpoints are asked for their chain ID once."""
+        from abi_to_mcp.runtime.web3_client import Web3Client
+
+        client = Web3Client(rpc_url="https://test.example.com", network="mainnet")
+        client._w3 = Mock()
+        chain_id = PropertyMock(return_value=31337)
+        type(client._w3.eth).chain_id = chain_id
+
+        assert client.get_chain_id() == 31337
+        assert client.get_chain_id() == 31337
+        assert chain_id.call_count == 1
+
+    def test_clients_share_session(self):
+        """Clients for the same URL share one HTTP session."""
+        from abi_to_mcp.runtime.web3_client import Web3Client
+
+        with patch("abi_to_mcp.runtime.web3_client.Web3") as mock_web3_class:
+            for url in ("https://shared.example.com", "https://shared.example.com", "https://other.example.com"):
+                assert Web3Client(rpc_url=url).w3 is mock_web3_class.return_value
+
+        first, second, other = [
+            c.kwargs["session"] for c in mock_web3_class.HTTPProvider.call_args_list
+        ]
+        assert first is second
+        assert first is not other
+
+
+class TestSessionPool:
+    """Test the process-wide session pool."""
+
+    def test_get_session_per_url(self):
+        """One session per RPC URL."""
+        from abi_to_mcp.runtime.sessions import get_session
+
+        assert get_session("https://a.example.com") is get_session("https://a.example.com")
+        assert get_session("https://a.example.com") is not get_session("https://b.example.com")
+
+    def test_close_sessions(self):
+        """Closed sessions are recreated on next use."""
+        from abi_to_mcp.runtime.sessions import get_session, close_sessions
+
+        session = get_session("https://a.example.com")
+        close_sessions()
+
+        assert get_session("https://a.example.com") is not session
@@ -0,0 +1,171 @@
+"""Tests for streaming JSON utilities."""
+
+import json
+
+import pytest
+
+from abi_to_mcp.utils.json_stream import (
+    JSONPathScanner,
+    JSONStreamDecoder,
+    aiter_json_items,
+    iter_json_items,
+    iter_json_paths,
+)
+
+
+def _chunks(text, size):
+    data = text.encode("utf-8")
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestIterJsonItems:
+    """Tests for iter_json_items."""
+
+    ARRAY = [
+        {"name": "A.sol", "content": 'contract A { string s = "a,]}\\\\"; }'},
+        [1, [2, {"x": []}]],
+        "plain, string ]",
+        42,
+        None,
+        {"unicode": "é ü 日本"},
+    ]
+
+    @pytest.mark.parametrize("size", [1, 3, 7, 64, 10_000])
+    def test_array_any_chunking(self, size):
+        """Items are recovered however the document is split."""
+        items = list(iter_json_items(_chunks(json.dumps(self.ARRAY, ensure_ascii=False), size)))
+
+        assert items == self.ARRAY
+
+    @pytest.mark.parametrize("size", [1, 5, 10_000])
+    def test_object_members(self, size):
+        """Objects yield (key, value) pairs."""
+        doc = {"abi": [{"type": "function"}], "bytecode": "0x6080", "meta": {"a": "}"}}
+
+        items = list(iter_json_items(_chunks(json.dumps(doc), size)))
+
+        assert items == list(doc.items())
+
+    def test_raw_items(self):
+        """decode=False returns raw JSON text for values."""
+        items = list(iter_json_items(['{"abi": [1, 2], "big": "xxxx"}'], decode=False))
+
+        assert items == [("abi", "[1, 2]"), ("big", '"xxxx"')]
+
+    def test_empty_containers(self):
+        """Empty arrays and objects yield nothing."""
+        assert list(iter_json_items(["[ ]"])) == []
+        assert list(iter_json_items(["{}"])) == []
+
+    def test_scalar_document_rejected(self):
+        """Only arrays and objects can be streamed."""
+        with pytest.raises(ValueError):
+            list(iter_json_items(['"just a string"']))
+
+    def test_buffer_stays_bounded(self):
+        """Completed items are dropped from the internal buffer."""
+        decoder = JSONStreamDecoder()
+        decoder.feed("[")
+        for i in range(100):
+            decoder.feed(json.dumps({"i": i, "pad": "x" * 100}) + ",")
+
+        assert len(decoder._buf) < 200
+
+    @pytest.mark.asyncio
+    async def test_async_iteration(self):
+        """aiter_json_items accepts async byte streams."""
+        async def stream():
+            for chunk in _chunks(json.dumps(self.ARRAY, ensure_ascii=False), 5):
+                yield chunk
+
+        items = [item async for item in aiter_json_items(stream())]
+
+        assert items == self.ARRAY
+
+
+class TestIterJsonPaths:
+    """Tests for iter_json_paths."""
+
+    DOC = {
+        "abi": [{"type": "event", "name": "Transfer"}],
+        "ast": {"abi": "nested, not matched", "src": 'a "quoted" }] value'},
+        "output": {
+            "contracts": {
+                "A.sol": {"A": {"abi": [1], "evm": {"abi": "skipped"}}},
+                "B.sol": {"B": {"abi": [], "metadata": "{}"}},
+            }
+        },
+        "name": "é",
+    }
+
+    @pytest.mark.parametrize("size", [1, 4, 13, 10_000])
+    def test_any_chunking(self, size):
+        """Selected values are found however the document is split."""
+        paths = [("abi",), ("name",), ("output", "contracts", "*", "*", "abi")]
+
+        found = list(iter_json_paths(_chunks(json.dumps(self.DOC, ensure_ascii=False), size), paths))
+
+        assert found == [
+            (("abi",), self.DOC["abi"]),
+            (("output", "contracts", "A.sol", "A", "abi"), [1]),
+            (("output", "contracts", "B.sol", "B", "abi"), []),
+            (("name",), "é"),
+        ]
+
+    def test_array_indices(self):
+        """Array elements are addressed by index or wildcard."""
+        doc = '{"abi": [{"name": "a"}, {"name": "b"}]}'
+
+        assert list(iter_json_paths([doc], [("abi", 1, "name")])) == [(("abi", 1, "name"), "b")]
+        assert [v for _, v in iter_json_paths([doc], [("abi", "*", "name")])] == ["a", "b"]
+
+    def test_raw_values(self):
+        """decode=False returns raw JSON text."""
+        found = list(iter_json_paths(['{"abi": [1, 2], "x": 3}'], [("abi",)], decode=False))
+
+        assert found == [(("abi",), "[1, 2]")]
+
+    def test_escaped_keys(self):
+        """Keys are compared after unescaping."""
+        found = list(iter_json_paths(['{"a\\"b": 1, "a\\u0062": 2}'], [("ab",)]))
+
+        assert found == [(("ab",), 2)]
+
+    def test_buffer_stays_bounded(self):
+        """Skipped values are not kept in the buffer."""
+        scanner = JSONPathScanner([("abi",)])
+        scanner.feed('{"bytecode": "')
+        for _ in range(100):
+            scanner.feed("60" * 500)
+        scanner.feed('", "ast": {')
+        for _ in range(100):
+            scanner.feed('"n": [{"abi": 1}],' * 20)
+
+        assert len(scanner._buf) < 1000
+        assert scanner.feed('"x": 0}, "abi": [1]}') == [(("abi",), "[1]")]
+        assert scanner.done
+
+    def test_open_string_not_rescanned(self):
+        """A string spanning chunks is resumed where the last chunk ended."""
+        scanner = JSONPathScanner([("name",)])
+        scanner.feed('{"bytecode": "0x')
+        for _ in range(100):
+            scanner.feed("60" * 500 + "\\")
+            assert scanner._pos <= 1
+            scanner.feed('"')
+
+        scanner.feed('", "name": "To')
+        scanner.feed('ken\\')
+        assert scanner.feed('"1"}') == [(("name",), '"Token\\"1"')]
+        assert scanner.done
+
+    @pytest.mark.parametrize("doc", ['{"abi": [1, }', '{"abi" [1]}', '{"a": tru}', '{"a": [1}'])
+    def test_invalid_json(self, doc):
+        """Malformed documents raise ValueError."""
+        with pytest.raises(ValueError):
+            list(iter_json_paths([doc], [("abi",)]))
+
+    def test_truncated_document(self):
+        """Documents that end early raise ValueError."""
+        with pytest.raises(ValueError, match="Unexpected end"):
+            list(iter_json_paths(['{"abi": [1, 2'], [("x",)]))